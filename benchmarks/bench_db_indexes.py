@@ -0,0 +1,128 @@
+"""
+Benchmark: hot database lookups before and after the index migrations
+
+Fills a temporary SQLite database with application rows, drops the
+migration indexes and the schema_version table (the layout of a database
+file from before the migrations), and times application_exists,
+get_applications_today and job_exists. It then runs the migrations in
+place and times the same lookups again.
+
+Usage:
+    python benchmarks/bench_db_indexes.py [--rows 1000000] [--lookups 200]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.database import Database
+from src.database.migrations import MIGRATIONS, migrate
+
+
+MIGRATION_INDEXES = [
+    'ix_applications_platform_job_id',
+    'ix_applications_applied_date',
+    'ix_jobs_platform_job_id',
+    'ix_apply_queue_platform_state',
+]
+
+
+def fill(db, rows, batch=50000):
+    """Insert rows applications (and a job per 10 applications) spread over the last year"""
+    now = datetime.utcnow()
+    with db.engine.begin() as connection:
+        for start in range(0, rows, batch):
+            count = min(batch, rows - start)
+            connection.exec_driver_sql(
+                "INSERT INTO applications (job_id, platform, applied_date, status, success) VALUES (?, ?, ?, ?, ?)",
+                [
+                    (f"job-{n}", 'dice' if n % 3 else 'indeed', now - timedelta(minutes=n % 525600), 'submitted', 1)
+                    for n in range(start, start + count)
+                ]
+            )
+            connection.exec_driver_sql(
+                "INSERT INTO jobs (platform, job_id, title, company, url) VALUES (?, ?, ?, ?, ?)",
+                [
+                    ('dice' if n % 3 else 'indeed', f"job-{n}", 'Python Developer', 'Acme Corp', f"https://example.com/{n}")
+                    for n in range(start, start + count, 10)
+                ]
+            )
+
+
+def downgrade(db):
+    """Remove what the migrations add, like a database file created before them"""
+    with db.engine.begin() as connection:
+        for name in MIGRATION_INDEXES:
+            connection.exec_driver_sql(f"DROP INDEX IF EXISTS {name}")
+        connection.exec_driver_sql("DROP TABLE IF EXISTS schema_version")
+
+
+def query_plan(db, sql, params):
+    with db.engine.connect() as connection:
+        rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+    return '; '.join(row[-1] for row in rows)
+
+
+def time_lookups(db, rows, lookups):
+    """Mean milliseconds per call of each hot lookup"""
+    rng = random.Random(42)
+    # Half the probes hit an existing row, half miss
+    job_ids = [f"job-{rng.randrange(rows * 2)}" for _ in range(lookups)]
+
+    results = {}
+    for name, call, calls in (
+        ('application_exists', lambda job_id: db.application_exists(job_id, 'dice'), lookups),
+        ('job_exists', lambda job_id: db.job_exists(job_id, 'dice'), lookups),
+        ('get_applications_today', lambda job_id: db.get_applications_today(), max(1, lookups // 100)),
+    ):
+        start = time.perf_counter()
+        for job_id in job_ids[:calls]:
+            call(job_id)
+        results[name] = (time.perf_counter() - start) * 1000 / calls
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark database lookups before/after the index migrations')
+    parser.add_argument('--rows', type=int, default=1000000, help='Application rows to insert')
+    parser.add_argument('--lookups', type=int, default=200, help='Timed lookups per query')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+
+        print(f"Inserting {args.rows:,} application rows...")
+        start = time.perf_counter()
+        fill(db, args.rows)
+        print(f"  {time.perf_counter() - start:.1f}s")
+
+        downgrade(db)
+        probe = ("SELECT id FROM applications WHERE job_id = ? AND platform = ? LIMIT 1", ('job-1', 'dice'))
+        before_plan = query_plan(db, *probe)
+        before = time_lookups(db, args.rows, args.lookups)
+
+        start = time.perf_counter()
+        applied = migrate(db.engine)
+        migrate_seconds = time.perf_counter() - start
+        after_plan = query_plan(db, *probe)
+        after = time_lookups(db, args.rows, args.lookups)
+
+    print(f"Migrations {applied} of {len(MIGRATIONS)} applied in place in {migrate_seconds:.1f}s")
+    print(f"application_exists plan before: {before_plan}")
+    print(f"application_exists plan after:  {after_plan}")
+    print()
+    print(f"{'lookup':26} {'before ms':>10} {'after ms':>10} {'speedup':>9}")
+    print('-' * 58)
+    for name in before:
+        speedup = before[name] / after[name] if after[name] else float('inf')
+        print(f"{name:26} {before[name]:>10.3f} {after[name]:>10.3f} {speedup:>8.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Benchmark: per-element job card extraction vs single-pass page_source parsing
+
+Loads saved Dice result pages into headless Chrome and times both extraction
+paths of DiceAdapter on the same DOM, counting WebDriver round-trips.
+
+Usage:
+    python benchmarks/bench_job_card_extraction.py [--cards 20] [--rounds 5]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lxml import html as lxml_html
+from selenium.webdriver.common.by import By
+
+from src.adapters import DiceAdapter
+from src.adapters.dice_parser import JOB_CARD_XPATH
+
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'fixtures', 'dice')
+
+
+def pad_page(page_path, cards):
+    """Repeat the fixture's cards (with unique data-ids) until the page holds `cards` of them"""
+    tree = lxml_html.parse(page_path)
+    originals = tree.xpath(JOB_CARD_XPATH)
+    if not originals or cards <= len(originals):
+        return lxml_html.tostring(tree, encoding='unicode')
+
+    parent = originals[0].getparent()
+    for idx in range(cards - len(originals)):
+        clone = lxml_html.fromstring(lxml_html.tostring(originals[idx % len(originals)]))
+        clone.set('data-id', f"{clone.get('data-id')}-copy{idx}")
+        parent.append(clone)
+    return lxml_html.tostring(tree, encoding='unicode')
+
+
+def count_rpcs(driver):
+    """Wrap driver.execute to count WebDriver commands"""
+    counter = {'calls': 0}
+    original = driver.execute
+
+    def execute(command, params=None):
+        counter['calls'] += 1
+        return original(command, params)
+
+    driver.execute = execute
+    return counter
+
+
+def per_element(adapter):
+    """Current path: find_elements + extract_job_details per card"""
+    jobs = []
+    for card in adapter.driver.find_elements(By.CSS_SELECTOR, "div[data-testid='job-card']"):
+        job = adapter.extract_job_details(card)
+        if job:
+            jobs.append(job)
+    return jobs
+
+
+def single_pass(adapter):
+    """New path: one page_source read parsed with lxml"""
+    return list(adapter.extract_jobs_from_source())
+
+
+def fields(jobs):
+    return [dict(job.to_mapping(), salary=job.salary) for job in jobs]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark Dice job card extraction')
+    parser.add_argument('--fixtures', default=FIXTURE_DIR, help='Directory of saved result pages')
+    parser.add_argument('--cards', type=int, default=20, help='Pad each page to this many cards')
+    parser.add_argument('--rounds', type=int, default=5, help='Timed rounds per page and path')
+    args = parser.parse_args()
+
+    pages = sorted(Path(args.fixtures).glob('search_results_*.html'))
+    if not pages:
+        print(f"No fixture pages found in {args.fixtures}")
+        sys.exit(1)
+
+    os.environ.setdefault('HEADLESS_MODE', 'true')
+    adapter = DiceAdapter({'platforms': {}}, db=None)
+    adapter.init_driver()
+    counter = count_rpcs(adapter.driver)
+
+    print(f"{'page':40} {'path':12} {'jobs':>5} {'rpcs':>6} {'ms/page':>9}")
+    print('-' * 76)
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            for page in pages:
+                padded = os.path.join(tmp, page.name)
+                with open(padded, 'w', encoding='utf-8') as f:
+                    f.write(pad_page(str(page), args.cards))
+                adapter.driver.get(Path(padded).as_uri())
+
+                results = {}
+                for name, extract in (('per-element', per_element), ('single-pass', single_pass)):
+                    extract(adapter)  # warm up
+                    counter['calls'] = 0
+                    start = time.perf_counter()
+                    for _ in range(args.rounds):
+                        jobs = extract(adapter)
+                    elapsed_ms = (time.perf_counter() - start) * 1000 / args.rounds
+                    rpcs = counter['calls'] // args.rounds
+                    results[name] = jobs
+                    print(f"{page.name:40} {name:12} {len(jobs):>5} {rpcs:>6} {elapsed_ms:>9.1f}")
+
+                if fields(results['per-element']) != fields(results['single-pass']):
+                    print(f"  ! field mismatch between paths on {page.name}")
+    finally:
+        del adapter.driver.execute
+        adapter.close_driver()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,8 @@
+"""
+Shared pytest setup: keep test runs from writing into the repo's logs/ directory
+"""
+
+import os
+import tempfile
+
+os.environ['LOG_DIR'] = tempfile.mkdtemp(prefix='jobider-test-logs-')
@@ -11,7 +11,8 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from src.utils import load_config, load_env, setup_logger
 from src.database import Database
-from src.adapters import DiceAdapter
+from src.adapters.runner import run_platforms, log_run_summary, create_adapter
+from src.adapters.query_planner import format_plan
 
 
 def print_banner():
@@ -25,8 +26,8 @@ def print_banner():
     print(banner)
 
 
-def show_statistics(db):
-    """Display application statistics"""
+def show_statistics(db, run_results=None):
+    """Display application statistics, and the per-platform results of this run if given"""
     stats = db.get_statistics()
     
     print("\n" + "="*50)
@@ -41,29 +42,54 @@ def show_statistics(db):
         success_rate = (stats['successful_applications'] / stats['total_applications']) * 100
         print(f"Success Rate:              {success_rate:.1f}%")
     
+    if stats['by_platform']:
+        print("-"*50)
+        for platform, platform_stats in sorted(stats['by_platform'].items()):
+            print(f"{platform:<12} {platform_stats['jobs']:>6} jobs  {platform_stats['applications']:>5} applications  "
+                  f"{platform_stats['successful']:>5} successful")
+    
+    if run_results:
+        print("-"*50)
+        print("THIS RUN")
+        for record in run_results.values():
+            print(f"{record['platform']:<12} {record['status']:<8} {record['jobs_found']:>5} found  "
+                  f"{record['applications_submitted']:>4} applied  {record['duration_seconds']:>6.0f}s")
+            if record['error']:
+                print(f"{'':<12} {record['error']}")
+    
     print("="*50 + "\n")
 
 
-def run_platform(platform_name, config, db, search_only=False):
-    """Run job search and application for a specific platform"""
-    logger = setup_logger()
-    
-    if platform_name == 'dice':
-        adapter = DiceAdapter(config, db)
-    else:
-        logger.error(f"Unsupported platform: {platform_name}")
-        return False
-    
-    try:
-        logger.info(f"Starting {platform_name} job search...")
-        result = adapter.run(search_only=search_only)
+def show_plan(platforms, config, db):
+    """Print the searches each platform would run in its search_mode, without running them"""
+    print("\n" + "="*50)
+    print("SEARCH PLAN (dry run)")
+    print("="*50)
+    for platform_name in platforms:
+        adapter = create_adapter(platform_name, config, db)
+        if adapter is None or not hasattr(adapter, 'plan_queries'):
+            print(f"{platform_name}: no query planner")
+            continue
+        search_pages = adapter.platform_config.get('search_pages', 3)
+        search_mode = adapter.platform_config.get('search_mode', 'single')
+        plan = format_plan(platform_name, adapter.plan_queries(), config['search_criteria'], search_pages)
         
-        logger.info(f"Completed! Jobs found: {result['jobs_found']}, Applications: {result['applications_submitted']}")
-        return True
+        if search_mode == 'planned':
+            print(plan)
+            continue
         
-    except Exception as e:
-        logger.error(f"Error running {platform_name}: {str(e)}")
-        return False
+        if search_mode == 'fan_out':
+            queries = adapter.search_queries()
+            print(f"{platform_name}: search_mode fan_out runs {len(queries)} queries, up to {search_pages} pages each")
+            for index, (keywords, location) in enumerate(queries, 1):
+                print(f"  {index}. {keywords} @ {location}")
+                print(f"     {adapter.build_search_url(1, keywords, location)}")
+        else:
+            print(f"{platform_name}: search_mode {search_mode} pages through one query")
+            print(f"     {adapter.build_search_url(1)}")
+        print("  With search_mode: planned it would run:")
+        print('\n'.join(f"  {line}" for line in plan.splitlines()))
+    print("="*50 + "\n")
 
 
 def main():
@@ -79,6 +105,9 @@ def main():
     parser.add_argument('--search-only', '-s', 
                        action='store_true',
                        help='Only search and save jobs, do not apply')
+    parser.add_argument('--plan',
+                       action='store_true',
+                       help='Print the planned search queries and exit (dry run)')
     parser.add_argument('--stats', 
                        action='store_true',
                        help='Show application statistics')
@@ -123,30 +152,28 @@ def main():
         logger.error("No platforms enabled. Please check your config.yaml")
         sys.exit(1)
     
+    if args.plan:
+        show_plan(platforms_to_run, config, db)
+        return
+    
     logger.info(f"Running platforms: {', '.join(platforms_to_run)}")
     
     if args.search_only:
         logger.info("Search-only mode: Will not submit applications")
     
-    # Run each platform
-    success_count = 0
-    for platform in platforms_to_run:
-        logger.info(f"\n{'='*60}")
-        logger.info(f"Processing platform: {platform.upper()}")
-        logger.info(f"{'='*60}\n")
-        
-        success = run_platform(platform, config, db, args.search_only)
-        if success:
-            success_count += 1
+    # Run the platforms (concurrently when execution.parallel_platforms is set and 2+ are enabled)
+    results = run_platforms(platforms_to_run, config, db, args.search_only, logger=logger)
+    success_count = sum(1 for record in results.values() if record['status'] == 'ok')
     
     # Final summary
     logger.info(f"\n{'='*60}")
     logger.info(f"SESSION COMPLETE")
     logger.info(f"{'='*60}")
     logger.info(f"Platforms processed: {success_count}/{len(platforms_to_run)}")
+    log_run_summary(results, logger)
     
     # Show statistics
-    show_statistics(db)
+    show_statistics(db, results)
     
     logger.info("JobBider session ended. Check logs/ for detailed logs.")
 
@@ -11,7 +11,12 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from src.utils import load_config, load_env, setup_logger
 from src.database import Database
-from src.adapters import DiceAdapter
+from src.adapters import BrowserService
+from src.adapters.runner import run_platforms, log_run_summary
+
+
+# Resident browser kept warm between triggers (browser_service.enabled)
+browser_service = None
 
 
 def run_job_search():
@@ -25,18 +30,17 @@ def run_job_search():
         db = Database()
         
         # Get enabled platforms
-        for platform_name, settings in config['platforms'].items():
-            if not settings.get('enabled', False):
-                continue
-            
-            logger.info(f"Running {platform_name}...")
-            
-            if platform_name == 'dice':
-                adapter = DiceAdapter(config, db)
-                result = adapter.run(search_only=False)
-                logger.info(f"Completed {platform_name}: {result['applications_submitted']} applications")
+        platforms = [name for name, settings in config['platforms'].items() if settings.get('enabled', False)]
+        logger.info(f"Running {', '.join(platforms)}...")
+        
+        results = run_platforms(platforms, config, db, search_only=False, browser_service=browser_service, logger=logger)
+        log_run_summary(results, logger)
         
-        logger.info("Scheduled job search completed successfully")
+        failed = [name for name, record in results.items() if record['status'] != 'ok']
+        if failed:
+            logger.warning(f"Scheduled job search finished with failures: {', '.join(failed)}")
+        else:
+            logger.info("Scheduled job search completed successfully")
         
     except Exception as e:
         logger.error(f"Error in scheduled job: {str(e)}")
@@ -44,6 +48,8 @@ def run_job_search():
 
 def main():
     """Main scheduler entry point"""
+    global browser_service
+    
     load_env()
     config = load_config()
     logger = setup_logger('scheduler')
@@ -60,6 +66,21 @@ def main():
     # Create scheduler
     scheduler = BlockingScheduler()
     
+    service_config = config.get('browser_service', {}) or {}
+    if service_config.get('enabled', False):
+        browser_service = BrowserService(service_config)
+        health_check_minutes = service_config.get('health_check_minutes', 10)
+        if health_check_minutes:
+            scheduler.add_job(
+                browser_service.health_check,
+                'interval',
+                minutes=health_check_minutes,
+                id='browser_health_check',
+                name='Resident Browser Health Check',
+                replace_existing=True
+            )
+        logger.info("Resident browser service enabled")
+    
     if frequency == 'daily':
         hour, minute = run_time.split(':')
         scheduler.add_job(
@@ -100,6 +121,9 @@ def main():
     except KeyboardInterrupt:
         logger.info("Scheduler stopped by user")
         scheduler.shutdown()
+    finally:
+        if browser_service:
+            browser_service.shutdown()
 
 
 if __name__ == "__main__":
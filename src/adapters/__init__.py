@@ -3,5 +3,7 @@ Platform adapters package
 """
 
 from .dice_adapter import DiceAdapter
+from .browser_service import BrowserService
+from .async_adapter import AsyncPlatformAdapter, SyncAdapterBridge
 
-__all__ = ['DiceAdapter']
+__all__ = ['DiceAdapter', 'BrowserService', 'AsyncPlatformAdapter', 'SyncAdapterBridge']
@@ -0,0 +1,274 @@
+"""
+Asyncio-native adapter interface and a bridge for synchronous adapters
+"""
+
+import asyncio
+import functools
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from src.database.records import JobRecord
+from src.utils.logger import setup_logger
+from src.utils.rate_limiter import get_rate_limiter
+
+
+async def gather_limited(coroutines, limit):
+    """Run coroutines concurrently, at most `limit` at a time; results keep input order"""
+    semaphore = asyncio.Semaphore(max(1, int(limit)))
+
+    async def guarded(coroutine):
+        async with semaphore:
+            return await coroutine
+
+    return await asyncio.gather(*(guarded(c) for c in coroutines), return_exceptions=True)
+
+
+class AsyncPlatformAdapter(ABC):
+    """Abstract base class for asyncio-native platform adapters
+
+    Mirrors BasePlatformAdapter with coroutine methods, so many searches,
+    enrichment calls or whole platforms can overlap on one event loop.
+    Database access stays synchronous and is pushed to worker threads.
+    Applications go through the same shared rate limiter as the sync
+    adapters.
+    """
+
+    def __init__(self, config, db):
+        self.config = config
+        self.db = db
+        self.logger = setup_logger(f'async_adapter.{self.platform_name}')
+        self.rate_limiter = get_rate_limiter(config, self.platform_name, db)
+        self.slot_denied = False
+
+    @property
+    @abstractmethod
+    def platform_name(self):
+        """Return the name of the platform (e.g., 'dice', 'indeed')"""
+        pass
+
+    @abstractmethod
+    async def login(self):
+        """Login to the platform"""
+        pass
+
+    @abstractmethod
+    async def search_jobs(self, keywords, location):
+        """Search for jobs on the platform"""
+        pass
+
+    @abstractmethod
+    async def extract_job_details(self, job_element):
+        """Extract job details from a job listing element"""
+        pass
+
+    @abstractmethod
+    async def apply_to_job(self, job_url, job_data):
+        """Apply to a specific job
+
+        Await acquire_apply_slot() right before the request or click that
+        submits the application, and give up if it returns False.
+        """
+        pass
+
+    async def close(self):
+        """Release resources (browsers, sessions)"""
+        pass
+
+    @property
+    def platform_config(self):
+        """Return the platforms.<name> section of config.yaml"""
+        return self.config.get('platforms', {}).get(self.platform_name, {}) or {}
+
+    async def check_duplicate(self, job_id):
+        """Check if we've already applied to this job"""
+        return await asyncio.to_thread(self.db.application_exists, job_id, self.platform_name)
+
+    async def save_job(self, job_data):
+        """Save job to database (if not stored yet)"""
+        def save():
+            if self.db.job_exists(job_data['job_id'], self.platform_name):
+                return
+            record = job_data if isinstance(job_data, JobRecord) else JobRecord.from_dict(job_data)
+            record.platform = self.platform_name
+            self.db.save_job(record)
+            self.logger.info(f"Saved job: {job_data.get('title')} at {job_data.get('company')}")
+
+        try:
+            await asyncio.to_thread(save)
+        except Exception as e:
+            self.logger.error(f"Error saving job: {str(e)}")
+
+    async def save_application(self, job_id, success=True, error_message=None):
+        """Save application record to database"""
+        app_data = {
+            'job_id': job_id,
+            'platform': self.platform_name,
+            'success': success,
+            'error_message': error_message,
+            'application_method': 'automated'
+        }
+        try:
+            await asyncio.to_thread(self.db.save_application, app_data)
+        except Exception as e:
+            self.logger.error(f"Error saving application: {str(e)}")
+
+    async def acquire_apply_slot(self):
+        """Wait (off the event loop) for the rate limiter just before submitting
+
+        Returns False (and the application must not be submitted) when the
+        daily budget ran out in the meantime.
+        """
+        if await asyncio.to_thread(self.rate_limiter.acquire):
+            return True
+        self.slot_denied = True
+        return False
+
+    async def apply_and_record(self, job):
+        """Apply to a job and write the outcome back
+
+        Same checks and results as BasePlatformAdapter.apply_and_record:
+        companies in their cooldown and jobs past the daily budget are
+        skipped without a record (None).
+        """
+        if await asyncio.to_thread(self.rate_limiter.in_cooldown, job.get('company')):
+            self.logger.info(f"Applied to {job.get('company')} recently (cooldown). Skipping.")
+            return None
+
+        if await asyncio.to_thread(self.rate_limiter.budget_exhausted):
+            self.logger.info("Daily application limit reached. Skipping.")
+            return None
+
+        self.slot_denied = False
+        try:
+            success = await self.apply_to_job(job['url'], job)
+        except Exception as e:
+            self.logger.error(f"Error applying to job: {str(e)}")
+            await self.save_application(job['job_id'], success=False, error_message=str(e))
+            return False
+
+        if self.slot_denied:
+            self.logger.info("Daily application limit reached. Skipping.")
+            return None
+
+        if success:
+            self.rate_limiter.record_company(job.get('company'))
+            await self.save_application(job['job_id'], success=True)
+        else:
+            await self.save_application(job['job_id'], success=False, error_message="Application failed")
+        return success
+
+    async def run(self, search_only=False):
+        """Search every keyword/location pair concurrently, save the unique jobs, then apply"""
+        try:
+            await self.login()
+
+            criteria = self.config['search_criteria']
+            queries = [(k, l) for k in criteria.get('keywords', []) for l in criteria.get('locations', [])]
+            search_limit = self.platform_config.get('search_concurrency', 8)
+
+            results = await gather_limited((self.search_jobs(k, l) for k, l in queries), search_limit)
+
+            # Merge by job_id: overlapping queries often return the same job
+            jobs = []
+            seen = set()
+            for (keywords, location), result in zip(queries, results):
+                if isinstance(result, Exception):
+                    self.logger.error(f"Search '{keywords}' in '{location}' failed: {str(result)}")
+                    continue
+                for job in result or []:
+                    if job['job_id'] not in seen:
+                        seen.add(job['job_id'])
+                        jobs.append(job)
+
+            for job in jobs:
+                await self.save_job(job)
+
+            total_applications = 0
+            if not search_only:
+                max_applications = self.platform_config.get('max_applications_per_run')
+                for job in jobs:
+                    if max_applications is not None and total_applications >= max_applications:
+                        self.logger.info(f"Reached max applications per run ({max_applications}). Stopping.")
+                        break
+                    if await asyncio.to_thread(self.rate_limiter.budget_exhausted):
+                        self.logger.info("Daily application limit reached. Stopping.")
+                        break
+                    if await self.check_duplicate(job['job_id']):
+                        continue
+                    if await self.apply_and_record(job):
+                        total_applications += 1
+
+            self.logger.info(f"Session complete: Found {len(jobs)} jobs, Applied to {total_applications}")
+            return {
+                'jobs_found': len(jobs),
+                'applications_submitted': total_applications
+            }
+        finally:
+            await self.close()
+
+
+class SyncAdapterBridge(AsyncPlatformAdapter):
+    """Expose a synchronous BasePlatformAdapter (e.g. DiceAdapter) through the async interface
+
+    WebDriver is not thread-safe, so every call into the wrapped adapter runs
+    on one dedicated thread; the event loop stays free for other tasks.
+    """
+
+    def __init__(self, adapter):
+        self.adapter = adapter
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f'{adapter.platform_name}-bridge')
+        self.closed = False
+        super().__init__(adapter.config, adapter.db)
+
+    @property
+    def platform_name(self):
+        return self.adapter.platform_name
+
+    async def _call(self, func, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, functools.partial(func, *args, **kwargs))
+
+    async def login(self):
+        await self._call(self.adapter.init_driver)
+        return await self._call(self.adapter.login)
+
+    async def search_jobs(self, keywords, location):
+        return await self._call(self.adapter.search_jobs, keywords, location)
+
+    async def extract_job_details(self, job_element):
+        return await self._call(self.adapter.extract_job_details, job_element)
+
+    async def apply_to_job(self, job_url, job_data):
+        return await self._call(self.adapter.apply_to_job, job_url, job_data)
+
+    async def check_duplicate(self, job_id):
+        return await self._call(self.adapter.check_duplicate, job_id)
+
+    async def save_job(self, job_data):
+        return await self._call(self.adapter.save_job, job_data)
+
+    async def apply_and_record(self, job):
+        """The adapter's own apply_and_record (cooldown, daily budget, rate limiter)"""
+        return await self._call(self.adapter.apply_and_record, job)
+
+    async def run(self, search_only=False):
+        """Delegate to the adapter's own synchronous run()"""
+        try:
+            return await self._call(self.adapter.run, search_only=search_only)
+        finally:
+            await self.close()
+
+    async def close(self):
+        """Close the driver and stop the worker thread; later calls do nothing"""
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            await self._call(self.adapter.close_driver)
+        finally:
+            self.executor.shutdown(wait=False)
+
+
+async def run_adapters(adapters, search_only=False):
+    """Run several async adapters on one event loop; returns {platform: result or exception}"""
+    results = await asyncio.gather(*(a.run(search_only=search_only) for a in adapters), return_exceptions=True)
+    return {adapter.platform_name: result for adapter, result in zip(adapters, results)}
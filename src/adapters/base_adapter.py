@@ -6,23 +6,55 @@ from abc import ABC, abstractmethod
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
 import os
+import threading
 from src.utils.logger import setup_logger
+from src.database.records import JobRecord
+from src.utils.rate_limiter import get_rate_limiter
+from src.utils.screenshots import ScreenshotPolicy, ScreenshotWriter
+from .waits import WaitEngine
+from .resource_policy import ResourcePolicy
+from .session_store import SessionStore
+from .driver_cache import resolve_chromedriver
+from .replay import get_recorder
+from .fanout import QueryFanOut
+from .selector_cache import get_selector_cache
 
 
 class BasePlatformAdapter(ABC):
     """Abstract base class for all platform adapters"""
     
-    def __init__(self, config, db):
+    def __init__(self, config, db, worker_id=None, browser_service=None):
         self.config = config
         self.db = db
-        self.logger = setup_logger(f'adapter.{self.platform_name}')
+        self.worker_id = worker_id
+        self.browser_service = browser_service
+        logger_name = f'adapter.{self.platform_name}'
+        if worker_id is not None:
+            logger_name = f'{logger_name}[{worker_id}]'
+        self.logger = setup_logger(logger_name)
         self.driver = None
         self.is_logged_in = False
+        self.waits = WaitEngine(self, config.get('waits'))
+        self.resource_policy = ResourcePolicy(config.get('resource_policy'))
+        self.screenshot_policy = ScreenshotPolicy(config.get('screenshots'))
+        self.screenshot_writer = None
+        self.session_store = SessionStore(self.platform_name, config.get('session'), worker_id=worker_id)
+        self.rate_limiter = get_rate_limiter(config, self.platform_name, db)
+        self.claimed_jobs = set()
+        self.claimed_jobs_lock = threading.Lock()
+        self.slot_denied = False
+        self.selector_cache = get_selector_cache(self.platform_name, config.get('selector_cache'))
+        
+        replay_config = config.get('replay') or {}
+        self.recorder = None
+        if replay_config.get('record', False):
+            self.recorder = get_recorder(replay_config.get('dir', f'recordings/{self.platform_name}'))
+    
+    @property
+    def platform_config(self):
+        """Return the platforms.<name> section of config.yaml"""
+        return self.config.get('platforms', {}).get(self.platform_name, {}) or {}
     
     @property
     @abstractmethod
@@ -47,14 +79,29 @@ class BasePlatformAdapter(ABC):
     
     @abstractmethod
     def apply_to_job(self, job_url, job_data):
-        """Apply to a specific job"""
+        """Apply to a specific job
+
+        Call acquire_apply_slot() right before the click that submits the
+        application, and give up if it returns False.
+        """
         pass
     
     def init_driver(self):
-        """Initialize Selenium WebDriver"""
+        """Initialize Selenium WebDriver, borrowing the resident browser when one is shared"""
         if self.driver:
             return
         
+        if self.browser_service:
+            self.driver = self.browser_service.borrow(self.build_driver)
+            if self.driver:
+                self.is_logged_in = self.browser_service.is_logged_in(self.platform_name)
+                return
+            self.logger.info("Resident browser is busy, starting a private one")
+        
+        self.driver = self.build_driver()
+    
+    def build_driver(self):
+        """Start a new Chrome WebDriver"""
         self.logger.info("Initializing Chrome WebDriver...")
         
         chrome_options = Options()
@@ -76,49 +123,113 @@ class BasePlatformAdapter(ABC):
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation", "enable-logging"])
         chrome_options.add_experimental_option('useAutomationExtension', False)
         
-        # Disable images and CSS for faster loading (optional)
-        # prefs = {"profile.managed_default_content_settings.images": 2}
-        # chrome_options.add_experimental_option("prefs", prefs)
+        # Persistent Chrome profile (session.mode: profile)
+        for argument in self.session_store.chrome_arguments():
+            chrome_options.add_argument(argument)
+        
+        # Block images, fonts, trackers etc. per resource_policy in config.yaml
+        self.resource_policy.configure_options(chrome_options)
         
         # User agent to avoid detection
         chrome_options.add_argument('user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
         
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
+        service = Service(resolve_chromedriver(self.config.get('driver'), self.logger))
+        driver = webdriver.Chrome(service=service, options=chrome_options)
         
         # Set page load timeout
-        self.driver.set_page_load_timeout(30)
+        driver.set_page_load_timeout(30)
         
-        # Set timeouts
-        self.driver.implicitly_wait(10)
+        # Explicit waits (self.waits) replace the implicit wait; a non-zero
+        # implicit wait would stretch every missed lookup inside a condition
+        driver.implicitly_wait(self.waits.implicit_wait)
         
         self.logger.info("WebDriver initialized successfully")
+        return driver
     
     def close_driver(self):
         """Close the WebDriver"""
         if self.driver:
-            self.logger.info("Closing WebDriver...")
-            self.driver.quit()
+            self.resource_policy.collect(self.driver)
+            self.resource_policy.phase = None
+            
+            if self.browser_service and self.browser_service.driver is self.driver:
+                self.logger.info("Returning WebDriver to the resident browser service...")
+                logged_in_platform = self.platform_name if self.is_logged_in else None
+                self.browser_service.give_back(self.driver, logged_in_platform=logged_in_platform)
+            else:
+                self.logger.info("Closing WebDriver...")
+                self.driver.quit()
             self.driver = None
+            self.waits.log_summary(self.logger)
+            self.resource_policy.log_summary(self.logger)
+            if self.worker_id is None:
+                self.selector_cache.log_summary(self.logger)
+        
+        try:
+            self.selector_cache.save()
+        except Exception as e:
+            self.logger.warning(f"Could not save selector cache: {str(e)}")
+        
+        if self.screenshot_writer:
+            self.screenshot_writer.close()
+            self.screenshot_writer = None
     
-    def wait_for_element(self, by, value, timeout=10, silent=False):
-        """Wait for an element to be present"""
+    def use_resource_phase(self, phase):
+        """Switch request blocking to the resource profile for phase ('search' or 'apply')"""
         try:
-            element = WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_element_located((by, value))
-            )
-            return element
+            self.resource_policy.apply_phase(self.driver, phase)
         except Exception as e:
-            if not silent:
-                self.logger.error(f"Element not found: {value} - {str(e)}")
-            return None
+            self.logger.warning(f"Could not apply resource profile '{phase}': {str(e)}")
+    
+    def wait_for_element(self, by, value, timeout=10, silent=False, replaces=None):
+        """Wait for an element to be present"""
+        element = self.waits.element(by, value, ceiling=timeout, replaces=replaces)
+        if element is None and not silent:
+            self.logger.error(f"Element not found: {value} (waited {timeout}s)")
+        return element
+    
+    def wait_for_any(self, locators, timeout=10, clickable=False, accept=None, replaces=None):
+        """Wait for whichever of several (by, value) locators matches first
+
+        Returns (element, locator), or (None, None) after timeout seconds.
+        """
+        match = self.waits.any_element(locators, clickable=clickable, accept=accept, ceiling=timeout, replaces=replaces)
+        return match or (None, None)
     
-    def wait_and_click(self, by, value, timeout=10):
+    def find_with_fallbacks(self, step, locators, timeout=5, clickable=False, accept=None, replaces=None,
+                            last_resort=None):
+        """Find the element for a page step from a list of fallback (by, value) locators
+
+        All locators are raced in one wait (see wait_for_any); when several
+        match, the order learned by the selector cache decides. The winner is
+        recorded as a hit; if nothing matches, every locator is a miss.
+        accept(element) can reject a match (e.g. wrong button text).
+        last_resort locators are too generic to race (they can match before
+        the real element renders): they are checked once, only after the
+        others time out, and are never recorded in the selector cache.
+        Returns (element, locator), or (None, None).
+        """
+        element, locator = self.wait_for_any(
+            self.selector_cache.order(step, locators),
+            timeout=timeout, clickable=clickable, accept=accept, replaces=replaces
+        )
+        if element is not None:
+            self.selector_cache.record(step, locator, hit=True)
+            return element, locator
+        
+        for missed in locators:
+            self.selector_cache.record(step, missed, hit=False)
+        if last_resort:
+            element, locator = self.wait_for_any(last_resort, timeout=0, clickable=clickable, accept=accept)
+        return element, locator
+    
+    def wait_and_click(self, by, value, timeout=10, replaces=None):
         """Wait for an element and click it"""
+        element = self.waits.element(by, value, clickable=True, ceiling=timeout, replaces=replaces)
+        if element is None:
+            self.logger.error(f"Could not click element: {value} (waited {timeout}s)")
+            return False
         try:
-            element = WebDriverWait(self.driver, timeout).until(
-                EC.element_to_be_clickable((by, value))
-            )
             element.click()
             return True
         except Exception as e:
@@ -139,32 +250,146 @@ class BasePlatformAdapter(ABC):
         except:
             return []
     
-    def save_screenshot(self, name):
-        """Save a screenshot for debugging"""
-        if self.driver:
+    def save_screenshot(self, name, failure=False):
+        """Capture a screenshot for debugging, subject to the screenshots policy
+        
+        Only the capture itself runs here; encoding and disk writes happen on
+        the background ScreenshotWriter thread.
+        """
+        if not self.driver or not self.screenshot_policy.should_capture(failure):
+            return
+        
+        try:
+            png_bytes = self.driver.get_screenshot_as_png()
+        except Exception as e:
+            self.logger.debug(f"Screenshot capture failed: {str(e)}")
+            return
+        
+        if not self.screenshot_writer:
             screenshot_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'screenshots')
-            os.makedirs(screenshot_dir, exist_ok=True)
-            filepath = os.path.join(screenshot_dir, f"{name}.png")
-            self.driver.save_screenshot(filepath)
-            self.logger.debug(f"Screenshot saved: {filepath}")
+            self.screenshot_writer = ScreenshotWriter(screenshot_dir, self.logger, self.config.get('screenshots'))
+            self.screenshot_writer.start()
+        
+        if self.worker_id is not None:
+            name = f"{self.worker_id}_{name}"
+        self.screenshot_writer.submit(name, png_bytes)
     
-    def check_duplicate(self, job_id):
-        """Check if job or application already exists"""
-        if self.db.job_exists(job_id, self.platform_name):
-            self.logger.debug(f"Job {job_id} already in database")
+    def record_html(self, url, page_html, label):
+        """Save a fetched page to the recording (replay.record)"""
+        if not self.recorder:
+            return
+        try:
+            self.recorder.record(url, page_html, label)
+        except Exception as e:
+            self.logger.warning(f"Could not record page {label}: {str(e)}")
+    
+    def record_page(self, label):
+        """Save the browser's current page to the recording (replay.record)"""
+        if not self.recorder or not self.driver:
+            return
+        try:
+            self.record_html(self.driver.current_url, self.driver.page_source, label)
+        except Exception as e:
+            self.logger.warning(f"Could not record page {label}: {str(e)}")
+    
+    def probe_logged_in(self):
+        """Cheaply check whether the browser session is authenticated (platforms override)"""
+        return False
+    
+    def restore_session(self, home_url):
+        """Reuse a saved session instead of logging in; returns True if still logged in"""
+        if not self.session_store.enabled:
+            return False
+        
+        try:
+            if self.session_store.mode == 'cookies':
+                cookies = self.session_store.load_cookies()
+                if not cookies:
+                    return False
+                
+                # Cookies can only be added for the domain currently loaded
+                self.driver.get(home_url)
+                for cookie in cookies:
+                    cookie.pop('sameSite', None)
+                    try:
+                        self.driver.add_cookie(cookie)
+                    except Exception:
+                        continue
             
+            if self.probe_logged_in():
+                self.logger.info("✓ Restored saved session, skipping login")
+                self.is_logged_in = True
+                return True
+        except Exception as e:
+            self.logger.warning(f"Could not restore saved session: {str(e)}")
+        
+        self.logger.info("Saved session expired, logging in again")
+        return False
+    
+    def persist_session(self):
+        """Save the authenticated session for the next run"""
+        try:
+            self.session_store.save_cookies(self.driver)
+        except Exception as e:
+            self.logger.warning(f"Could not save session: {str(e)}")
+    
+    def check_duplicate(self, job_id):
+        """Check if we've already applied to this job"""
         if self.db.application_exists(job_id, self.platform_name):
             self.logger.debug(f"Already applied to job {job_id}")
             return True
         
         return False
     
-    def save_job(self, job_data):
-        """Save job to database"""
+    def dedup_page(self, jobs):
+        """Split a result page using one query for stored jobs and one for applications
+
+        Returns (pending, seen): the jobs not applied to yet (first occurrence
+        of each job_id), and the set of job_ids already in the jobs table.
+        """
+        seen, applied = self.db.find_duplicates([job['job_id'] for job in jobs], self.platform_name)
+        
+        pending = []
+        page_ids = set()
+        for job in jobs:
+            if job['job_id'] in applied or job['job_id'] in page_ids:
+                continue
+            page_ids.add(job['job_id'])
+            pending.append(job)
+        
+        if len(pending) < len(jobs):
+            self.logger.info(f"Skipping {len(jobs) - len(pending)} already-applied jobs on this page")
+        return pending, seen
+    
+    def claim_job(self, job_id):
+        """Reserve a job for this run; False if it was already queued or applied to in it
+        
+        Queued jobs have no application row yet, so dedup_page and
+        check_duplicate cannot tell that a later page repeats them.
+        """
+        with self.claimed_jobs_lock:
+            if job_id in self.claimed_jobs:
+                return False
+            self.claimed_jobs.add(job_id)
+            return True
+    
+    def is_claimed(self, job_id):
+        with self.claimed_jobs_lock:
+            return job_id in self.claimed_jobs
+    
+    def save_job(self, job_data, exists=None):
+        """Save job to database
+
+        exists: whether the job is already stored, when the caller knows it
+        (e.g. from dedup_page); looked up otherwise.
+        """
         try:
-            if not self.db.job_exists(job_data['job_id'], self.platform_name):
-                job_data['platform'] = self.platform_name
-                self.db.save_job(job_data)
+            if exists is None:
+                exists = self.db.job_exists(job_data['job_id'], self.platform_name)
+            if not exists:
+                record = job_data if isinstance(job_data, JobRecord) else JobRecord.from_dict(job_data)
+                record.platform = self.platform_name
+                self.db.save_job(record)
                 self.logger.info(f"Saved job: {job_data['title']} at {job_data['company']}")
         except Exception as e:
             self.logger.error(f"Error saving job: {str(e)}")
@@ -189,46 +414,129 @@ class BasePlatformAdapter(ABC):
         except Exception as e:
             self.logger.error(f"Error saving application: {str(e)}")
     
+    def spawn_worker(self, worker_id):
+        """Create an independent adapter (own driver and login) sharing config and database"""
+        return self.__class__(self.config, self.db, worker_id=worker_id)
+    
+    def application_budget(self):
+        """Remaining applications allowed by max_applications_per_run and the daily safety limit"""
+        budget = self.platform_config.get('max_applications_per_run')
+        
+        daily_limit = self.config.get('safety', {}).get('max_applications_per_day')
+        if daily_limit is not None:
+            remaining_today = max(0, daily_limit - self.db.get_applications_today())
+            budget = remaining_today if budget is None else min(budget, remaining_today)
+        
+        return budget
+    
+    def apply_and_record(self, job):
+        """Apply to a job and write the outcome back via save_application
+
+        apply_to_job waits for the rate limiter (acquire_apply_slot) only once
+        it is about to submit, so jobs it gives up on earlier cost no slot.
+        Jobs at companies still in their cooldown, or past the daily budget,
+        are skipped without a record. The job itself is saved just before the
+        attempt (a no-op when it is already stored); job['stored'], when set,
+        says whether it is, so no lookup is made.
+
+        Returns True when applied, False when the attempt failed, and None
+        when the job was skipped without trying (it can be tried again later).
+        """
+        if self.rate_limiter.in_cooldown(job.get('company')):
+            self.logger.info(f"Applied to {job.get('company')} recently (cooldown). Skipping.")
+            return None
+        
+        if self.rate_limiter.budget_exhausted():
+            self.logger.info("Daily application limit reached. Skipping.")
+            return None
+        
+        self.save_job(job, exists=job.get('stored'))
+        job['stored'] = True
+        self.slot_denied = False
+        try:
+            success = self.apply_to_job(job['url'], job)
+            if self.slot_denied:
+                self.logger.info("Daily application limit reached. Skipping.")
+                return None
+            if success:
+                self.rate_limiter.record_company(job.get('company'))
+                self.save_application(job['job_id'], success=True, match_score=job.get('match_score'))
+            else:
+                self.save_application(job['job_id'], success=False, error_message="Application failed",
+                                      match_score=job.get('match_score'))
+            return success
+        except Exception as e:
+            self.logger.error(f"Error applying to job: {str(e)}")
+            self.save_application(job['job_id'], success=False, error_message=str(e))
+            return False
+    
+    def acquire_apply_slot(self):
+        """Wait for the rate limiter just before submitting an application
+        
+        Returns False (and the application must not be submitted) when the
+        daily budget ran out in the meantime.
+        """
+        if self.rate_limiter.acquire():
+            return True
+        self.slot_denied = True
+        return False
+    
+    def is_driver_alive(self):
+        """Check whether the WebDriver session still responds"""
+        if not self.driver:
+            return False
+        try:
+            self.driver.current_url
+            return True
+        except Exception:
+            return False
+    
+    @property
+    def search_is_thread_safe(self):
+        """Whether search_jobs may run on several threads at once (not while it drives self.driver)"""
+        return False
+    
+    def search_queries(self):
+        """Return the (keywords, location) pairs to search"""
+        criteria = self.config['search_criteria']
+        return [
+            (keywords, location)
+            for keywords in criteria.get('keywords', [])
+            for location in criteria.get('locations', [])
+        ]
+    
+    def fan_out_search(self):
+        """Return a QueryFanOut over search_queries(), de-duplicating jobs across queries
+
+        Runs up to search_concurrency queries at once when search is thread-safe.
+        """
+        concurrency = self.platform_config.get('search_concurrency', 4) if self.search_is_thread_safe else 1
+        return QueryFanOut(self.search_jobs, self.search_queries(), concurrency, self.logger)
+    
     def run(self, search_only=False):
         """Main execution flow"""
         try:
             self.init_driver()
             self.login()
             
-            # Get search criteria from config
-            criteria = self.config['search_criteria']
-            keywords_list = criteria.get('keywords', [])
-            locations = criteria.get('locations', [])
-            
             total_jobs_found = 0
             total_applications = 0
             
-            # Search for each keyword-location combination
-            for keywords in keywords_list:
-                for location in locations:
-                    self.logger.info(f"Searching: '{keywords}' in '{location}'")
-                    
-                    jobs = self.search_jobs(keywords, location)
-                    total_jobs_found += len(jobs)
-                    
-                    self.logger.info(f"Found {len(jobs)} jobs")
+            # Every keyword-location combination, merged into one stream of unique jobs
+            fan_out = self.fan_out_search()
+            for job in fan_out:
+                total_jobs_found += 1
+                
+                if not search_only:
+                    # Check if already applied
+                    if self.check_duplicate(job['job_id']):
+                        continue
                     
-                    if not search_only:
-                        # Apply to jobs
-                        for job in jobs:
-                            # Check if already applied
-                            if self.check_duplicate(job['job_id']):
-                                continue
-                            
-                            # Apply to job
-                            try:
-                                success = self.apply_to_job(job['url'], job)
-                                if success:
-                                    total_applications += 1
-                            except Exception as e:
-                                self.logger.error(f"Error applying to job: {str(e)}")
-                                self.save_application(job['job_id'], success=False, error_message=str(e))
+                    # Apply to job
+                    if self.apply_and_record(job):
+                        total_applications += 1
             
+            fan_out.log_summary()
             self.logger.info(f"Session complete: Found {total_jobs_found} jobs, Applied to {total_applications}")
             
             return {
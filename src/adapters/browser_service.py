@@ -0,0 +1,200 @@
+"""
+Long-lived browser shared across scheduler runs
+"""
+
+import os
+import threading
+from src.utils.logger import setup_logger
+
+try:
+    import psutil
+except ImportError:  # psutil is optional; /proc is used on Linux without it
+    psutil = None
+
+
+def _children_from_proc():
+    """Map pid -> child pids from /proc (Linux)"""
+    children = {}
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat', 'r') as f:
+                # The command name may contain spaces; ppid follows the closing paren
+                ppid = int(f.read().rsplit(')', 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(ppid, []).append(int(entry))
+    return children
+
+
+def _rss_from_proc(pid):
+    try:
+        with open(f'/proc/{pid}/status', 'r') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError):
+        pass
+    return 0
+
+
+def descendant_pids(pid):
+    """Pids of all descendants of a process (empty if they can't be listed)"""
+    if psutil:
+        try:
+            return [p.pid for p in psutil.Process(pid).children(recursive=True)]
+        except psutil.Error:
+            return []
+
+    if not os.path.isdir('/proc'):
+        return []
+
+    children = _children_from_proc()
+    found = []
+    stack = list(children.get(pid, []))
+    while stack:
+        current = stack.pop()
+        found.append(current)
+        stack.extend(children.get(current, []))
+    return found
+
+
+def process_tree_memory_mb(pid):
+    """Resident memory of a process and all its descendants, in MB (None if unknown)"""
+    if psutil:
+        try:
+            root = psutil.Process(pid)
+            processes = [root] + root.children(recursive=True)
+            return sum(p.memory_info().rss for p in processes) / (1024 * 1024)
+        except psutil.Error:
+            return None
+
+    if not os.path.isdir('/proc'):
+        return None
+
+    return sum(_rss_from_proc(p) for p in [pid] + descendant_pids(pid)) / (1024 * 1024)
+
+
+class BrowserService:
+    """Keep one Chrome instance warm between runs; adapters borrow and return it
+
+    The browser (and its login cookies) survives from one scheduler trigger to
+    the next. It is health-checked on every borrow, and recycled after max_uses
+    borrows or once Chrome's memory exceeds max_memory_mb. If it is already
+    lent out, borrow() returns None and the caller starts its own browser.
+    """
+
+    def __init__(self, config=None):
+        config = config or {}
+        self.max_uses = config.get('max_uses', 20)
+        self.max_memory_mb = config.get('max_memory_mb', 1500)
+        self.logger = setup_logger('browser_service')
+
+        self.lock = threading.Lock()
+        self.driver = None
+        self.borrowed = False
+        self.uses = 0
+        self.logged_in = set()
+        self.recycles = 0
+
+    def borrow(self, factory):
+        """Lend the warm browser, starting one with factory() if needed"""
+        with self.lock:
+            if self.borrowed:
+                return None
+
+            if self.driver and not self._healthy():
+                self._recycle("failed health check")
+            elif self.driver and self.max_uses and self.uses >= self.max_uses:
+                self._recycle(f"reached {self.uses} uses")
+            elif self.driver and self._over_memory():
+                self._recycle("memory limit exceeded")
+
+            if not self.driver:
+                self.logger.info("Starting resident browser...")
+                self.driver = factory()
+                self.uses = 0
+                self.logged_in.clear()
+            else:
+                self.logger.info(f"Reusing warm browser (use {self.uses + 1})")
+
+            self.uses += 1
+            self.borrowed = True
+            return self.driver
+
+    def give_back(self, driver, logged_in_platform=None, discard=False):
+        """Return a borrowed browser; discard=True recycles it"""
+        with self.lock:
+            if driver is not self.driver:
+                return
+            self.borrowed = False
+
+            if discard or not self._healthy():
+                self._recycle("returned unhealthy")
+                return
+
+            if logged_in_platform:
+                self.logged_in.add(logged_in_platform)
+
+            # Leave only one tab open for the next borrower
+            try:
+                handles = self.driver.window_handles
+                for handle in handles[1:]:
+                    self.driver.switch_to.window(handle)
+                    self.driver.close()
+                self.driver.switch_to.window(handles[0])
+            except Exception:
+                self._recycle("could not reset windows")
+
+    def is_logged_in(self, platform):
+        """Check whether the warm browser holds a login for platform"""
+        with self.lock:
+            return platform in self.logged_in
+
+    def memory_mb(self):
+        """Memory used by chromedriver and its Chrome processes"""
+        try:
+            return process_tree_memory_mb(self.driver.service.process.pid)
+        except Exception:
+            return None
+
+    def health_check(self):
+        """Recycle an idle browser that has died or grown too large"""
+        with self.lock:
+            if not self.driver or self.borrowed:
+                return
+            if not self._healthy():
+                self._recycle("failed health check")
+            elif self._over_memory():
+                self._recycle("memory limit exceeded")
+
+    def shutdown(self):
+        """Quit the resident browser"""
+        with self.lock:
+            if self.driver:
+                self._recycle("shutdown")
+
+    def _healthy(self):
+        try:
+            return self.driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    def _over_memory(self):
+        if not self.max_memory_mb:
+            return False
+        memory = self.memory_mb()
+        return memory is not None and memory > self.max_memory_mb
+
+    def _recycle(self, reason):
+        self.logger.info(f"Recycling resident browser: {reason}")
+        try:
+            self.driver.quit()
+        except Exception:
+            pass
+        self.driver = None
+        self.borrowed = False
+        self.uses = 0
+        self.logged_in.clear()
+        self.recycles += 1
@@ -3,12 +3,25 @@ Dice.com platform adapter
 """
 
 import os
-import time
+import threading
+from collections import deque
+from urllib.parse import quote_plus
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from .base_adapter import BasePlatformAdapter
+from .worker_pool import ApplyWorkerPool
+from .dice_search_client import DiceHttpSearchClient
+from .dice_parser import iter_job_cards, parse_job_detail
+from .http_cache import HttpCache
+from .pipeline import SearchApplyPipeline
+from .incremental import IncrementalCrawl
+from .query_planner import QueryPlanner
+from .replay import page_key
+from .work_queue import ApplyWorkQueue, ResumableCrawl
 from src.utils.helpers import extract_salary, calculate_match_score
+from src.matching import JobMatcher
+from src.database.records import JobRecord
 
 
 class DiceAdapter(BasePlatformAdapter):
@@ -17,16 +30,102 @@ class DiceAdapter(BasePlatformAdapter):
     DICE_URL = "https://www.dice.com"
     LOGIN_URL = "https://www.dice.com/dashboard/login"
     SEARCH_URL = "https://www.dice.com/jobs"
+    HOME_FEED_URL = "https://www.dice.com/home-feed"
+    
+    # Fallback locators for each apply-form step; the selector cache learns which to try first
+    EASY_APPLY_LOCATORS = [
+        (By.CSS_SELECTOR, "apply-button-wc"),
+        (By.CSS_SELECTOR, "button.btn-primary"),
+        (By.XPATH, "//button[contains(., 'Easy Apply') or contains(., 'Easy apply')]"),
+    ]
+    REPLACE_LOCATORS = [
+        (By.CSS_SELECTOR, "button.file-remove"),
+        (By.XPATH, "//button[contains(@class, 'file-remove')]"),
+        (By.XPATH, "//span[contains(@class, 'file-remove-subtext')]"),
+        (By.XPATH, "//span[contains(., 'Replace')]"),
+        (By.XPATH, "//button[contains(., 'Replace')]"),
+        (By.CSS_SELECTOR, ".file-remove-subtext"),
+    ]
+    UPLOAD_LOCATORS = [
+        (By.CSS_SELECTOR, "span.fsp-button-upload"),
+        (By.CSS_SELECTOR, "span[data-e2e='upload']"),
+        (By.XPATH, "//span[contains(., 'Upload')]"),
+    ]
+    NEXT_LOCATORS = [
+        (By.CSS_SELECTOR, "button.btn-next"),
+        (By.XPATH, "//button[contains(., 'Next')]"),
+    ]
+    EMAIL_LOCATORS = [
+        (By.CSS_SELECTOR, "input[name='email']"),
+        (By.CSS_SELECTOR, "input[type='email']"),
+    ]
+    CONTINUE_LOCATORS = [
+        (By.CSS_SELECTOR, "button[data-testid='sign-in-button']"),
+        (By.XPATH, "//button[contains(text(), 'Continue')]"),
+    ]
+    PASSWORD_LOCATORS = [
+        (By.CSS_SELECTOR, "input[name='password']"),
+        (By.CSS_SELECTOR, "input[type='password']"),
+    ]
+    SIGNIN_LOCATORS = [
+        (By.CSS_SELECTOR, "button[data-testid='submit-password']"),
+        (By.XPATH, "//button[contains(text(), 'Sign In')]"),
+    ]
+    SUBMIT_LOCATORS = [
+        (By.CSS_SELECTOR, "button.seds-button-primary"),
+        (By.XPATH, "//button[contains(., 'Submit')]"),
+    ]
+    # Matches any form's submit button (often before the real one renders): only
+    # tried once the specific locators above time out, and never cached
+    GENERIC_SUBMIT_LOCATORS = [
+        (By.CSS_SELECTOR, "button[type='submit']"),
+    ]
+    
+    def __init__(self, config, db, worker_id=None, browser_service=None):
+        super().__init__(config, db, worker_id=worker_id, browser_service=browser_service)
+        self.search_client = None
+        self.search_client_lock = threading.Lock()
+        self.detail_cache = None
+        self.planned_queries = {}
+        self.matcher = None
+        self.dropped_jobs = 0
+        
+        # Point the adapter at another origin, e.g. the local replay server
+        base_url = os.getenv('DICE_BASE_URL')
+        if base_url:
+            base_url = base_url.rstrip('/')
+            self.DICE_URL = base_url
+            self.LOGIN_URL = f"{base_url}/dashboard/login"
+            self.SEARCH_URL = f"{base_url}/jobs"
+            self.HOME_FEED_URL = f"{base_url}/home-feed"
+        self.LOGIN_URL = os.getenv('DICE_LOGIN_URL', self.LOGIN_URL)
+        self.SEARCH_URL = os.getenv('DICE_SEARCH_URL', self.SEARCH_URL)
     
     @property
     def platform_name(self):
         return "dice"
     
+    @property
+    def search_backend(self):
+        """Search backend from config: 'browser' (Selenium) or 'http' (requests + lxml)"""
+        return self.platform_config.get('search_backend', 'browser')
+    
+    def probe_logged_in(self):
+        """Logged-in probe: the home feed redirects to the login page for anonymous sessions"""
+        self.driver.get(self.HOME_FEED_URL)
+        self.waits.dom_ready()
+        self.record_page("home_feed")
+        current_url = self.driver.current_url.lower()
+        return "login" not in current_url and "home-feed" in current_url
+    
     def login(self):
         """Login to Dice.com - Two-step process: email first, then password"""
         if self.is_logged_in:
             return True
         
+        if self.restore_session(self.DICE_URL):
+            return True
+        
         email = os.getenv('DICE_EMAIL')
         password = os.getenv('DICE_PASSWORD')
         
@@ -36,104 +135,89 @@ class DiceAdapter(BasePlatformAdapter):
         
         try:
             self.logger.info("Logging into Dice.com...")
+            self.use_resource_phase('apply')
             self.driver.get(self.LOGIN_URL)
-            time.sleep(3)
+            self.waits.dom_ready(replaces=3)
+            self.record_page("login")
             self.save_screenshot("dice_login_page")
             
             # STEP 1: Enter email
             self.logger.info("Step 1: Entering email...")
-            email_input = self.wait_for_element(By.CSS_SELECTOR, "input[name='email']", timeout=10)
-            
-            if not email_input:
-                email_input = self.wait_for_element(By.CSS_SELECTOR, "input[type='email']", timeout=5)
+            email_input, _ = self.find_with_fallbacks('email', self.EMAIL_LOCATORS, timeout=10)
             
             if email_input:
                 email_input.clear()
-                time.sleep(0.5)
                 email_input.send_keys(email)
-                time.sleep(1)
                 self.logger.info("Email entered successfully")
                 self.save_screenshot("dice_email_entered")
             else:
                 self.logger.error("Email input not found")
-                self.save_screenshot("dice_no_email_input")
+                self.save_screenshot("dice_no_email_input", failure=True)
                 return False
             
             # Click Continue button
             self.logger.info("Clicking Continue button...")
-            continue_button = self.wait_for_element(By.CSS_SELECTOR, "button[data-testid='sign-in-button']", timeout=5)
-            
-            if not continue_button:
-                continue_button = self.safe_find_element(By.XPATH, "//button[contains(text(), 'Continue')]")
-            
-            if not continue_button:
-                continue_button = self.safe_find_element(By.CSS_SELECTOR, "button[type='submit']")
+            continue_button, _ = self.find_with_fallbacks(
+                'continue', self.CONTINUE_LOCATORS, timeout=5, clickable=True, last_resort=self.GENERIC_SUBMIT_LOCATORS
+            )
             
             if continue_button:
                 continue_button.click()
-                time.sleep(3)
                 self.logger.info("Continue button clicked")
-                self.save_screenshot("dice_after_continue")
             else:
                 self.logger.warning("Continue button not found, trying Enter key")
                 email_input.send_keys(Keys.RETURN)
-                time.sleep(3)
             
-            # STEP 2: Enter password
+            # STEP 2: Enter password (the field appears once the email step is accepted)
             self.logger.info("Step 2: Entering password...")
-            password_input = self.wait_for_element(By.CSS_SELECTOR, "input[name='password']", timeout=10)
-            
-            if not password_input:
-                password_input = self.wait_for_element(By.CSS_SELECTOR, "input[type='password']", timeout=5)
+            password_input, _ = self.find_with_fallbacks('password', self.PASSWORD_LOCATORS, timeout=10, replaces=3)
+            self.save_screenshot("dice_after_continue")
             
             if password_input:
                 password_input.clear()
-                time.sleep(0.5)
                 password_input.send_keys(password)
-                time.sleep(1)
                 self.logger.info("Password entered successfully")
                 self.save_screenshot("dice_password_entered")
             else:
                 self.logger.error("Password input not found")
-                self.save_screenshot("dice_no_password_input")
+                self.save_screenshot("dice_no_password_input", failure=True)
                 return False
             
             # Click Sign In button
             self.logger.info("Clicking Sign In button...")
-            signin_button = self.wait_for_element(By.CSS_SELECTOR, "button[data-testid='submit-password']", timeout=5)
-            
-            if not signin_button:
-                signin_button = self.safe_find_element(By.XPATH, "//button[contains(text(), 'Sign In')]")
-            
-            if not signin_button:
-                signin_button = self.safe_find_element(By.CSS_SELECTOR, "button[type='submit']")
+            signin_button, _ = self.find_with_fallbacks(
+                'sign_in', self.SIGNIN_LOCATORS, timeout=5, clickable=True, last_resort=self.GENERIC_SUBMIT_LOCATORS
+            )
             
             if signin_button:
+                login_url = self.driver.current_url
                 signin_button.click()
-                time.sleep(5)
+                self.waits.url_changes(login_url, replaces=5)
                 self.logger.info("Sign In button clicked")
                 self.save_screenshot("dice_after_signin")
             else:
                 self.logger.error("Sign In button not found")
-                self.save_screenshot("dice_no_signin_button")
+                self.save_screenshot("dice_no_signin_button", failure=True)
                 return False
             
             # Verify login success
             self.logger.info("Verifying login...")
-            time.sleep(3)
+            self.waits.url_contains_any(["home-feed", "dashboard"], replaces=3)
             
             current_url = self.driver.current_url.lower()
             if "home-feed" in current_url or "dashboard" in current_url:
                 self.logger.info("✓ Successfully logged into Dice.com!")
                 self.is_logged_in = True
+                self.persist_session()
                 return True
             else:
-                # Wait a bit more and check again
-                time.sleep(3)
+                # Give a slow redirect a bit more time to leave the login page
+                self.waits.url_excludes("login", replaces=3)
                 current_url = self.driver.current_url.lower()
                 if "login" not in current_url:
                     self.logger.info("✓ Login appears successful (not on login page)")
                     self.is_logged_in = True
+                    self.persist_session()
                     return True
                 else:
                     self.logger.error("✗ Login verification failed")
@@ -141,72 +225,262 @@ class DiceAdapter(BasePlatformAdapter):
                 
         except Exception as e:
             self.logger.error(f"Login error: {str(e)}")
-            self.save_screenshot("dice_login_exception")
+            self.save_screenshot("dice_login_exception", failure=True)
             return False
     
-    def search_jobs(self, keywords, location="Remote", max_results=50):
-        """Search for jobs on Dice.com - go directly to filtered URL (single page)"""
-        # This method is kept for compatibility but not used directly
-        # Use search_jobs_on_page instead for page-by-page processing
-        return self.search_jobs_on_page(1)
+    @property
+    def search_is_thread_safe(self):
+        return self.search_backend == 'http'
     
-    def search_jobs_on_page(self, page_num):
-        """Search for jobs on a specific page"""
-        try:
-            # Get search query from environment variable
-            search_query = os.getenv('DICE_SEARCH_QUERY', 'python')
+    def plan_queries(self):
+        """Plan the fewest Dice searches covering search_criteria (OR-keywords, one remote query)"""
+        planner = QueryPlanner(supports_or=True, supports_remote_filter=True)
+        
+        def page_history(query):
+            if not self.db:
+                return None
+            state = self.db.get_crawl_state(self.platform_name, page_key(self.build_search_url(1, query.query_text, query.location)))
+            return state['last_new_page'] if state else None
+        
+        queries = planner.plan(
+            self.config['search_criteria'],
+            search_pages=self.platform_config.get('search_pages', 3),
+            page_history=page_history
+        )
+        for query in queries:
+            query.url = self.build_search_url(1, query.query_text, query.location)
+        return queries
+    
+    def search_queries(self):
+        """Planned queries in search_mode 'planned', else the keyword x location cross-product"""
+        if self.platform_config.get('search_mode', 'single') == 'planned':
+            self.planned_queries = {(query.query_text, query.location): query for query in self.plan_queries()}
+            return list(self.planned_queries)
+        return super().search_queries()
+    
+    def search_planned_query(self, query):
+        """Page through a planned query, stopping at its page estimate unless the last page was still new
+        
+        Remembers the deepest page with jobs not in the database, which sets
+        the estimate for the next run.
+        """
+        jobs = []
+        last_new_page = None
+        for page_num in range(1, query.max_pages + 1):
+            if page_num > query.estimated_pages and last_new_page != page_num - 1:
+                break
             
-            # URL encode the search query (replace spaces with +)
-            encoded_query = search_query.replace(' ', '+')
+            page_jobs = self.search_jobs_on_page(page_num, query.query_text, query.location)
+            if not page_jobs:
+                break
+            jobs.extend(page_jobs)
             
-            # Build URL with page number
-            if page_num == 1:
-                filtered_url = f"https://www.dice.com/jobs?filters.workplaceTypes=Remote&q={encoded_query}"
-            else:
-                filtered_url = f"https://www.dice.com/jobs?filters.workplaceTypes=Remote&q={encoded_query}&page={page_num}"
+            if self.db:
+                job_ids = [job['job_id'] for job in page_jobs]
+                if len(self.db.known_job_ids(job_ids, self.platform_name)) < len(set(job_ids)):
+                    last_new_page = page_num
+        
+        if self.db and last_new_page:
+            try:
+                self.db.save_crawl_state(self.platform_name, page_key(query.url), last_new_page=last_new_page)
+            except Exception as e:
+                self.logger.error(f"Error saving crawl state: {str(e)}")
+        return jobs
+    
+    def search_jobs(self, keywords, location="Remote", max_results=50):
+        """Search one keyword/location query over up to search_pages result pages"""
+        planned = self.planned_queries.get((keywords, location))
+        if planned:
+            return self.search_planned_query(planned)
+        
+        return list(self.iter_jobs(keywords, location, max_results))
+    
+    def iter_jobs(self, keywords, location="Remote", max_results=50):
+        """Yield up to max_results jobs of one query, page after page, as they are parsed"""
+        max_pages = self.platform_config.get('search_pages', 3)
+        
+        found = 0
+        for page_num in range(1, max_pages + 1):
+            page_found = 0
+            for job in self.iter_jobs_on_page(page_num, keywords, location):
+                page_found += 1
+                found += 1
+                yield job
+                if found >= max_results:
+                    return
+            if not page_found:
+                return
+    
+    def build_search_url(self, page_num, keywords=None, location=None):
+        """Build the filtered search URL for a result page
+
+        Without keywords the DICE_SEARCH_QUERY environment variable is used.
+        A missing or "Remote" location uses the remote-workplace filter;
+        any other location is passed as Dice's location parameter.
+        """
+        # Get search query from environment variable
+        search_query = keywords or os.getenv('DICE_SEARCH_QUERY', 'python')
+        
+        # URL encode the search query (replace spaces with +)
+        encoded_query = quote_plus(search_query)
+        
+        if not location or location.strip().lower() == 'remote':
+            url = f"{self.SEARCH_URL}?filters.workplaceTypes=Remote&q={encoded_query}"
+        else:
+            url = f"{self.SEARCH_URL}?q={encoded_query}&location={quote_plus(location)}"
+        
+        # Build URL with page number
+        if page_num == 1:
+            return url
+        return f"{url}&page={page_num}"
+    
+    def search_jobs_on_page(self, page_num, keywords=None, location=None):
+        """Search for jobs on a specific page
+
+        Returns the page's jobs, or None when pagination should stop.
+        """
+        return list(self.iter_jobs_on_page(page_num, keywords, location)) or None
+    
+    def iter_jobs_on_page(self, page_num, keywords=None, location=None):
+        """Yield the jobs on a specific result page as each card is parsed
+
+        Yields nothing when pagination should stop. With card_extraction
+        'elements' the cards are live WebElements, so the page must be
+        consumed before the browser is used for anything else.
+        """
+        if self.search_backend == 'http':
+            yield from self.iter_jobs_on_page_http(page_num, keywords, location)
+            return
+        
+        found = 0
+        try:
+            filtered_url = self.build_search_url(page_num, keywords, location)
             
             self.logger.info(f"Navigating to page {page_num}: {filtered_url}")
+            self.use_resource_phase('search')
             self.driver.get(filtered_url)
-            time.sleep(4)
+            self.waits.dom_ready(replaces=4)
             
             # Check if we got redirected (means no more pages)
             current_url = self.driver.current_url
             if page_num > 1 and f"page={page_num}" not in current_url:
                 self.logger.info(f"Redirected from page {page_num}, no more pages available.")
-                return None  # Signal that pagination should stop
+                return  # Signal that pagination should stop
             
+            # Cards are rendered client-side after the document itself is ready
+            self.waits.element(By.CSS_SELECTOR, "div[data-testid='job-card']")
             self.save_screenshot(f"search_results_page_{page_num}")
+            self.record_page("search_results")
             
             # Extract job listings from current page
+            if self.platform_config.get('card_extraction', 'source') == 'source':
+                for job_data in self.extract_jobs_from_source():
+                    found += 1
+                    yield job_data
+                
+                if not found:
+                    self.logger.info(f"No job cards found on page {page_num}.")
+                    return  # Signal that pagination should stop
+                
+                self.logger.info(f"✓ Page {page_num} complete. Found {found} jobs on this page")
+                return
+            
             job_cards = self.driver.find_elements(By.CSS_SELECTOR, "div[data-testid='job-card']")
             
             if not job_cards:
                 self.logger.info(f"No job cards found on page {page_num}.")
-                return None  # Signal that pagination should stop
+                return  # Signal that pagination should stop
             
             self.logger.info(f"Found {len(job_cards)} job cards on page {page_num}")
             
-            page_jobs = []
             for idx, card in enumerate(job_cards):
                 try:
                     job_data = self.extract_job_details(card)
-                    if job_data:
-                        page_jobs.append(job_data)
-                        self.logger.info(f"Extracted job {idx + 1}: {job_data.get('title', 'Unknown')}")
                 except Exception as e:
                     self.logger.error(f"Error extracting job: {str(e)}")
                     continue
+                if job_data:
+                    found += 1
+                    self.logger.info(f"Extracted job {idx + 1}: {job_data.get('title', 'Unknown')}")
+                    yield job_data
             
-            self.logger.info(f"✓ Page {page_num} complete. Found {len(page_jobs)} jobs on this page")
-            return page_jobs
+            self.logger.info(f"✓ Page {page_num} complete. Found {found} jobs on this page")
             
         except Exception as e:
             self.logger.error(f"Error searching jobs on page {page_num}: {str(e)}")
-            self.save_screenshot("search_error")
-            return None
+            self.save_screenshot("search_error", failure=True)
+    
+    def iter_jobs_on_page_http(self, page_num, keywords=None, location=None):
+        """Yield the jobs on a specific page without a browser"""
+        found = 0
+        try:
+            with self.search_client_lock:
+                if not self.search_client:
+                    self.search_client = DiceHttpSearchClient(
+                        self.logger,
+                        pool_size=max(self.platform_config.get('http_pool_size', 4),
+                                      self.platform_config.get('search_concurrency', 4))
+                    )
+                    if self.recorder:
+                        self.search_client.on_page = lambda url, page_html: self.record_html(url, page_html, "search_results")
+            
+            for job_data in self.search_client.iter_page(self.build_search_url(page_num, keywords, location), page_num):
+                found += 1
+                yield job_data
+            
+            if found:
+                self.logger.info(f"✓ Page {page_num} complete. Found {found} jobs on this page")
+            
+        except Exception as e:
+            self.logger.error(f"Error searching jobs on page {page_num} over HTTP: {str(e)}")
+    
+    def ensure_browser(self):
+        """Start Chrome and log in, if not done yet"""
+        self.init_driver()
+        return self.login()
+    
+    def close_driver(self):
+        """Close the WebDriver, the HTTP search client and the detail cache"""
+        super().close_driver()
+        if self.search_client:
+            self.search_client.close()
+            self.search_client = None
+        if self.detail_cache:
+            self.detail_cache.log_summary()
+            self.detail_cache.close()
+            self.detail_cache = None
+    
+    def enrich_job(self, job):
+        """Fill description/requirements from the job detail page, fetched through the HTTP cache"""
+        if not self.platform_config.get('fetch_job_details', False) or not job.get('url'):
+            return job
+        
+        if self.detail_cache is None:
+            self.detail_cache = HttpCache(self.config.get('http_cache'), self.logger)
+        
+        try:
+            page_html = self.detail_cache.get(job['url'])
+            if page_html:
+                details = parse_job_detail(page_html)
+                if details['description']:
+                    job['description'] = details['description']
+                if details['requirements']:
+                    job['requirements'] = details['requirements']
+        except Exception as e:
+            self.logger.warning(f"Could not fetch job details for {job['url']}: {str(e)}")
+        
+        return job
+    
+    def extract_jobs_from_source(self):
+        """Yield every job card on the current page from a single page_source read
+        
+        Replaces the per-card find_element/get_attribute round-trips of
+        extract_job_details with one WebDriver call plus an lxml parse.
+        """
+        return iter_job_cards(self.driver.page_source, self.driver.current_url)
     
     def extract_job_details(self, card_element):
-        """Extract job details from a job card element"""
+        """Extract a JobRecord from a job card element"""
         try:
             job_data = {}
             
@@ -252,10 +526,8 @@ class DiceAdapter(BasePlatformAdapter):
             except:
                 job_data['job_id'] = None
             
-            # Store the card element reference for later clicking
-            job_data['_card_element'] = card_element
-            
-            return job_data
+            # Plain values only: the card element goes stale once the page changes
+            return JobRecord.from_dict(job_data)
             
         except Exception as e:
             self.logger.error(f"Error extracting job details: {str(e)}")
@@ -280,21 +552,21 @@ class DiceAdapter(BasePlatformAdapter):
             self.logger.info(f"Using resume: {resume_filename}")
             
             # Navigate to job page
+            self.use_resource_phase('apply')
             self.driver.get(job_url)
-            time.sleep(3)
+            self.waits.dom_ready(replaces=3)
             self.save_screenshot("job_detail_page")
+            self.record_page("job_detail")
             
-            # Look for Easy Apply button (custom web component)
+            # Look for Easy Apply button (custom web component, or a plain button)
             easy_apply_button = None
             try:
-                # Try the custom web component selector first
-                easy_apply_button = self.wait_for_element(By.CSS_SELECTOR, "apply-button-wc", timeout=5)
-                if not easy_apply_button:
-                    # Try traditional button selectors
-                    easy_apply_button = self.wait_for_element(By.CSS_SELECTOR, "button.btn-primary", timeout=5)
-                    if not easy_apply_button or "Easy apply" not in easy_apply_button.text:
-                        # Try alternative selectors
-                        easy_apply_button = self.wait_for_element(By.XPATH, "//button[contains(., 'Easy Apply') or contains(., 'Easy apply')]", timeout=5)
+                easy_apply_button, _ = self.find_with_fallbacks(
+                    'easy_apply',
+                    self.EASY_APPLY_LOCATORS,
+                    timeout=5,
+                    accept=lambda element: element.tag_name.lower() != 'button' or 'easy apply' in element.text.lower()
+                )
             except:
                 self.logger.warning("Easy Apply button not found - skipping to next job")
                 return False
@@ -305,8 +577,9 @@ class DiceAdapter(BasePlatformAdapter):
             
             easy_apply_button.click()
             self.logger.info("Clicked Easy Apply button")
-            time.sleep(3)
+            self.waits.network_idle(replaces=3)
             self.save_screenshot("apply_form_opened")
+            self.record_page("apply_form")
             
             # Check if Replace button exists - if not, job may already be applied
             replace_clicked = False
@@ -314,30 +587,15 @@ class DiceAdapter(BasePlatformAdapter):
             
             try:
                 # Try to find Replace button/link
-                replace_selectors = [
-                    "button.file-remove",
-                    "//button[contains(@class, 'file-remove')]",
-                    "//span[contains(@class, 'file-remove-subtext')]",
-                    "//span[contains(., 'Replace')]",
-                    "//button[contains(., 'Replace')]",
-                    ".file-remove-subtext"
-                ]
-                
-                for selector in replace_selectors:
+                replace_button, _ = self.find_with_fallbacks('replace', self.REPLACE_LOCATORS, timeout=2)
+                if replace_button:
                     try:
-                        if selector.startswith("//"):
-                            replace_button = self.wait_for_element(By.XPATH, selector, timeout=2, silent=True)
-                        else:
-                            replace_button = self.wait_for_element(By.CSS_SELECTOR, selector, timeout=2, silent=True)
-                        
-                        if replace_button:
-                            replace_button.click()
-                            self.logger.info("Clicked Replace button")
-                            replace_clicked = True
-                            time.sleep(2)
-                            break
+                        replace_button.click()
+                        self.logger.info("Clicked Replace button")
+                        replace_clicked = True
+                        self.waits.element(By.CSS_SELECTOR, "input[type='file']", replaces=2)
                     except:
-                        continue
+                        pass
                 
                 if not replace_clicked:
                     self.logger.info("Replace button not found, checking if resume already uploaded...")
@@ -369,25 +627,17 @@ class DiceAdapter(BasePlatformAdapter):
                     abs_resume_path = os.path.abspath(resume_path)
                     file_input.send_keys(abs_resume_path)
                     self.logger.info(f"Resume selected: {abs_resume_path}")
-                    time.sleep(2)
+                    self.waits.element(By.CSS_SELECTOR, "span.fsp-button-upload, span[data-e2e='upload']", replaces=2)
                     
                     # Click Upload button
-                    upload_button = None
-                    try:
-                        # Try specific selectors for the upload button
-                        upload_button = self.driver.find_element(By.CSS_SELECTOR, "span.fsp-button-upload")
-                    except:
-                        try:
-                            upload_button = self.driver.find_element(By.CSS_SELECTOR, "span[data-e2e='upload']")
-                        except:
-                            # Fallback to text-based search
-                            upload_button = self.wait_for_element(By.XPATH, "//span[contains(., 'Upload')]", timeout=5)
+                    upload_button, _ = self.find_with_fallbacks('upload', self.UPLOAD_LOCATORS, timeout=5)
                     
                     if upload_button:
                         upload_button.click()
                         self.logger.info("Clicked Upload button")
-                        time.sleep(3)
+                        self.waits.staleness(upload_button, replaces=3)
                         self.save_screenshot("resume_uploaded")
+                        self.record_page("apply_resume_uploaded")
                     else:
                         self.logger.warning("Upload button not found - skipping to next job")
                         return False
@@ -396,42 +646,37 @@ class DiceAdapter(BasePlatformAdapter):
                     return False
             except Exception as e:
                 self.logger.warning(f"Error uploading resume: {str(e)} - skipping to next job")
-                self.save_screenshot("upload_error")
+                self.save_screenshot("upload_error", failure=True)
                 return False
             
             # Click Next button
             try:
-                next_button = self.wait_for_element(By.CSS_SELECTOR, "button.btn-next", timeout=5)
-                if not next_button:
-                    next_button = self.wait_for_element(By.XPATH, "//button[contains(., 'Next')]", timeout=5)
+                next_button, _ = self.find_with_fallbacks('next', self.NEXT_LOCATORS, timeout=5)
                 
                 if next_button:
                     next_button.click()
                     self.logger.info("Clicked Next button")
-                    time.sleep(3)
+                    self.waits.element(By.XPATH, "//button[contains(., 'Submit')]", replaces=3)
                     self.save_screenshot("after_next")
+                    self.record_page("apply_after_next")
             except Exception as e:
                 self.logger.warning(f"Could not find/click Next button: {str(e)} - will try to submit anyway")
             
             # Click Submit button
             try:
-                submit_button = None
-                try:
-                    # Try specific selector for Submit button with seds-button-primary class
-                    submit_button = self.driver.find_element(By.CSS_SELECTOR, "button.seds-button-primary")
-                except:
-                    try:
-                        # Try button containing Submit text
-                        submit_button = self.driver.find_element(By.XPATH, "//button[contains(., 'Submit')]")
-                    except:
-                        # Fallback to generic submit button
-                        submit_button = self.wait_for_element(By.CSS_SELECTOR, "button[type='submit']", timeout=5)
+                submit_button, _ = self.find_with_fallbacks(
+                    'submit', self.SUBMIT_LOCATORS, timeout=5, last_resort=self.GENERIC_SUBMIT_LOCATORS
+                )
                 
                 if submit_button:
+                    # Every earlier bail-out (already applied, no Easy Apply) costs no slot
+                    if not self.acquire_apply_slot():
+                        return False
                     submit_button.click()
                     self.logger.info("Clicked Submit button")
-                    time.sleep(3)
+                    self.waits.staleness(submit_button, replaces=3)
                     self.save_screenshot("application_submitted")
+                    self.record_page("apply_submitted")
                     self.logger.info("✓ Application submitted successfully")
                     
                     # Close the application tab/window if opened in new tab
@@ -449,12 +694,12 @@ class DiceAdapter(BasePlatformAdapter):
                     return False
             except Exception as e:
                 self.logger.warning(f"Error clicking Submit button: {str(e)} - skipping to next job")
-                self.save_screenshot("submit_error")
+                self.save_screenshot("submit_error", failure=True)
                 return False
             
         except Exception as e:
             self.logger.warning(f"Error applying to job: {str(e)} - skipping to next job")
-            self.save_screenshot("apply_error")
+            self.save_screenshot("apply_error", failure=True)
             
             # Try to return to original window
             try:
@@ -466,75 +711,459 @@ class DiceAdapter(BasePlatformAdapter):
             
             return False
     
+    def process_job(self, job, pool=None, deferred=None, seen=None):
+        """Dedup, save and apply to (or queue) a single job; returns True if applied here
+
+        With a deferred queue the job waits there for a rate-limiter slot
+        instead of blocking, see apply_deferred. seen is the set of stored
+        job_ids from dedup_page; the job is then known not to be applied to
+        yet and no per-job queries are made.
+
+        A job is saved here only when it goes into a durable queue (which
+        keeps it across runs); otherwise apply_and_record saves it when it is
+        applied to, so a job dropped on the daily budget does not count as
+        known to the next incremental crawl.
+        """
+        if seen is None:
+            # Check if already applied
+            if self.check_duplicate(job['job_id']):
+                self.logger.info("Already applied to this job. Skipping.")
+                return False
+            exists = None
+        else:
+            exists = job['job_id'] in seen
+        
+        if not self.claim_job(job['job_id']):
+            self.logger.info("Job already queued in this run. Skipping.")
+            return False
+        
+        # Save job to database
+        if not exists:
+            self.enrich_job(job)
+        if pool:
+            durable = pool.work_queue is not None
+        else:
+            durable = getattr(deferred, 'durable', False)
+        if durable:
+            self.save_job(job, exists=exists)
+            exists = True
+        # Carried to apply_and_record (also in a pool worker), which saves without a lookup
+        job['stored'] = exists
+        
+        # Hand off to the worker pool, or apply on this browser
+        if pool:
+            pool.submit(job)
+            return False
+        
+        if deferred is not None:
+            deferred.append(job)
+            return False
+        
+        if not self.driver:
+            self.ensure_browser()
+        
+        return self.apply_and_record(job)
+    
+    def apply_deferred(self, deferred, wait=False):
+        """Apply to queued jobs while the rate limiter has slots; returns the number applied
+
+        Without wait this returns as soon as the next slot is in the future,
+        so the caller can go back to searching in the meantime. deferred is
+        a deque, or an ApplyWorkQueue whose jobs outlive the run.
+        """
+        durable = getattr(deferred, 'durable', False)
+        applied = 0
+        skipped = []
+        while deferred:
+            if self.rate_limiter.budget_exhausted():
+                if durable:
+                    self.logger.info(f"Daily application limit reached. Keeping {len(deferred)} queued jobs for the next run.")
+                else:
+                    self.logger.info(f"Daily application limit reached. Dropping {len(deferred)} queued jobs.")
+                    self.dropped_jobs += len(deferred)
+                deferred.clear()
+                break
+            
+            if not wait and not self.rate_limiter.ready():
+                self.rate_limiter.deferred += 1
+                break
+            
+            try:
+                job = deferred.popleft()
+            except IndexError:
+                break
+            if not self.driver:
+                self.ensure_browser()
+            success = self.apply_and_record(job)
+            if success is None:
+                # Not tried (cooldown, budget): stays leased until the loop ends, then goes back
+                skipped.append(job)
+                continue
+            if durable:
+                deferred.complete(job, success)
+            if success:
+                applied += 1
+        
+        if durable:
+            for job in skipped:
+                deferred.release(job)
+        return applied
+    
+    def screen_page(self, page_num, jobs, seen, incremental=None):
+        """Batch-dedup a result page before any of its jobs are saved
+
+        Adds the page's stored job_ids to seen and returns (pending, keep_going):
+        the jobs not applied to yet, and whether the incremental crawl wants
+        the next page.
+        """
+        pending, page_seen = self.dedup_page(jobs)
+        seen.update(page_seen)
+        # Jobs an earlier page already queued or applied to in this run
+        pending = [job for job in pending if not self.is_claimed(job['job_id'])]
+        
+        keep_going = incremental.observe_page(page_num, jobs, known=page_seen) if incremental else True
+        return pending, keep_going
+    
+    def match_jobs(self, jobs, counts=None):
+        """Yield the jobs to apply to, screened by JobMatcher when match_filter is on
+        
+        Lazy: each job reaches dedup, save and apply as soon as it is read.
+        counts['found'] is bumped for every job read, matching or not.
+        """
+        if self.platform_config.get('match_filter', False):
+            if self.matcher is None:
+                self.matcher = JobMatcher(self.config)
+            return self.matcher.filter_stream(self.count_jobs(jobs, counts))
+        return self.count_jobs(jobs, counts)
+    
+    @staticmethod
+    def count_jobs(jobs, counts):
+        for job in jobs:
+            if counts is not None:
+                counts['found'] += 1
+            yield job
+    
+    def streams_jobs(self, shared_browser=True):
+        """Whether run() hands each job on as soon as its card is parsed
+        
+        Needs batch_dedup and the incremental crawl off, since both screen a
+        whole page at once. When the searching browser also applies, cards
+        must come from one page_source snapshot (or HTTP), not from live
+        WebElements that go stale once the browser navigates.
+        """
+        if self.platform_config.get('batch_dedup', True):
+            return False
+        if (self.platform_config.get('incremental', {}) or {}).get('enabled', False):
+            return False
+        if shared_browser and self.search_backend != 'http':
+            return self.platform_config.get('card_extraction', 'source') == 'source'
+        return True
+    
+    def start_incremental_crawl(self):
+        """Return an IncrementalCrawl for the current search, or None when disabled"""
+        incremental_config = self.platform_config.get('incremental', {}) or {}
+        if not incremental_config.get('enabled', False):
+            return None
+        
+        # Keyed by path + query so replayed and live runs share state
+        query = page_key(self.build_search_url(1))
+        return IncrementalCrawl(self.db, self.platform_name, query, incremental_config, self.logger)
+    
+    def run_fan_out(self, search_only=False):
+        """Search every configured keyword/location query and apply to the merged results
+
+        Queries run concurrently over HTTP (sequentially on the browser); each
+        job reaches the apply stage once, however many queries returned it.
+        """
+        pool = None
+        try:
+            if self.search_backend != 'http':
+                self.ensure_browser()
+            
+            total_jobs_found = 0
+            total_applications = 0
+            deferred = deque()
+            seen = set()
+            self.claimed_jobs.clear()
+            self.dropped_jobs = 0
+            
+            apply_workers = int(self.platform_config.get('apply_workers', 1) or 1)
+            if not search_only and apply_workers > 1:
+                pool = ApplyWorkerPool(self, apply_workers, max_applications=self.application_budget())
+                pool.start()
+            
+            fan_out = self.fan_out_search()
+            for batch in fan_out.batches():
+                total_jobs_found += len(batch)
+                pending, _ = self.screen_page(0, batch, seen)
+                
+                if search_only:
+                    for job in pending:
+                        if job['job_id'] not in seen:
+                            self.save_job(self.enrich_job(job), exists=False)
+                    continue
+                
+                for job in self.match_jobs(pending):
+                    self.process_job(job, pool, deferred=None if pool else deferred, seen=seen)
+                    total_applications += self.apply_deferred(deferred)
+                
+                if pool and pool.budget_exhausted():
+                    self.logger.info("Application budget reached. Stopping search.")
+                    break
+            
+            fan_out.log_summary()
+            
+            if deferred:
+                self.logger.info(f"Applying to {len(deferred)} queued jobs...")
+                total_applications += self.apply_deferred(deferred, wait=True)
+            
+            if pool:
+                total_applications = pool.close()['applied']
+                pool = None
+            
+            self.logger.info(f"Session complete: Found {total_jobs_found} unique jobs, Applied to {total_applications}")
+            return {
+                'jobs_found': total_jobs_found,
+                'applications_submitted': total_applications
+            }
+        
+        except Exception as e:
+            self.logger.error(f"Error in run: {str(e)}")
+            raise
+        finally:
+            if pool:
+                pool.close(wait=False)
+            self.close_driver()
+    
     def run(self, search_only=False):
         """Override run method to process jobs page by page"""
+        if self.platform_config.get('search_mode', 'single') in ('fan_out', 'planned'):
+            return self.run_fan_out(search_only)
+        
+        pool = None
+        pipeline = None
+        search_stage = None
+        incremental = None
+        crawl_completed = True
         try:
-            self.init_driver()
-            self.login()
+            # With the HTTP search backend Chrome is only needed for applying
+            if self.search_backend != 'http':
+                self.ensure_browser()
             
             total_jobs_found = 0
             total_applications = 0
             max_pages = 30
+            page_num = 0
+            
+            # Durable apply queue: jobs queued by an interrupted run are applied first
+            work_queue_config = self.platform_config.get('work_queue', {}) or {}
+            resume = work_queue_config.get('enabled', False) and self.db is not None
+            pipeline_config = self.platform_config.get('pipeline', {}) or {}
+            pipelined = not search_only and pipeline_config.get('enabled', False)
+            if resume and pipelined:
+                # The pipeline applies inline and has no page cursor to checkpoint
+                self.logger.warning(
+                    "work_queue is not supported with pipeline enabled: this run is not crash-safe "
+                    "(no durable apply queue, no crawl checkpoint). Disable one of them."
+                )
+                resume = False
+            work_queue = None
+            if resume and not search_only:
+                work_queue = ApplyWorkQueue(self.db, self.platform_name, work_queue_config, self.logger)
+            
+            # Optional pool of parallel, independently logged-in apply browsers
+            apply_workers = int(self.platform_config.get('apply_workers', 1) or 1)
+            if not search_only and apply_workers > 1:
+                pool = ApplyWorkerPool(self, apply_workers, max_applications=self.application_budget(),
+                                       work_queue=work_queue)
+                pool.start()
             
-            self.logger.info(f"Starting page-by-page job application process...")
+            incremental = self.start_incremental_crawl()
+            deferred = deque()
+            seen = set()
+            self.claimed_jobs.clear()
+            self.dropped_jobs = 0
             
-            # Process pages 1 through 30
-            for page_num in range(1, max_pages + 1):
-                self.logger.info(f"\n{'='*60}")
-                self.logger.info(f"PROCESSING PAGE {page_num}")
-                self.logger.info(f"{'='*60}")
+            if work_queue and pool:
+                resubmitted = pool.resubmit_queued()
+                if resubmitted:
+                    self.logger.info(f"Handed {resubmitted} jobs queued by an earlier run to the apply pool")
+            elif work_queue:
+                deferred = work_queue
+                if deferred:
+                    self.logger.info(f"Applying to {len(deferred)} jobs queued by an earlier run...")
+                    total_applications += self.apply_deferred(deferred)
+            
+            if pipelined:
+                self.logger.info("Starting pipelined search/apply process...")
                 
-                # Search jobs on this page
-                jobs = self.search_jobs_on_page(page_num)
+                # The search stage needs its own browser unless it runs over HTTP
+                if self.search_backend == 'http':
+                    search_stage = self
+                else:
+                    search_stage = self.spawn_worker('search')
+                    search_stage.init_driver()
                 
-                # Check if pagination should stop
-                if jobs is None:
-                    self.logger.info(f"No more pages available. Stopping at page {page_num - 1}.")
-                    break
+                # Without page screening each job is queued as soon as its card is parsed
+                stream = self.streams_jobs(shared_browser=False)
+                pipeline = SearchApplyPipeline(
+                    search_stage.iter_jobs_on_page if stream else search_stage.search_jobs_on_page,
+                    max_pages,
+                    self.logger,
+                    queue_size=pipeline_config.get('queue_size', 20),
+                    on_page=None if stream else (lambda page_num, jobs: self.screen_page(page_num, jobs, seen, incremental))
+                )
+                pipeline.start()
                 
-                if len(jobs) == 0:
-                    self.logger.info(f"No jobs found on page {page_num}. Stopping pagination.")
-                    break
+                for idx, job in enumerate(self.match_jobs(pipeline), 1):
+                    self.logger.info(f"\n--- Job {idx} (search stage at page {pipeline.pages_searched}) ---")
+                    if self.process_job(job, pool, seen=None if stream else seen):
+                        total_applications += 1
+                    
+                    if pool and pool.budget_exhausted():
+                        self.logger.info("Application budget reached. Stopping pipeline.")
+                        crawl_completed = False
+                        break
                 
-                total_jobs_found += len(jobs)
-                self.logger.info(f"Found {len(jobs)} jobs on page {page_num}")
+                pipeline.stop()
+                total_jobs_found = pipeline.jobs_found
+                page_num = pipeline.pages_searched
+            else:
+                self.logger.info("Starting page-by-page job application process...")
+                
+                # Continue an interrupted crawl from its checkpoint
+                checkpoint = None
+                start_page = 1
+                if resume:
+                    checkpoint = ResumableCrawl(
+                        self.db, self.platform_name, page_key(self.build_search_url(1)), work_queue_config, self.logger
+                    )
+                    start_page = checkpoint.start_page()
+                
+                # Without page screening each job is handled as soon as its card is parsed
+                stream = self.streams_jobs()
                 
-                if not search_only:
-                    # Apply to each job on this page
-                    page_applications = 0
-                    for idx, job in enumerate(jobs, 1):
-                        self.logger.info(f"\n--- Job {idx}/{len(jobs)} on page {page_num} ---")
+                # Process pages 1 through 30
+                for page_num in range(start_page, max_pages + 1):
+                    self.logger.info(f"\n{'='*60}")
+                    self.logger.info(f"PROCESSING PAGE {page_num}")
+                    self.logger.info(f"{'='*60}")
+                    
+                    if stream:
+                        # Per-job dedup (seen=None) instead of one query per page
+                        pending = self.iter_jobs_on_page(page_num)
+                        page_seen = None
+                        keep_going = True
+                    else:
+                        # Search jobs on this page
+                        jobs = self.search_jobs_on_page(page_num)
                         
-                        # Check if already applied
-                        if self.check_duplicate(job['job_id']):
-                            self.logger.info(f"Already applied to this job. Skipping.")
-                            continue
+                        # Check if pagination should stop
+                        if jobs is None:
+                            self.logger.info(f"No more pages available. Stopping at page {page_num - 1}.")
+                            break
+                        
+                        if len(jobs) == 0:
+                            self.logger.info(f"No jobs found on page {page_num}. Stopping pagination.")
+                            break
                         
-                        # Save job to database
-                        self.save_job(job)
+                        total_jobs_found += len(jobs)
+                        self.logger.info(f"Found {len(jobs)} jobs on page {page_num}")
                         
-                        # Apply to job
-                        try:
-                            success = self.apply_to_job(job['url'], job)
-                            if success:
-                                page_applications += 1
-                                total_applications += 1
-                                self.save_application(job['job_id'], success=True)
+                        # Screened before this page's jobs are saved
+                        pending, keep_going = self.screen_page(page_num, jobs, seen, incremental)
+                        page_seen = seen
+                    
+                    page_found = 0
+                    if search_only:
+                        for job in pending:
+                            page_found += 1
+                            if page_seen is None:
+                                exists = self.db.job_exists(job['job_id'], self.platform_name)
                             else:
-                                self.save_application(job['job_id'], success=False, error_message="Application failed")
-                        except Exception as e:
-                            self.logger.error(f"Error applying to job: {str(e)}")
-                            self.save_application(job['job_id'], success=False, error_message=str(e))
+                                exists = job['job_id'] in page_seen
+                            if not exists:
+                                self.save_job(self.enrich_job(job), exists=False)
+                    else:
+                        # Apply to each job on this page
+                        page_applications = 0
+                        page_counts = {'found': 0}
+                        for idx, job in enumerate(self.match_jobs(pending, page_counts), 1):
+                            self.logger.info(f"\n--- Job {idx} on page {page_num} ---")
+                            self.process_job(job, pool, deferred=None if pool else deferred, seen=page_seen)
+                            applied = self.apply_deferred(deferred)
+                            page_applications += applied
+                            total_applications += applied
+                        page_found = page_counts['found']
                     
-                    self.logger.info(f"\n✓ Page {page_num} complete: Applied to {page_applications}/{len(jobs)} jobs")
-                    self.logger.info(f"Session totals so far: {total_jobs_found} jobs found, {total_applications} applications submitted")
+                    if stream:
+                        if not page_found:
+                            self.logger.info(f"No jobs found on page {page_num}. Stopping pagination.")
+                            break
+                        total_jobs_found += page_found
+                    else:
+                        page_found = len(jobs)
+                    
+                    if not search_only:
+                        if pool:
+                            self.logger.info(f"\n✓ Page {page_num} complete: Queued jobs for the apply pool")
+                            if pool.budget_exhausted():
+                                self.logger.info("Application budget reached. Stopping pagination.")
+                                crawl_completed = False
+                                break
+                        else:
+                            self.logger.info(f"\n✓ Page {page_num} complete: Applied to {page_applications}/{page_found} jobs")
+                            self.logger.info(f"Session totals so far: {total_jobs_found} jobs found, {total_applications} applications submitted")
+                            if deferred:
+                                self.logger.info(
+                                    f"{len(deferred)} jobs waiting for an application slot "
+                                    f"(next in {self.rate_limiter.wait_time():.0f}s), continuing search"
+                                )
+                            if self.rate_limiter.budget_exhausted():
+                                self.logger.info("Daily application limit reached. Stopping pagination.")
+                                crawl_completed = False
+                                break
+                    
+                    # Every job of this page is saved (and queued), so a restart can skip it
+                    if checkpoint:
+                        checkpoint.page_done(page_num)
+                    
+                    if not keep_going:
+                        self.logger.info(f"Incremental crawl: stopping after page {page_num}.")
+                        break
+                
+                # A crawl cut short by the budget resumes from its checkpoint next run
+                if checkpoint and crawl_completed:
+                    checkpoint.finish()
+            
+            # Search is done; wait out the spacing for jobs still queued
+            if deferred:
+                self.logger.info(f"Applying to {len(deferred)} queued jobs...")
+                total_applications += self.apply_deferred(deferred, wait=True)
+            
+            if pool:
+                pool_stats = pool.close()
+                pool = None
+                total_applications = pool_stats['applied']
+                if pool_stats['skipped']:
+                    crawl_completed = False
+            
+            # Jobs found but not applied to must be found again: keep the old high-water mark
+            if incremental:
+                incremental.finish(completed=crawl_completed and not self.dropped_jobs)
             
             self.logger.info(f"\n{'='*60}")
-            self.logger.info(f"SESSION COMPLETE")
+            self.logger.info("SESSION COMPLETE")
             self.logger.info(f"{'='*60}")
-            self.logger.info(f"Total pages processed: {page_num if jobs is None else page_num}")
+            self.logger.info(f"Total pages processed: {page_num}")
             self.logger.info(f"Total jobs found: {total_jobs_found}")
             self.logger.info(f"Total applications submitted: {total_applications}")
+            limiter_stats = self.rate_limiter.summary()
+            self.logger.info(
+                f"Rate limiter: {limiter_stats['granted']} slots granted, "
+                f"{limiter_stats['waited_seconds']:.0f}s waited, {limiter_stats['deferred']} deferrals, "
+                f"{limiter_stats['remaining_today'] if limiter_stats['remaining_today'] is not None else 'unlimited'} left today"
+            )
             
             return {
                 'jobs_found': total_jobs_found,
@@ -545,4 +1174,10 @@ class DiceAdapter(BasePlatformAdapter):
             self.logger.error(f"Error in run: {str(e)}")
             raise
         finally:
+            if pipeline:
+                pipeline.stop()
+            if search_stage and search_stage is not self:
+                search_stage.close_driver()
+            if pool:
+                pool.close(wait=False)
             self.close_driver()
@@ -0,0 +1,149 @@
+"""
+HTML parsing for Dice.com pages (no browser required)
+"""
+
+import json
+from io import BytesIO
+from urllib.parse import urljoin
+from lxml import etree, html as lxml_html
+from src.database.records import JobRecord
+
+
+JOB_CARD_XPATH = "//div[@data-testid='job-card']"
+TITLE_XPATH = ".//a[@data-testid='job-search-job-detail-link']"
+COMPANY_XPATH = ".//a[contains(@href, 'company-profile')]"
+LOCATION_XPATH = ".//p[contains(text(), 'Remote') or contains(text(), 'Hybrid')]"
+SALARY_XPATH = ".//p[@id='salary-label']"
+DESCRIPTION_XPATH = ".//p[contains(concat(' ', normalize-space(@class), ' '), ' line-clamp-2 ')]"
+
+
+def _text(element):
+    """Return the whitespace-normalised text of an element, like WebElement.text"""
+    return ' '.join(''.join(element.itertext()).split())
+
+
+def _first(card, xpath):
+    """Return the first element matching xpath inside card, or None"""
+    matches = card.xpath(xpath)
+    return matches[0] if matches else None
+
+
+def parse_job_card(card, base_url):
+    """Extract the same JobRecord as DiceAdapter.extract_job_details from an lxml card node"""
+    title_elem = _first(card, TITLE_XPATH)
+    if title_elem is None:
+        return None
+
+    href = title_elem.get('href')
+    company_elem = _first(card, COMPANY_XPATH)
+    location_elem = _first(card, LOCATION_XPATH)
+    salary_elem = _first(card, SALARY_XPATH)
+    desc_elem = _first(card, DESCRIPTION_XPATH)
+
+    return JobRecord(
+        job_id=card.get('data-id'),
+        title=_text(title_elem),
+        url=urljoin(base_url, href) if href else None,
+        company=_text(company_elem) if company_elem is not None else "Unknown",
+        location=_text(location_elem) if location_elem is not None else "Not specified",
+        salary=_text(salary_elem) if salary_elem is not None else None,
+        description=_text(desc_elem) if desc_elem is not None else ""
+    )
+
+
+def iter_job_cards(page_html, base_url):
+    """Yield the job dict of each card on a Dice search results page as soon as it is parsed
+
+    The page is parsed incrementally and every card is discarded once read,
+    so the partial tree never holds more than one card.
+    """
+    if not page_html:
+        return
+
+    if isinstance(page_html, str):
+        source, encoding = page_html.encode('utf-8'), 'utf-8'
+    else:
+        source, encoding = page_html, None
+
+    for _, element in etree.iterparse(BytesIO(source), events=('end',), tag='div', html=True, encoding=encoding):
+        if element.get('data-testid') != 'job-card':
+            continue
+
+        job_data = parse_job_card(element, base_url)
+
+        element.clear(keep_tail=True)
+        while element.getprevious() is not None:
+            del element.getparent()[0]
+
+        if job_data:
+            yield job_data
+
+
+def parse_job_cards(page_html, base_url):
+    """Parse every job card on a Dice search results page"""
+    return list(iter_job_cards(page_html, base_url))
+
+
+DETAIL_JSON_LD_XPATH = "//script[@type='application/ld+json']"
+DETAIL_DESCRIPTION_XPATH = "//div[@data-testid='jobDescriptionHtml']"
+DETAIL_SKILLS_XPATH = "//div[@data-testid='skillsList']//span"
+
+
+def _html_to_text(fragment):
+    """Convert an HTML fragment (e.g. a JSON-LD description) to plain text"""
+    if not fragment:
+        return ""
+    try:
+        return ' '.join(lxml_html.fromstring(f"<div>{fragment}</div>").text_content().split())
+    except Exception:
+        return ' '.join(fragment.split())
+
+
+def _job_posting(tree):
+    """Return the JobPosting object from the page's JSON-LD, if any"""
+    for script in tree.xpath(DETAIL_JSON_LD_XPATH):
+        try:
+            data = json.loads(script.text_content())
+        except ValueError:
+            continue
+        for item in data if isinstance(data, list) else [data]:
+            if isinstance(item, dict) and item.get('@type') == 'JobPosting':
+                return item
+    return None
+
+
+def parse_job_detail(page_html):
+    """Extract description and requirements from a Dice job detail page
+
+    Prefers the JobPosting JSON-LD block and falls back to the rendered
+    description and skills list.
+    """
+    if not page_html:
+        return {'description': "", 'requirements': ""}
+
+    tree = lxml_html.fromstring(page_html)
+    description = ""
+    requirements = ""
+
+    posting = _job_posting(tree)
+    if posting:
+        description = _html_to_text(posting.get('description'))
+        for field in ('qualifications', 'skills', 'experienceRequirements'):
+            value = posting.get(field)
+            if isinstance(value, list):
+                value = ', '.join(str(v) for v in value)
+            elif isinstance(value, dict):
+                value = value.get('description')
+            if value:
+                requirements = _html_to_text(str(value))
+                break
+
+    if not description:
+        desc_elem = _first(tree, DETAIL_DESCRIPTION_XPATH)
+        description = _text(desc_elem) if desc_elem is not None else ""
+
+    if not requirements:
+        skills = [_text(span) for span in tree.xpath(DETAIL_SKILLS_XPATH)]
+        requirements = ', '.join(skill for skill in skills if skill)
+
+    return {'description': description, 'requirements': requirements}
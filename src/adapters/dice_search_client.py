@@ -0,0 +1,74 @@
+"""
+Browserless HTTP search backend for Dice.com result pages
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from .dice_parser import iter_job_cards
+
+
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+
+class DiceHttpSearchClient:
+    """Fetch and parse Dice search result listings over a pooled requests.Session
+
+    Dice renders the job cards server-side, so the listing can be read straight
+    from the HTML response without starting Chrome.
+    """
+
+    def __init__(self, logger, pool_size=4, timeout=15, retries=2):
+        self.logger = logger
+        self.timeout = timeout
+        self.on_page = None  # Optional callback(url, html) for every fetched page
+
+        self.session = requests.Session()
+        self.session.headers.update({
+            'User-Agent': USER_AGENT,
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            'Accept-Language': 'en-US,en;q=0.9'
+        })
+
+        retry = Retry(total=retries, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def iter_page(self, url, page_num):
+        """Fetch one result page and yield its job dicts as the cards are parsed
+
+        Yields nothing when pagination should stop (redirected away from the
+        requested page, or no job cards).
+        """
+        self.logger.info(f"Fetching page {page_num} over HTTP: {url}")
+        response = self.session.get(url, timeout=self.timeout)
+        response.raise_for_status()
+
+        if self.on_page:
+            self.on_page(response.url, response.text)
+
+        # Check if we got redirected (means no more pages)
+        if page_num > 1 and f"page={page_num}" not in response.url:
+            self.logger.info(f"Redirected from page {page_num}, no more pages available.")
+            return
+
+        found = 0
+        for job_data in iter_job_cards(response.content, response.url):
+            found += 1
+            yield job_data
+
+        if not found:
+            self.logger.info(f"No job cards found on page {page_num}.")
+
+    def search_page(self, url, page_num):
+        """Fetch one result page and return its job dicts
+
+        Returns None when pagination should stop (redirected away from the
+        requested page, or no job cards), mirroring DiceAdapter.search_jobs_on_page.
+        """
+        return list(self.iter_page(url, page_num)) or None
+
+    def close(self):
+        """Close pooled connections"""
+        self.session.close()
@@ -0,0 +1,151 @@
+"""
+Cached, offline-capable ChromeDriver resolution
+"""
+
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import threading
+import time
+
+
+CHROME_BINARIES = [
+    'google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser',
+    '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome'
+]
+
+_resolved = {}
+_lock = threading.Lock()
+
+
+def detect_chrome_version():
+    """Return the installed Chrome version string (e.g. '120.0.6099.109'), or None"""
+    candidates = [os.getenv('CHROME_BINARY')] if os.getenv('CHROME_BINARY') else []
+    candidates += CHROME_BINARIES
+
+    commands = [[binary, '--version'] for binary in candidates if shutil.which(binary) or os.path.exists(binary)]
+    if sys.platform.startswith('win'):
+        commands.append(['reg', 'query', r'HKEY_CURRENT_USER\Software\Google\Chrome\BLBeacon', '/v', 'version'])
+
+    for command in commands:
+        try:
+            output = subprocess.run(command, capture_output=True, text=True, timeout=5).stdout
+        except (OSError, subprocess.SubprocessError):
+            continue
+        match = re.search(r'(\d+)\.\d+\.\d+\.\d+', output)
+        if match:
+            return match.group(0)
+    return None
+
+
+def _major(version):
+    return version.split('.')[0] if version else None
+
+
+class ChromeDriverCache:
+    """Resolve the ChromeDriver path without hitting the network on every run
+
+    The path resolved by webdriver-manager is cached in .cache/chromedriver.json
+    with the Chrome version it was resolved for. It is reused while the file
+    still exists and the installed Chrome major version is unchanged. In
+    offline mode, network resolution is never attempted.
+    """
+
+    def __init__(self, config=None, logger=None):
+        config = config or {}
+        self.logger = logger
+        self.offline = config.get('offline', False) or os.getenv('CHROMEDRIVER_OFFLINE', 'false').lower() == 'true'
+        self.explicit_path = os.getenv('CHROMEDRIVER_PATH') or config.get('path') or None
+
+        base_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+        self.cache_path = os.path.join(base_dir, '.cache', 'chromedriver.json')
+
+    def _log(self, message):
+        if self.logger:
+            self.logger.info(message)
+
+    def _load(self):
+        try:
+            with open(self.cache_path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _save(self, driver_path, chrome_version):
+        os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+        data = {
+            'driver_path': driver_path,
+            'chrome_version': chrome_version,
+            'chrome_major': _major(chrome_version),
+            'resolved_at': time.time()
+        }
+        tmp_path = f"{self.cache_path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, self.cache_path)
+
+    @staticmethod
+    def _usable(path):
+        return bool(path) and os.path.isfile(path) and os.access(path, os.X_OK)
+
+    def is_valid(self, cached, chrome_version):
+        """Check a cache entry against the driver file and the installed Chrome"""
+        if not cached or not self._usable(cached.get('driver_path')):
+            return False
+        if chrome_version is None:
+            # Can't tell; trust the cache rather than going to the network
+            return True
+        return cached.get('chrome_major') == _major(chrome_version)
+
+    def resolve(self, chrome_version=None):
+        """Return a ChromeDriver executable path
+
+        chrome_version: the installed Chrome version, if the caller has
+        already detected it.
+        """
+        if self.explicit_path:
+            if not self._usable(self.explicit_path):
+                raise RuntimeError(f"ChromeDriver not found or not executable: {self.explicit_path}")
+            return self.explicit_path
+
+        chrome_version = chrome_version or detect_chrome_version()
+        cached = self._load()
+        if self.is_valid(cached, chrome_version):
+            return cached['driver_path']
+
+        if self.offline:
+            on_path = shutil.which('chromedriver')
+            if on_path:
+                self._log(f"Offline mode: using chromedriver from PATH ({on_path})")
+                return on_path
+            raise RuntimeError(
+                "Offline mode: no cached ChromeDriver matches the installed Chrome "
+                f"({chrome_version or 'unknown version'}). Set CHROMEDRIVER_PATH or run once online."
+            )
+
+        from webdriver_manager.chrome import ChromeDriverManager
+
+        self._log(f"Resolving ChromeDriver for Chrome {chrome_version or '(version unknown)'}...")
+        driver_path = ChromeDriverManager().install()
+        self._save(driver_path, chrome_version)
+        return driver_path
+
+
+def resolve_chromedriver(config=None, logger=None):
+    """Resolve the ChromeDriver path once per process and Chrome major version
+
+    Shared by all adapters and workers. The installed Chrome is re-detected
+    on every call, so a Chrome auto-update under a long-lived process (the
+    scheduler's resident browser) resolves a matching driver instead of
+    reusing the stale one.
+    """
+    cache = ChromeDriverCache(config, logger)
+    chrome_version = None if cache.explicit_path else detect_chrome_version()
+    key = (cache.offline, cache.explicit_path, _major(chrome_version))
+    with _lock:
+        if key not in _resolved or not cache._usable(_resolved[key]):
+            _resolved[key] = cache.resolve(chrome_version)
+        return _resolved[key]
@@ -0,0 +1,118 @@
+"""
+Concurrent keyword x location search fan-out with cross-query de-duplication
+"""
+
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import combinations
+
+
+def query_label(query):
+    keywords, location = query
+    return f"{keywords} @ {location}"
+
+
+class QueryFanOut:
+    """Run search(keywords, location) for many queries and merge the results by job_id
+
+    Up to max_concurrency queries run at once on a thread pool; results are
+    merged as each query finishes, so the first jobs reach the apply stage
+    before the slowest query returns. With max_concurrency 1 the queries run
+    lazily in the consuming thread, which is required when search drives the
+    same browser that applies.
+    """
+
+    def __init__(self, search, queries, max_concurrency=4, logger=None):
+        self.search = search
+        self.queries = list(queries)
+        self.max_concurrency = max(1, int(max_concurrency or 1))
+        self.logger = logger
+
+        self.sources = {}  # job_id -> labels of the queries that returned it
+        self.per_query = {}
+        self.failed = []
+        self.raw_jobs = 0
+
+    def __iter__(self):
+        """Yield each unique job once"""
+        for batch in self.batches():
+            yield from batch
+
+    def batches(self):
+        """Yield the not-yet-seen jobs of each query as it finishes"""
+        if self.max_concurrency == 1 or len(self.queries) <= 1:
+            for query in self.queries:
+                yield self._merge(query, self._run(query))
+            return
+
+        executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix='search-fanout')
+        try:
+            futures = {executor.submit(self._run, query): query for query in self.queries}
+            for future in as_completed(futures):
+                yield self._merge(futures[future], future.result())
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self, query):
+        keywords, location = query
+        if self.logger:
+            self.logger.info(f"Searching: '{keywords}' in '{location}'")
+        try:
+            return self.search(keywords, location) or []
+        except Exception as e:
+            self.failed.append(query_label(query))
+            if self.logger:
+                self.logger.error(f"Search '{keywords}' in '{location}' failed: {str(e)}")
+            return []
+
+    def _merge(self, query, jobs):
+        label = query_label(query)
+        new_jobs = []
+        for job in jobs:
+            job_id = job.get('job_id')
+            if not job_id:
+                continue
+            self.raw_jobs += 1
+            labels = self.sources.setdefault(job_id, [])
+            if not labels:
+                new_jobs.append(job)
+            if label not in labels:
+                labels.append(label)
+
+        self.per_query[label] = {'found': len(jobs), 'new': len(new_jobs)}
+        if self.logger:
+            self.logger.info(f"'{label}': {len(jobs)} jobs, {len(new_jobs)} not seen in earlier queries")
+        return new_jobs
+
+    def stats(self):
+        """Totals, per-query counts and how many jobs each pair of queries shared"""
+        overlap = Counter()
+        for labels in self.sources.values():
+            for pair in combinations(sorted(labels), 2):
+                overlap[pair] += 1
+
+        unique = len(self.sources)
+        return {
+            'queries': len(self.queries),
+            'failed_queries': list(self.failed),
+            'raw_jobs': self.raw_jobs,
+            'unique_jobs': unique,
+            'duplicates': self.raw_jobs - unique,
+            'per_query': dict(self.per_query),
+            'overlap': dict(overlap.most_common())
+        }
+
+    def log_summary(self, logger=None):
+        """Log the fan-out totals and the most overlapping query pairs"""
+        logger = logger or self.logger
+        if not logger:
+            return
+        stats = self.stats()
+        logger.info(
+            f"✓ Query fan-out: {stats['queries']} queries, {stats['raw_jobs']} results, "
+            f"{stats['unique_jobs']} unique jobs ({stats['duplicates']} duplicates across queries)"
+        )
+        for (first, second), shared in list(stats['overlap'].items())[:5]:
+            logger.info(f"  overlap: '{first}' / '{second}': {shared} shared jobs")
+        if stats['failed_queries']:
+            logger.warning(f"  failed queries: {', '.join(stats['failed_queries'])}")
@@ -0,0 +1,217 @@
+"""
+On-disk HTTP cache with conditional-GET revalidation
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+import requests
+from .dice_search_client import USER_AGENT
+
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+
+
+class HttpCache:
+    """Cache GET responses on disk, keyed by URL
+
+    Entries younger than ttl_hours are served without a request. Older entries
+    are revalidated with If-None-Match / If-Modified-Since, so an unchanged page
+    costs a 304 with no body. When the cache grows past max_size_mb the least
+    recently used entries are evicted. If a request fails, a stale copy is
+    served rather than nothing.
+    """
+
+    def __init__(self, config=None, logger=None, session=None):
+        config = config or {}
+        directory = config.get('dir', os.path.join('.cache', 'http'))
+        self.directory = directory if os.path.isabs(directory) else os.path.join(BASE_DIR, directory)
+        self.ttl = float(config.get('ttl_hours', 24)) * 3600
+        self.max_bytes = int(float(config.get('max_size_mb', 50)) * 1024 * 1024)
+        self.timeout = config.get('timeout', 15)
+        self.logger = logger
+
+        if session is None:
+            session = requests.Session()
+            session.headers.update({'User-Agent': USER_AGENT})
+        self.session = session
+
+        self.lock = threading.Lock()
+        self.index_path = os.path.join(self.directory, 'index.json')
+        os.makedirs(self.directory, exist_ok=True)
+        self.index = self._load_index()
+
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self.errors = 0
+
+    @staticmethod
+    def key(url):
+        return hashlib.sha1(url.encode('utf-8')).hexdigest()
+
+    def get(self, url):
+        """Return the response body for url, from the cache when possible (None on failure)"""
+        key = self.key(url)
+        with self.lock:
+            entry = self.index.get(key)
+
+        now = time.time()
+        if entry and now - entry['stored_at'] < self.ttl:
+            body = self._read(entry)
+            if body is not None:
+                self._touch(key, now)
+                self.hits += 1
+                return body
+
+        # An entry whose body is gone (evicted, cleaned up, another process's
+        # index) can't answer a 304: forget it and fetch the page unconditionally
+        if entry and not os.path.isfile(os.path.join(self.directory, entry['file'])):
+            self._drop(key)
+            entry = None
+
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+
+        try:
+            response = self.session.get(url, headers=headers, timeout=self.timeout)
+        except requests.RequestException as e:
+            self.errors += 1
+            self._log(f"HTTP cache: request failed for {url}: {str(e)}")
+            return self._read(entry) if entry else None
+
+        if response.status_code == 304 and entry:
+            body = self._read(entry)
+            if body is not None:
+                with self.lock:
+                    entry['stored_at'] = now
+                self._touch(key, now)
+                self._save_index()
+                self.revalidated += 1
+                return body
+            # The body went missing since the check above
+            self._drop(key)
+            entry = None
+            try:
+                response = self.session.get(url, timeout=self.timeout)
+            except requests.RequestException as e:
+                self.errors += 1
+                self._log(f"HTTP cache: request failed for {url}: {str(e)}")
+                return None
+
+        if response.status_code != 200:
+            self.errors += 1
+            self._log(f"HTTP cache: {url} returned {response.status_code}")
+            return self._read(entry) if entry else None
+
+        self.misses += 1
+        self._store(key, url, response, now)
+        return response.text
+
+    def stats(self):
+        """Hit/miss counters and current cache size"""
+        with self.lock:
+            entries = len(self.index)
+            size = sum(entry.get('size', 0) for entry in self.index.values())
+        lookups = self.hits + self.revalidated + self.misses
+        return {
+            'hits': self.hits,
+            'revalidated': self.revalidated,
+            'misses': self.misses,
+            'errors': self.errors,
+            'hit_rate': (self.hits + self.revalidated) / lookups if lookups else 0.0,
+            'entries': entries,
+            'size_mb': size / (1024 * 1024)
+        }
+
+    def log_summary(self, logger=None):
+        """Log the cache counters"""
+        logger = logger or self.logger
+        if not logger:
+            return
+        stats = self.stats()
+        if not (stats['hits'] or stats['revalidated'] or stats['misses'] or stats['errors']):
+            return
+        logger.info(
+            f"✓ Detail cache: {stats['hits']} hits, {stats['revalidated']} revalidated, "
+            f"{stats['misses']} misses, {stats['errors']} errors "
+            f"({stats['hit_rate']:.0%} hit rate, {stats['entries']} entries, {stats['size_mb']:.1f} MB)"
+        )
+
+    def close(self):
+        """Persist access times and close pooled connections"""
+        self._save_index()
+        self.session.close()
+
+    def _log(self, message):
+        if self.logger:
+            self.logger.warning(message)
+
+    def _load_index(self):
+        try:
+            with open(self.index_path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_index(self):
+        with self.lock:
+            tmp_path = f"{self.index_path}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(self.index, f)
+            os.replace(tmp_path, self.index_path)
+
+    def _read(self, entry):
+        try:
+            with open(os.path.join(self.directory, entry['file']), 'r', encoding='utf-8') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _drop(self, key):
+        with self.lock:
+            self.index.pop(key, None)
+        self._save_index()
+
+    def _touch(self, key, now):
+        with self.lock:
+            if key in self.index:
+                self.index[key]['last_access'] = now
+
+    def _store(self, key, url, response, now):
+        body = response.text
+        filename = f"{key}.html"
+        with open(os.path.join(self.directory, filename), 'w', encoding='utf-8') as f:
+            f.write(body)
+
+        with self.lock:
+            self.index[key] = {
+                'url': url,
+                'file': filename,
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'stored_at': now,
+                'last_access': now,
+                'size': len(body.encode('utf-8'))
+            }
+            self._evict()
+        self._save_index()
+
+    def _evict(self):
+        """Drop least recently used entries until the cache fits max_bytes (lock held)"""
+        total = sum(entry.get('size', 0) for entry in self.index.values())
+        for key in sorted(self.index, key=lambda k: self.index[k].get('last_access', 0)):
+            if total <= self.max_bytes or len(self.index) <= 1:
+                break
+            entry = self.index.pop(key)
+            total -= entry.get('size', 0)
+            try:
+                os.remove(os.path.join(self.directory, entry['file']))
+            except OSError:
+                pass
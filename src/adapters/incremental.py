@@ -0,0 +1,100 @@
+"""
+Incremental crawling: stop paginating once result pages are already known
+"""
+
+
+class IncrementalCrawl:
+    """Track how much of each result page is already in the database
+
+    Each page is checked with one batched query before its jobs are saved.
+    Pagination stops after stop_after_known_pages consecutive pages where at
+    least known_ratio of the jobs were already known, or as soon as the
+    previous run's high-water mark (the newest job it saw at the top of page 1)
+    shows up. The mark for this run is written back by finish().
+    """
+
+    def __init__(self, db, platform, query, config, logger):
+        config = config or {}
+        self.db = db
+        self.platform = platform
+        self.query = query
+        self.logger = logger
+        self.known_ratio = float(config.get('known_ratio', 0.8))
+        self.stop_after = max(1, int(config.get('stop_after_known_pages', 2)))
+        self.use_high_water_mark = config.get('use_high_water_mark', True)
+
+        state = db.get_crawl_state(platform, query) or {}
+        self.high_water = state.get('high_water_job_id') if self.use_high_water_mark else None
+        self.new_high_water = None
+        self.last_new_page = None
+
+        self.known_streak = 0
+        self.pages_checked = 0
+        self.jobs_checked = 0
+        self.jobs_known = 0
+        self.stop_reason = None
+
+    def observe_page(self, page_num, jobs, known=None):
+        """Record a page's known/new split; returns False when pagination should stop after it
+
+        known: the page's job_ids already stored, if the caller has looked them up.
+        """
+        job_ids = [job.get('job_id') for job in jobs if job.get('job_id')]
+        if not job_ids:
+            return True
+
+        if known is None:
+            known = self.db.known_job_ids(job_ids, self.platform)
+        known = set(known) & set(job_ids)
+        self.pages_checked += 1
+        self.jobs_checked += len(job_ids)
+        self.jobs_known += len(known)
+
+        if page_num == 1 and self.new_high_water is None:
+            self.new_high_water = job_ids[0]
+        if len(known) < len(job_ids):
+            self.last_new_page = page_num
+
+        ratio = len(known) / len(job_ids)
+        self.logger.info(f"Incremental: page {page_num} has {len(known)}/{len(job_ids)} known jobs ({ratio:.0%})")
+
+        if self.high_water and self.high_water in job_ids:
+            self.stop_reason = f"reached high-water mark {self.high_water} on page {page_num}"
+            return False
+
+        if ratio >= self.known_ratio:
+            self.known_streak += 1
+        else:
+            self.known_streak = 0
+
+        if self.known_streak >= self.stop_after:
+            self.stop_reason = f"{self.known_streak} consecutive mostly-known pages"
+            return False
+        return True
+
+    def finish(self, completed=True):
+        """Persist this run's high-water mark and log a summary
+
+        A run cut short (e.g. by the application budget) never saw the pages
+        after where it stopped, so it keeps the previous mark.
+        """
+        if self.stop_reason:
+            self.logger.info(f"✓ Incremental crawl stopped early: {self.stop_reason}")
+        if self.jobs_checked:
+            self.logger.info(
+                f"Incremental: {self.jobs_known}/{self.jobs_checked} jobs already known "
+                f"across {self.pages_checked} pages"
+            )
+
+        if not completed:
+            self.new_high_water = None
+        if self.new_high_water or self.last_new_page:
+            try:
+                self.db.save_crawl_state(
+                    self.platform,
+                    self.query,
+                    high_water_job_id=self.new_high_water,
+                    last_new_page=self.last_new_page
+                )
+            except Exception as e:
+                self.logger.error(f"Error saving crawl state: {str(e)}")
@@ -0,0 +1,133 @@
+"""
+Pipelined search/apply: stream discovered jobs through a bounded queue
+"""
+
+import queue
+import threading
+
+
+_DONE = object()
+
+
+class SearchApplyPipeline:
+    """Producer/consumer pipeline between the search and apply stages
+
+    A background thread walks result pages with search_page(page_num) and puts
+    each job into a bounded queue, so page N+1 is fetched while page N is still
+    being applied to. A full queue blocks the search stage (back-pressure).
+    Iterating the pipeline drains the queue; iteration ends once search_page
+    returns None or an empty page, or max_pages is reached.
+
+    search_page may also return a generator (e.g. DiceAdapter.iter_jobs_on_page):
+    without on_page each job is queued as soon as it is yielded, so the apply
+    stage starts on a page's first job while the rest are still being parsed.
+
+    The optional on_page(page_num, jobs) callback runs in the search thread
+    before a page is queued. It gets the whole page as a list and returns
+    (jobs_to_queue, keep_going); with keep_going False, pagination stops
+    after that page.
+    """
+
+    def __init__(self, search_page, max_pages, logger, queue_size=20, on_page=None):
+        self.search_page = search_page
+        self.on_page = on_page
+        self.max_pages = max_pages
+        self.logger = logger
+        self.jobs = queue.Queue(maxsize=max(1, int(queue_size)))
+        self.stop_event = threading.Event()
+        self.thread = None
+
+        self.pages_searched = 0
+        self.jobs_found = 0
+        self.error = None
+
+    def start(self):
+        """Start the search stage"""
+        self.thread = threading.Thread(target=self._search_loop, name='search-stage', daemon=True)
+        self.thread.start()
+
+    def __iter__(self):
+        """Yield jobs as the search stage discovers them"""
+        while True:
+            try:
+                job = self.jobs.get(timeout=0.5)
+            except queue.Empty:
+                if self.thread and not self.thread.is_alive() and self.jobs.empty():
+                    return
+                continue
+            if job is _DONE:
+                return
+            yield job
+
+    def stop(self):
+        """Stop the search stage and wait for it to exit"""
+        self.stop_event.set()
+
+        # Unblock a search stage waiting on a full queue
+        while True:
+            try:
+                self.jobs.get_nowait()
+            except queue.Empty:
+                break
+
+        if self.thread:
+            self.thread.join()
+            self.thread = None
+
+    def _put(self, item):
+        """Put an item, waiting for room unless the pipeline is stopping"""
+        while not self.stop_event.is_set():
+            try:
+                self.jobs.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _search_loop(self):
+        """Walk result pages and stream their jobs into the queue"""
+        try:
+            for page_num in range(1, self.max_pages + 1):
+                if self.stop_event.is_set():
+                    break
+
+                self.logger.info(f"Search stage: fetching page {page_num}")
+                jobs = self.search_page(page_num)
+
+                # Check if pagination should stop
+                if jobs is None:
+                    self.logger.info(f"No more pages available. Stopping at page {page_num - 1}.")
+                    break
+
+                # Runs before queueing, while none of this page's jobs are saved yet
+                keep_going = True
+                found = None
+                if self.on_page:
+                    jobs = list(jobs)
+                    found = len(jobs)
+                    if jobs:
+                        jobs, keep_going = self.on_page(page_num, jobs)
+
+                queued = 0
+                for job in jobs:
+                    if not self._put(job):
+                        return
+                    queued += 1
+                found = queued if found is None else found
+
+                if found == 0:
+                    self.logger.info(f"No jobs found on page {page_num}. Stopping pagination.")
+                    break
+
+                self.pages_searched = page_num
+                self.jobs_found += found
+
+                self.logger.info(f"Search stage: queued {queued} jobs from page {page_num}")
+
+                if not keep_going:
+                    break
+        except Exception as e:
+            self.error = e
+            self.logger.error(f"Search stage error: {str(e)}")
+        finally:
+            self._put(_DONE)
@@ -0,0 +1,127 @@
+"""
+Search query planning: collapse the keywords x locations cross-product
+"""
+
+import math
+
+
+class PlannedQuery:
+    """One platform search: an (OR-)keyword expression, a location and a page budget"""
+
+    def __init__(self, keywords, query_text, location, remote, max_pages):
+        self.keywords = keywords
+        self.query_text = query_text
+        self.location = location
+        self.remote = remote
+        self.max_pages = max_pages
+        self.estimated_pages = max_pages
+        self.url = None
+
+    @property
+    def label(self):
+        return f"{self.query_text} @ {self.location}"
+
+    def __repr__(self):
+        return f"<PlannedQuery('{self.label}', pages={self.estimated_pages}/{self.max_pages})>"
+
+
+def is_remote(location):
+    return 'remote' in (location or '').lower()
+
+
+def quote_keyword(keyword):
+    """Quote multi-word keywords so they match as phrases inside an OR expression"""
+    keyword = keyword.strip()
+    return f'"{keyword}"' if ' ' in keyword else keyword
+
+
+class QueryPlanner:
+    """Turn search_criteria into the fewest queries a platform can express
+
+    With supports_or, keywords are joined into OR expressions (split when
+    longer than max_query_length). With supports_remote_filter, every
+    remote-style location collapses into one remote-filtered query; each
+    other distinct location gets its own query. Pages per query are capped
+    at search_pages and estimated from the deepest page that still had new
+    jobs on the previous crawl, when known.
+    """
+
+    def __init__(self, supports_or=True, supports_remote_filter=True, max_query_length=200):
+        self.supports_or = supports_or
+        self.supports_remote_filter = supports_remote_filter
+        self.max_query_length = max_query_length
+
+    def keyword_groups(self, keywords):
+        """Split keywords into OR groups that fit max_query_length"""
+        keywords = list(dict.fromkeys(k.strip() for k in keywords if k and k.strip()))
+        if not self.supports_or:
+            return [[keyword] for keyword in keywords]
+
+        groups = []
+        current = []
+        for keyword in keywords:
+            candidate = current + [keyword]
+            if current and len(self.query_text(candidate)) > self.max_query_length:
+                groups.append(current)
+                candidate = [keyword]
+            current = candidate
+        if current:
+            groups.append(current)
+        return groups
+
+    @staticmethod
+    def query_text(keywords):
+        if len(keywords) == 1:
+            return keywords[0]
+        return ' OR '.join(quote_keyword(keyword) for keyword in keywords)
+
+    def locations(self, locations):
+        """Distinct (location, remote) targets"""
+        targets = []
+        seen = set()
+        for location in locations or ['Remote']:
+            remote = is_remote(location)
+            key = 'remote' if remote and self.supports_remote_filter else location.strip().lower()
+            if key in seen:
+                continue
+            seen.add(key)
+            targets.append(('Remote' if remote and self.supports_remote_filter else location.strip(), remote))
+        return targets
+
+    def plan(self, criteria, search_pages=3, page_history=None):
+        """Return the PlannedQuery list for search_criteria
+
+        page_history: optional callable(PlannedQuery) -> deepest page with new
+        jobs on the last crawl (None if unknown).
+        """
+        queries = []
+        for group in self.keyword_groups(criteria.get('keywords', [])):
+            for location, remote in self.locations(criteria.get('locations', [])):
+                query = PlannedQuery(group, self.query_text(group), location, remote, search_pages)
+                if page_history:
+                    last_new_page = page_history(query)
+                    if last_new_page:
+                        query.estimated_pages = min(search_pages, last_new_page + 1)
+                queries.append(query)
+        return queries
+
+
+def naive_query_count(criteria):
+    """Queries the plain keywords x locations cross-product would run"""
+    return len(criteria.get('keywords', [])) * len(criteria.get('locations', []))
+
+
+def format_plan(platform_name, queries, criteria, search_pages):
+    """Render a plan as text for --plan"""
+    naive = naive_query_count(criteria)
+    lines = [f"{platform_name}: {len(queries)} queries (cross-product: {naive})"]
+    for index, query in enumerate(queries, 1):
+        lines.append(f"  {index}. {query.label}  [{query.estimated_pages}/{query.max_pages} pages]")
+        if query.url:
+            lines.append(f"     {query.url}")
+    estimated = sum(query.estimated_pages for query in queries)
+    lines.append(
+        f"  Estimated pages: {estimated} (cross-product at {search_pages} pages each: {naive * search_pages}, "
+        f"~{math.ceil(estimated / max(1, naive * search_pages) * 100)}%)"
+    )
+    return '\n'.join(lines)
@@ -0,0 +1,261 @@
+"""
+Record/replay of visited pages with a local fixture server
+
+Record:  set replay.record: true in config.yaml and run normally; every page the
+         adapter visits is saved under replay.dir.
+Replay:  python -m src.adapters.replay run --dir recordings/dice --latency-ms 150
+         (or serve the recording with `serve` and point a run at it with
+         DICE_BASE_URL=http://127.0.0.1:8765)
+"""
+
+import argparse
+import copy
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from datetime import datetime
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit
+
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+
+
+def page_key(url):
+    """Key a URL by path and query, so recordings are host-independent"""
+    parts = urlsplit(url)
+    key = parts.path or '/'
+    if parts.query:
+        key = f"{key}?{parts.query}"
+    return key
+
+
+class PageRecorder:
+    """Save visited pages (HTML + URL + label) into a recording directory
+
+    The first label seen for a URL is stored under its plain key and served on
+    replay. Later states of the same URL (e.g. apply-form steps) are stored
+    under "<key>#<label>" for inspection.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory if os.path.isabs(directory) else os.path.join(BASE_DIR, directory)
+        self.index_path = os.path.join(self.directory, 'index.json')
+        self.lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+        self.index = load_index(self.directory)
+
+    def record(self, url, page_html, label):
+        """Record one page"""
+        key = page_key(url)
+        with self.lock:
+            existing = self.index.get(key)
+            if existing and existing['label'] != label:
+                key = f"{key}#{label}"
+
+            filename = f"{hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]}.html"
+            with open(os.path.join(self.directory, filename), 'w', encoding='utf-8') as f:
+                f.write(page_html)
+
+            self.index[key] = {
+                'file': filename,
+                'label': label,
+                'url': url,
+                'recorded_at': datetime.now().isoformat(timespec='seconds')
+            }
+
+            tmp_path = f"{self.index_path}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(self.index, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.index_path)
+
+
+_recorders = {}
+_recorders_lock = threading.Lock()
+
+
+def get_recorder(directory):
+    """Return the shared PageRecorder for a directory (one per process)"""
+    with _recorders_lock:
+        if directory not in _recorders:
+            _recorders[directory] = PageRecorder(directory)
+        return _recorders[directory]
+
+
+def load_index(directory):
+    """Load a recording's index.json ({} if missing)"""
+    try:
+        with open(os.path.join(directory, 'index.json'), 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+class ReplayServer:
+    """Serve a recording over local HTTP with configurable latency
+
+    Absolute links to the recorded origin are rewritten to the local server so
+    navigation stays offline. Unknown URLs return 404, which the adapter treats
+    like the end of pagination.
+    """
+
+    def __init__(self, directory, latency_ms=0, host='127.0.0.1', port=0, origin='https://www.dice.com'):
+        self.directory = directory if os.path.isabs(directory) else os.path.join(BASE_DIR, directory)
+        self.latency = latency_ms / 1000.0
+        self.origin = origin
+        self.index = load_index(self.directory)
+        self.requests = 0
+        self.misses = 0
+
+        self.httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self.thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.requests += 1
+                if server.latency:
+                    time.sleep(server.latency)
+
+                entry = server.index.get(page_key(self.path))
+                if not entry:
+                    server.misses += 1
+                    self.send_error(404, "Not recorded")
+                    return
+
+                with open(os.path.join(server.directory, entry['file']), 'r', encoding='utf-8') as f:
+                    body = f.read().replace(server.origin, server.base_url).encode('utf-8')
+
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        """Serve in a background thread"""
+        self.thread = threading.Thread(target=self.httpd.serve_forever, name='replay-server', daemon=True)
+        self.thread.start()
+        return self.base_url
+
+    def stop(self):
+        """Stop serving"""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def replay_adapter(adapter_class):
+    """Subclass of adapter_class for runs against a ReplayServer
+
+    Its login() accepts the recorded logged-in page (probe_logged_in) as the
+    session and never submits credentials; the live adapter's login() has no
+    replay special case.
+    """
+    class ReplayAdapter(adapter_class):
+        def login(self):
+            if self.is_logged_in:
+                return True
+            if self.probe_logged_in():
+                self.logger.info("✓ Replaying a recorded logged-in session")
+                self.is_logged_in = True
+                return True
+            self.logger.error("Recording has no logged-in page; record a run that logs in first")
+            return False
+
+    ReplayAdapter.__name__ = f"Replay{adapter_class.__name__}"
+    return ReplayAdapter
+
+
+def replay_config(config):
+    """Copy of config for a replay run, with nothing written to live caches or recordings"""
+    config = copy.deepcopy(config)
+    config['selector_cache'] = dict(config.get('selector_cache') or {}, enabled=False)
+    config['replay'] = dict(config.get('replay') or {}, record=False)
+    config['session'] = dict(config.get('session') or {}, persist=False)
+    return config
+
+
+def run_replay(directory, platform='dice', latency_ms=0, search_only=True, db_url=None):
+    """Serve a recording and run the platform's replay adapter against it; returns the run result
+
+    Jobs, applications and crawl state go to db_url, or to a throwaway
+    database when none is given, never to the live jobider.db. The
+    <PLATFORM>_BASE_URL override only lasts for the run. The selector
+    cache, page recording and session persistence are turned off, so
+    pages from the replay origin never reach their live files.
+    """
+    from src.database import Database
+    from src.utils import load_config
+    from .runner import ADAPTERS
+
+    with tempfile.TemporaryDirectory(prefix='replay-') as tmp:
+        db = Database(db_url or f"sqlite:///{os.path.join(tmp, 'replay.db')}")
+        server = ReplayServer(directory, latency_ms=latency_ms)
+        env_name = f'{platform.upper()}_BASE_URL'
+        previous_base_url = os.environ.get(env_name)
+        os.environ[env_name] = server.start()
+        try:
+            adapter = replay_adapter(ADAPTERS[platform])(replay_config(load_config()), db)
+            return adapter.run(search_only=search_only)
+        finally:
+            # Later adapters in this process must not point at the stopped server
+            if previous_base_url is None:
+                os.environ.pop(env_name, None)
+            else:
+                os.environ[env_name] = previous_base_url
+            server.stop()
+            db.engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve recorded pages for offline replay')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    serve = subparsers.add_parser('serve', help='Serve a recording')
+    serve.add_argument('--dir', default='recordings/dice', help='Recording directory')
+    serve.add_argument('--latency-ms', type=int, default=0, help='Delay added to every response')
+    serve.add_argument('--host', default='127.0.0.1')
+    serve.add_argument('--port', type=int, default=8765)
+
+    run = subparsers.add_parser('run', help='Run an adapter against a recording')
+    run.add_argument('--dir', default='recordings/dice', help='Recording directory')
+    run.add_argument('--latency-ms', type=int, default=0, help='Delay added to every response')
+    run.add_argument('--platform', default='dice')
+    run.add_argument('--apply', action='store_true', help='Also go through the recorded apply flow (default: search only)')
+    run.add_argument('--db', default=None, help='Database URL for the run (default: a temporary database)')
+
+    args = parser.parse_args()
+
+    if args.command == 'run':
+        result = run_replay(args.dir, args.platform, args.latency_ms, search_only=not args.apply, db_url=args.db)
+        print(f"Jobs found: {result['jobs_found']}, Applications: {result['applications_submitted']}")
+        return
+
+    server = ReplayServer(args.dir, latency_ms=args.latency_ms, host=args.host, port=args.port)
+    print(f"Serving {len(server.index)} recorded pages from {server.directory}")
+    print(f"Run with: DICE_BASE_URL={server.base_url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
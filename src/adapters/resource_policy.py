@@ -0,0 +1,174 @@
+"""
+Network resource blocking profiles for Chrome sessions
+"""
+
+import json
+
+
+# URL patterns (Network.setBlockedURLs wildcards) for each blockable resource type
+TYPE_PATTERNS = {
+    'image': ['*.png', '*.png?*', '*.jpg', '*.jpg?*', '*.jpeg', '*.jpeg?*', '*.gif', '*.gif?*',
+              '*.webp', '*.webp?*', '*.svg', '*.svg?*', '*.ico', '*.ico?*'],
+    'font': ['*.woff', '*.woff?*', '*.woff2', '*.woff2?*', '*.ttf', '*.ttf?*', '*.otf', '*.otf?*'],
+    'stylesheet': ['*.css', '*.css?*'],
+    'media': ['*.mp4', '*.mp4?*', '*.webm', '*.webm?*', '*.mp3', '*.mp3?*']
+}
+
+# Chrome content settings used when a type is blocked in every phase
+TYPE_PREFS = {
+    'image': {'profile.managed_default_content_settings.images': 2}
+}
+
+TRACKER_PATTERNS = [
+    '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*',
+    '*googlesyndication.com*', '*facebook.net*', '*hotjar.com*', '*segment.io*',
+    '*segment.com/analytics*', '*newrelic.com*', '*nr-data.net*', '*adsrvr.org*'
+]
+
+DEFAULT_PROFILES = {
+    # Result pages are parsed from the DOM; nothing visual is needed
+    'search': {
+        'block_types': ['image', 'font', 'stylesheet', 'media'],
+        'block_trackers': True
+    },
+    # The apply form must render and behave normally
+    'apply': {
+        'block_types': ['media'],
+        'block_trackers': True
+    }
+}
+
+# Fallback per-request sizes (bytes) used until a type has been observed loading
+DEFAULT_SIZES = {
+    'Image': 40000, 'Font': 30000, 'Stylesheet': 25000, 'Media': 500000,
+    'Script': 50000, 'XHR': 5000, 'Fetch': 5000, 'Other': 5000
+}
+
+
+class ResourcePolicy:
+    """Per-phase request blocking, applied via Chrome prefs and DevTools
+
+    Types blocked in every profile are turned off with Chrome content-setting
+    prefs at startup. Phase-specific blocking uses Network.setBlockedURLs, so
+    the apply form can load resources the search pages skip. Blocked requests
+    are read back from the performance log and counted per session. Avoided
+    bytes are estimated from the average size of same-type resources that did
+    load. Requests suppressed by prefs are never issued, so they are not counted.
+    """
+
+    def __init__(self, config=None):
+        config = config or {}
+        self.enabled = config.get('enabled', False)
+        self.profiles = config.get('profiles') or DEFAULT_PROFILES
+        self.phase = None
+
+        self.request_types = {}
+        self.loaded = {}
+        self.blocked = {}
+
+    def _profile(self, phase):
+        return self.profiles.get(phase) or {}
+
+    def _always_blocked_types(self):
+        """Resource types blocked by every profile"""
+        profiles = list(self.profiles.values())
+        if not profiles:
+            return set()
+        blocked = set(profiles[0].get('block_types') or [])
+        for profile in profiles[1:]:
+            blocked &= set(profile.get('block_types') or [])
+        return blocked
+
+    def chrome_prefs(self):
+        """Chrome prefs for the types blocked in every phase"""
+        prefs = {}
+        for resource_type in self._always_blocked_types():
+            prefs.update(TYPE_PREFS.get(resource_type, {}))
+        return prefs
+
+    def configure_options(self, chrome_options):
+        """Add prefs and performance logging to Chrome options"""
+        if not self.enabled:
+            return
+        prefs = self.chrome_prefs()
+        if prefs:
+            chrome_options.add_experimental_option('prefs', prefs)
+        chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+
+    def blocked_patterns(self, phase):
+        """URL patterns to block during a phase"""
+        profile = self._profile(phase)
+        patterns = list(profile.get('block_patterns') or [])
+        if profile.get('block_trackers', False):
+            patterns.extend(TRACKER_PATTERNS)
+        for resource_type in profile.get('block_types') or []:
+            patterns.extend(TYPE_PATTERNS.get(resource_type, []))
+        return patterns
+
+    def apply_phase(self, driver, phase):
+        """Switch DevTools request blocking to the profile for phase"""
+        if not self.enabled or not driver or phase == self.phase:
+            return
+        self.collect(driver)
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': self.blocked_patterns(phase)})
+        self.phase = phase
+
+    def collect(self, driver):
+        """Read pending performance-log events into the session counters"""
+        if not self.enabled or not driver:
+            return
+        try:
+            entries = driver.get_log('performance')
+        except Exception:
+            return
+
+        for entry in entries:
+            try:
+                message = json.loads(entry['message'])['message']
+            except (KeyError, ValueError):
+                continue
+
+            method = message.get('method')
+            params = message.get('params', {})
+
+            if method == 'Network.requestWillBeSent':
+                self.request_types[params.get('requestId')] = params.get('type', 'Other')
+            elif method == 'Network.responseReceived':
+                self.request_types[params.get('requestId')] = params.get('type', 'Other')
+            elif method == 'Network.loadingFinished':
+                resource_type = self.request_types.pop(params.get('requestId'), 'Other')
+                count, size = self.loaded.get(resource_type, (0, 0))
+                self.loaded[resource_type] = (count + 1, size + params.get('encodedDataLength', 0))
+            elif method == 'Network.loadingFailed':
+                resource_type = params.get('type') or self.request_types.get(params.get('requestId'), 'Other')
+                self.request_types.pop(params.get('requestId'), None)
+                if params.get('blockedReason'):
+                    self.blocked[resource_type] = self.blocked.get(resource_type, 0) + 1
+
+    def _average_size(self, resource_type):
+        count, size = self.loaded.get(resource_type, (0, 0))
+        if count:
+            return size / count
+        return DEFAULT_SIZES.get(resource_type, DEFAULT_SIZES['Other'])
+
+    def summary(self):
+        """Requests and bytes loaded and avoided this session"""
+        return {
+            'requests_loaded': sum(count for count, _ in self.loaded.values()),
+            'bytes_loaded': sum(size for _, size in self.loaded.values()),
+            'requests_blocked': sum(self.blocked.values()),
+            'bytes_avoided': int(sum(count * self._average_size(t) for t, count in self.blocked.items())),
+            'blocked_by_type': dict(self.blocked)
+        }
+
+    def log_summary(self, logger):
+        """Log the session counters"""
+        if not self.enabled:
+            return
+        summary = self.summary()
+        logger.info(
+            f"Resource policy: blocked {summary['requests_blocked']} requests "
+            f"(~{summary['bytes_avoided'] / 1024:.0f} KB avoided), "
+            f"loaded {summary['requests_loaded']} ({summary['bytes_loaded'] / 1024:.0f} KB)"
+        )
@@ -0,0 +1,235 @@
+"""
+Run platform adapters, concurrently in worker processes or in-process
+"""
+
+import logging
+import multiprocessing
+import os
+import queue
+import signal
+import time
+from src.utils.logger import setup_logger
+from .dice_adapter import DiceAdapter
+from .browser_service import descendant_pids
+
+
+ADAPTERS = {
+    'dice': DiceAdapter,
+}
+
+MAX_COLLECTED_MESSAGES = 20
+
+
+def create_adapter(platform_name, config, db, browser_service=None):
+    """Instantiate the adapter for a platform (None if unsupported)"""
+    adapter_class = ADAPTERS.get(platform_name)
+    if adapter_class is None:
+        return None
+    return adapter_class(config, db, browser_service=browser_service)
+
+
+class _CollectingHandler(logging.Handler):
+    """Keep the most recent warnings and errors so they can be reported back"""
+
+    def __init__(self):
+        super().__init__(level=logging.WARNING)
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(f"{record.levelname}: {record.getMessage()}")
+        del self.messages[:-MAX_COLLECTED_MESSAGES]
+
+
+def run_platform(platform_name, config, db, search_only=False, browser_service=None):
+    """Run one platform in this process and return its result record"""
+    logger = setup_logger()
+    record = {
+        'platform': platform_name,
+        'status': 'error',
+        'jobs_found': 0,
+        'applications_submitted': 0,
+        'duration_seconds': 0.0,
+        'error': None,
+        'messages': []
+    }
+
+    handler = _CollectingHandler()
+    logging.getLogger().addHandler(handler)
+    start = time.monotonic()
+    try:
+        adapter = create_adapter(platform_name, config, db, browser_service=browser_service)
+        if adapter is None:
+            record['error'] = f"Unsupported platform: {platform_name}"
+            logger.error(record['error'])
+            return record
+
+        logger.info(f"Starting {platform_name} job search...")
+        result = adapter.run(search_only=search_only)
+        record.update(status='ok', **result)
+        logger.info(f"Completed! Jobs found: {result['jobs_found']}, Applications: {result['applications_submitted']}")
+    except Exception as e:
+        record['error'] = str(e)
+        logger.error(f"Error running {platform_name}: {str(e)}")
+    finally:
+        logging.getLogger().removeHandler(handler)
+        record['duration_seconds'] = time.monotonic() - start
+        record['messages'] = list(handler.messages)
+    return record
+
+
+def _platform_process(platform_name, config, search_only, db_url, results):
+    """Worker process entry point: own database engine, own browser"""
+    from src.database import Database
+
+    try:
+        # The parent created and migrated the schema before starting us
+        db = Database(db_url, create_schema=False)
+    except Exception as e:
+        results.put(_failure_record(platform_name, 'error', f"Database error: {str(e)}", 0.0))
+        return
+
+    results.put(run_platform(platform_name, config, db, search_only=search_only))
+
+
+def _kill_tree(process):
+    """Terminate a worker process and the browsers it started"""
+    for pid in descendant_pids(process.pid):
+        try:
+            os.kill(pid, signal.SIGKILL if hasattr(signal, 'SIGKILL') else signal.SIGTERM)
+        except OSError:
+            pass
+    process.terminate()
+    process.join(5)
+    if process.is_alive():
+        process.kill()
+        process.join()
+
+
+def run_platforms_parallel(platforms, config, db, search_only=False, timeout_seconds=None, logger=None):
+    """Run each platform in its own process; returns {platform: result record}
+
+    Workers open their own engine on db's URL; the schema already exists, so
+    they don't race to create it. A platform that raises, crashes or runs past
+    timeout_seconds is reported with status 'error', 'crashed' or 'timeout'
+    without holding up the others.
+    """
+    logger = logger or setup_logger()
+    db_url = db.engine.url.render_as_string(hide_password=False)
+    context = multiprocessing.get_context('spawn')
+    results = context.Queue()
+
+    processes = {}
+    started = {}
+    for platform_name in platforms:
+        process = context.Process(
+            target=_platform_process,
+            args=(platform_name, config, search_only, db_url, results),
+            name=f'platform-{platform_name}',
+            daemon=False
+        )
+        process.start()
+        processes[platform_name] = process
+        started[platform_name] = time.monotonic()
+        logger.info(f"Started {platform_name} in process {process.pid}")
+
+    records = {}
+    pending = dict(processes)
+    while pending:
+        try:
+            record = results.get(timeout=1)
+            records[record['platform']] = record
+        except queue.Empty:
+            pass
+
+        now = time.monotonic()
+        for platform_name, process in list(pending.items()):
+            elapsed = now - started[platform_name]
+            if platform_name in records:
+                process.join(10)
+                del pending[platform_name]
+            elif not process.is_alive():
+                # Give a result still in flight a moment to arrive
+                try:
+                    record = results.get(timeout=2)
+                    records[record['platform']] = record
+                    continue
+                except queue.Empty:
+                    pass
+                records[platform_name] = _failure_record(
+                    platform_name, 'crashed', f"Worker process exited with code {process.exitcode}", elapsed
+                )
+                logger.error(f"{platform_name} worker exited without a result (exit code {process.exitcode})")
+                del pending[platform_name]
+            elif timeout_seconds and elapsed > timeout_seconds:
+                logger.error(f"{platform_name} exceeded its {timeout_seconds / 60:.0f} minute limit. Stopping it.")
+                _kill_tree(process)
+                records[platform_name] = _failure_record(
+                    platform_name, 'timeout', f"Timed out after {timeout_seconds / 60:.0f} minutes", elapsed
+                )
+                del pending[platform_name]
+
+    return {platform_name: records[platform_name] for platform_name in platforms}
+
+
+def _failure_record(platform_name, status, error, duration_seconds):
+    return {
+        'platform': platform_name,
+        'status': status,
+        'jobs_found': 0,
+        'applications_submitted': 0,
+        'duration_seconds': duration_seconds,
+        'error': error,
+        'messages': []
+    }
+
+
+def run_platforms(platforms, config, db, search_only=False, browser_service=None, logger=None):
+    """Run the given platforms as configured by the execution section
+
+    With execution.platform_timeout_minutes set, each platform runs in a
+    worker process that is killed once it uses up that much wall-clock time:
+    all at once with execution.parallel_platforms and more than one
+    platform, otherwise one after another. Without a timeout, platforms run
+    in-process unless they run in parallel. A resident browser
+    (browser_service) lives in this process, so it forces in-process,
+    one-after-another execution and the timeout is not applied.
+    """
+    logger = logger or setup_logger()
+    execution = config.get('execution', {}) or {}
+    timeout_minutes = execution.get('platform_timeout_minutes', 60)
+    timeout_seconds = timeout_minutes * 60 if timeout_minutes else None
+    parallel = execution.get('parallel_platforms', False) and len(platforms) > 1
+
+    if browser_service is not None:
+        if timeout_seconds:
+            logger.warning(
+                f"platform_timeout_minutes ({timeout_minutes}) is not applied while the resident browser "
+                f"is enabled: platforms run in-process"
+            )
+    elif parallel:
+        logger.info(f"Running {len(platforms)} platform(s) in parallel worker processes")
+        return run_platforms_parallel(platforms, config, db, search_only, timeout_seconds, logger)
+    elif timeout_seconds:
+        # One worker process at a time, so a hung platform can be stopped
+        records = {}
+        for platform_name in platforms:
+            records.update(run_platforms_parallel([platform_name], config, db, search_only, timeout_seconds, logger))
+        return records
+
+    return {
+        platform_name: run_platform(platform_name, config, db, search_only, browser_service)
+        for platform_name in platforms
+    }
+
+
+def log_run_summary(records, logger):
+    """Log one line per platform, plus any warnings and errors it reported"""
+    for record in records.values():
+        logger.info(
+            f"{record['platform']}: {record['status']} - {record['jobs_found']} jobs found, "
+            f"{record['applications_submitted']} applications ({record['duration_seconds']:.0f}s)"
+        )
+        if record['error']:
+            logger.error(f"  {record['platform']} error: {record['error']}")
+        for message in record['messages']:
+            logger.info(f"  [{record['platform']}] {message}")
@@ -0,0 +1,134 @@
+"""
+Persistent per-step selector statistics for fallback locator lists
+"""
+
+import json
+import os
+import threading
+import time
+
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+
+
+def locator_key(locator):
+    by, value = locator
+    return f"{by}={value}"
+
+
+class SelectorCache:
+    """Remember which locator matched each page step and try it first next time
+
+    Stats live in .cache/selectors_<platform>.json as
+    {step: {"<by>=<value>": {"hits", "misses", "last_hit"}}}. order() puts
+    the locator that matched most recently first, then the rest by smoothed
+    hit rate, keeping the code's order among equals.
+    """
+
+    def __init__(self, platform, config=None):
+        config = config or {}
+        self.enabled = config.get('enabled', True)
+        directory = config.get('dir', '.cache')
+        directory = directory if os.path.isabs(directory) else os.path.join(BASE_DIR, directory)
+        self.path = os.path.join(directory, f'selectors_{platform}.json')
+        self.lock = threading.Lock()
+        self.dirty = False
+        self.stats = self._load() if self.enabled else {}
+
+    def _load(self):
+        try:
+            with open(self.path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def order(self, step, locators):
+        """Return locators in the order they should be tried"""
+        if not self.enabled:
+            return list(locators)
+
+        with self.lock:
+            step_stats = self.stats.get(step, {})
+            latest = max(
+                (key for key in step_stats if step_stats[key].get('last_hit')),
+                key=lambda key: step_stats[key]['last_hit'],
+                default=None
+            )
+
+            def rank(indexed):
+                index, locator = indexed
+                entry = step_stats.get(locator_key(locator), {})
+                hits = entry.get('hits', 0)
+                misses = entry.get('misses', 0)
+                return (locator_key(locator) != latest, -(hits + 1) / (hits + misses + 2), index)
+
+            return [locator for _, locator in sorted(enumerate(locators), key=rank)]
+
+    def record(self, step, locator, hit):
+        """Count a hit or miss for a locator"""
+        if not self.enabled:
+            return
+        with self.lock:
+            entry = self.stats.setdefault(step, {}).setdefault(locator_key(locator), {'hits': 0, 'misses': 0})
+            if hit:
+                entry['hits'] += 1
+                entry['last_hit'] = time.time()
+            else:
+                entry['misses'] += 1
+            self.dirty = True
+
+    def save(self):
+        """Write the stats file if anything changed"""
+        if not self.enabled:
+            return
+        with self.lock:
+            if not self.dirty:
+                return
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(self.stats, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+            self.dirty = False
+
+    def summary(self):
+        """Per-step, per-locator hits, misses and hit rate"""
+        with self.lock:
+            return {
+                step: {
+                    key: {
+                        'hits': entry['hits'],
+                        'misses': entry['misses'],
+                        'hit_rate': entry['hits'] / (entry['hits'] + entry['misses'])
+                        if entry['hits'] + entry['misses'] else 0.0
+                    }
+                    for key, entry in step_stats.items()
+                }
+                for step, step_stats in self.stats.items()
+            }
+
+    def log_summary(self, logger):
+        """Log the hit/miss statistics of every selector"""
+        for step, step_stats in sorted(self.summary().items()):
+            parts = [
+                f"{key} {entry['hits']}/{entry['hits'] + entry['misses']}"
+                for key, entry in sorted(step_stats.items(), key=lambda item: -item[1]['hit_rate'])
+            ]
+            logger.info(f"Selectors [{step}]: {', '.join(parts)}")
+
+
+_caches = {}
+_caches_lock = threading.Lock()
+
+
+def get_selector_cache(platform, config=None):
+    """Return the shared SelectorCache for a platform (one per process)
+
+    A disabled cache (e.g. for a replay run) is never shared.
+    """
+    if not (config or {}).get('enabled', True):
+        return SelectorCache(platform, config)
+    with _caches_lock:
+        if platform not in _caches:
+            _caches[platform] = SelectorCache(platform, config)
+        return _caches[platform]
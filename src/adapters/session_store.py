@@ -0,0 +1,80 @@
+"""
+Persistent browser session storage (cookies or Chrome profile)
+"""
+
+import json
+import os
+import threading
+import time
+
+
+class SessionStore:
+    """Save and restore an authenticated browser session between runs
+
+    mode 'cookies' writes the driver's cookies to .sessions/<platform>_cookies.json
+    after a successful login and re-adds them on the next run. mode 'profile'
+    points Chrome at a persistent user-data directory, so cookies and local
+    storage survive on their own.
+    """
+
+    def __init__(self, platform, config=None, worker_id=None):
+        config = config or {}
+        self.platform = platform
+        self.enabled = config.get('persist', False)
+        self.mode = config.get('mode', 'cookies')
+        self.max_age_hours = config.get('max_age_hours', 72)
+        self.worker_id = worker_id
+
+        base_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+        self.directory = os.path.join(base_dir, config.get('dir', '.sessions'))
+
+    @property
+    def cookies_path(self):
+        return os.path.join(self.directory, f"{self.platform}_cookies.json")
+
+    @property
+    def profile_dir(self):
+        """Chrome user-data dir; each worker needs its own since Chrome locks it"""
+        suffix = f"_{self.worker_id}" if self.worker_id is not None else ""
+        return os.path.join(self.directory, f"{self.platform}_profile{suffix}")
+
+    def chrome_arguments(self):
+        """Extra Chrome arguments for profile mode"""
+        if self.enabled and self.mode == 'profile':
+            os.makedirs(self.profile_dir, exist_ok=True)
+            return [f'--user-data-dir={os.path.abspath(self.profile_dir)}']
+        return []
+
+    def save_cookies(self, driver):
+        """Write the current cookies to disk"""
+        if not self.enabled or self.mode != 'cookies':
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        data = {'saved_at': time.time(), 'cookies': driver.get_cookies()}
+        # Pool workers and platform processes may log in at the same time
+        tmp_path = f"{self.cookies_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.cookies_path)
+
+    def load_cookies(self):
+        """Return saved, unexpired cookies, or None if there is no usable session"""
+        if not self.enabled or self.mode != 'cookies' or not os.path.exists(self.cookies_path):
+            return None
+        try:
+            with open(self.cookies_path, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        now = time.time()
+        if self.max_age_hours and now - data.get('saved_at', 0) > self.max_age_hours * 3600:
+            return None
+
+        cookies = [c for c in data.get('cookies', []) if not c.get('expiry') or c['expiry'] > now]
+        return cookies or None
+
+    def clear(self):
+        """Forget the saved cookies"""
+        if os.path.exists(self.cookies_path):
+            os.remove(self.cookies_path)
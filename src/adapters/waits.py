@@ -0,0 +1,173 @@
+"""
+Condition-based wait engine for WebDriver flows
+"""
+
+import time
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import StaleElementReferenceException
+
+
+DEFAULT_CEILINGS = {
+    'dom_ready': 15,
+    'url_change': 10,
+    'network_idle': 5,
+    'staleness': 5,
+    'element': 10
+}
+
+
+class WaitEngine:
+    """Wait on explicit readiness conditions instead of fixed sleeps
+
+    Every wait is bounded by a per-condition ceiling (configurable under
+    `waits.ceilings` in config.yaml) and recorded with its actual duration.
+    Callers replacing a fixed time.sleep pass `replaces=<seconds>`, so the
+    summary can report how much time the condition saved over the sleep.
+    """
+
+    def __init__(self, adapter, config=None):
+        config = config or {}
+        self.adapter = adapter
+        self.ceilings = dict(DEFAULT_CEILINGS, **(config.get('ceilings') or {}))
+        self.poll_interval = config.get('poll_interval', 0.1)
+        self.network_quiet_ms = config.get('network_quiet_ms', 500)
+        self.implicit_wait = config.get('implicit_wait', 0)
+        self.records = []
+
+    def until(self, name, condition, ceiling=None, replaces=None):
+        """Poll condition until it returns a truthy value or the ceiling is hit
+
+        Returns the condition's value, or None on timeout.
+        """
+        timeout = ceiling if ceiling is not None else self.ceilings.get(name, self.ceilings['element'])
+        start = time.monotonic()
+        result = None
+        try:
+            result = WebDriverWait(self.adapter.driver, timeout, poll_frequency=self.poll_interval).until(condition)
+        except Exception:
+            result = None
+
+        self.records.append({
+            'name': name,
+            'elapsed': time.monotonic() - start,
+            'satisfied': bool(result),
+            'ceiling': timeout,
+            'replaces': replaces
+        })
+        return result
+
+    def dom_ready(self, ceiling=None, replaces=None):
+        """Wait for document.readyState == 'complete'"""
+        return self.until(
+            'dom_ready',
+            lambda d: d.execute_script("return document.readyState") == 'complete',
+            ceiling, replaces
+        )
+
+    def url_changes(self, old_url, ceiling=None, replaces=None):
+        """Wait for the URL to differ from old_url"""
+        return self.until('url_change', EC.url_changes(old_url), ceiling, replaces)
+
+    def url_contains_any(self, fragments, ceiling=None, replaces=None):
+        """Wait for the (lower-cased) URL to contain one of fragments"""
+        return self.until(
+            'url_change',
+            lambda d: any(fragment in d.current_url.lower() for fragment in fragments),
+            ceiling, replaces
+        )
+
+    def url_excludes(self, fragment, ceiling=None, replaces=None):
+        """Wait for the (lower-cased) URL to no longer contain fragment"""
+        return self.until(
+            'url_change',
+            lambda d: fragment not in d.current_url.lower(),
+            ceiling, replaces
+        )
+
+    def network_idle(self, quiet_ms=None, ceiling=None, replaces=None):
+        """Wait until the page is loaded and no new resources were fetched for quiet_ms"""
+        quiet = (quiet_ms if quiet_ms is not None else self.network_quiet_ms) / 1000.0
+        state = {'count': -1, 'since': time.monotonic()}
+
+        def idle(driver):
+            ready, count = driver.execute_script(
+                "return [document.readyState, performance.getEntriesByType('resource').length];"
+            )
+            now = time.monotonic()
+            if count != state['count']:
+                state['count'] = count
+                state['since'] = now
+                return False
+            return ready == 'complete' and now - state['since'] >= quiet
+
+        return self.until('network_idle', idle, ceiling, replaces)
+
+    def staleness(self, element, ceiling=None, replaces=None):
+        """Wait for element to be detached from the DOM (e.g. after navigation)"""
+        return self.until('staleness', EC.staleness_of(element), ceiling, replaces)
+
+    def element(self, by, value, clickable=False, ceiling=None, replaces=None):
+        """Wait for an element to be present (or clickable) and return it"""
+        condition = EC.element_to_be_clickable((by, value)) if clickable else EC.presence_of_element_located((by, value))
+        return self.until('element', condition, ceiling, replaces)
+
+    def any_element(self, locators, clickable=False, accept=None, ceiling=None, replaces=None):
+        """Wait for the first of several (by, value) locators to match
+
+        All locators are checked on every poll, in the given order, so a
+        missing locator never delays the others: the wait is bounded by one
+        ceiling, not one per locator. accept(element) can reject a match.
+        Returns (element, locator), or None on timeout.
+        """
+        locators = list(locators)
+
+        def first_match(driver):
+            for locator in locators:
+                for element in driver.find_elements(*locator):
+                    try:
+                        if clickable and not (element.is_displayed() and element.is_enabled()):
+                            continue
+                        if accept is None or accept(element):
+                            return element, locator
+                    except StaleElementReferenceException:
+                        continue
+            return False
+
+        return self.until('element', first_match, ceiling, replaces)
+
+    def summary(self):
+        """Aggregate the recorded waits"""
+        by_name = {}
+        for record in self.records:
+            entry = by_name.setdefault(record['name'], {'count': 0, 'total': 0.0, 'max': 0.0, 'timeouts': 0})
+            entry['count'] += 1
+            entry['total'] += record['elapsed']
+            entry['max'] = max(entry['max'], record['elapsed'])
+            if not record['satisfied']:
+                entry['timeouts'] += 1
+
+        replacing = [r for r in self.records if r['replaces'] is not None]
+        return {
+            'waits': len(self.records),
+            'total_waited': sum(r['elapsed'] for r in self.records),
+            'fixed_sleep_replaced': sum(r['replaces'] for r in replacing),
+            'time_saved': sum(r['replaces'] - r['elapsed'] for r in replacing),
+            'by_condition': by_name
+        }
+
+    def log_summary(self, logger):
+        """Log the wait summary"""
+        if not self.records:
+            return
+
+        summary = self.summary()
+        logger.info(
+            f"Waits: {summary['waits']} conditions, {summary['total_waited']:.1f}s waited, "
+            f"{summary['time_saved']:.1f}s saved over {summary['fixed_sleep_replaced']:.1f}s of fixed sleeps"
+        )
+        for name, entry in sorted(summary['by_condition'].items()):
+            logger.debug(
+                f"  {name}: {entry['count']} waits, {entry['total']:.1f}s total, "
+                f"{entry['max']:.1f}s max, {entry['timeouts']} timeouts"
+            )
@@ -0,0 +1,136 @@
+"""
+Database-backed apply queue and crawl checkpoints, for resuming after a crash
+"""
+
+import json
+import os
+import socket
+from datetime import datetime, timedelta
+from src.database.records import JobRecord
+
+
+def job_payload(job):
+    """Serialise a job (JobRecord or dict) for the apply_queue table"""
+    record = job if isinstance(job, JobRecord) else JobRecord.from_dict(job)
+    data = {field: record.get(field) for field in JobRecord.__slots__ if record.get(field) is not None}
+    if isinstance(data.get('posted_date'), datetime):
+        data['posted_date'] = data['posted_date'].isoformat()
+    return json.dumps(data)
+
+
+def job_from_payload(payload):
+    data = json.loads(payload)
+    if data.get('posted_date'):
+        data['posted_date'] = datetime.fromisoformat(data['posted_date'])
+    return JobRecord.from_dict(data)
+
+
+class ApplyWorkQueue:
+    """Durable drop-in for the in-memory deque of jobs waiting for an application slot
+
+    append() persists a job as pending; popleft() leases the oldest one for
+    lease_minutes, and complete() marks it done or failed. A run that dies
+    mid-application leaves its lease to expire, after which the next run
+    picks the job up again (at most max_attempts times). Jobs still queued
+    when a run stops are kept for the next run instead of being dropped.
+    """
+
+    durable = True
+
+    def __init__(self, db, platform, config=None, logger=None):
+        config = config or {}
+        self.db = db
+        self.platform = platform
+        self.logger = logger
+        self.lease_seconds = config.get('lease_minutes', 10) * 60
+        self.max_attempts = config.get('max_attempts', 3)
+        self.owner = f"{socket.gethostname()}:{os.getpid()}"
+
+    def __len__(self):
+        return self.db.count_queued_applications(self.platform)
+
+    def __bool__(self):
+        return len(self) > 0
+
+    def append(self, job):
+        """Queue a job (no-op if it is already in the queue)"""
+        self.db.enqueue_application(self.platform, job['job_id'], job_payload(job))
+
+    def popleft(self):
+        """Lease the oldest queued job; raises IndexError when none is left"""
+        while True:
+            leased = self.db.lease_application(self.platform, self.owner, self.lease_seconds, self.max_attempts)
+            if leased is None:
+                raise IndexError("apply queue is empty")
+
+            job_id, payload = leased
+            # A crashed run may have recorded the application but not finished the item
+            if self.db.application_exists(job_id, self.platform):
+                self.db.finish_application(self.platform, job_id, success=True)
+                continue
+            return job_from_payload(payload)
+
+    def complete(self, job, success, error_message=None):
+        """Finish a leased job: done when applied, failed otherwise (not retried)"""
+        self.db.finish_application(self.platform, job['job_id'], success, error_message)
+
+    def release(self, job):
+        """Give a leased job back without trying it"""
+        self.db.release_application(self.platform, job['job_id'])
+
+    def clear(self):
+        """Keep queued jobs for the next run (the deque version discards them)"""
+
+    def counts(self):
+        return self.db.get_apply_queue_counts(self.platform)
+
+
+class ResumableCrawl:
+    """Pagination cursor of one search, saved after every fully processed page
+
+    start_page() returns the page to resume from: the saved next page when
+    the previous run did not finish (and the checkpoint is younger than
+    max_age_hours), else 1. finish() clears the checkpoint once the crawl
+    has ended normally.
+    """
+
+    def __init__(self, db, platform, query, config=None, logger=None):
+        config = config or {}
+        self.db = db
+        self.platform = platform
+        self.query = query
+        self.logger = logger
+        self.max_age = timedelta(hours=config.get('checkpoint_max_age_hours', 24))
+
+    def start_page(self):
+        try:
+            checkpoint = self.db.get_crawl_checkpoint(self.platform, self.query)
+        except Exception as e:
+            if self.logger:
+                self.logger.error(f"Error loading crawl checkpoint: {str(e)}")
+            return 1
+
+        if not checkpoint:
+            return 1
+        if checkpoint['updated_date'] and datetime.utcnow() - checkpoint['updated_date'] > self.max_age:
+            if self.logger:
+                self.logger.info("Crawl checkpoint is too old; starting from page 1.")
+            return 1
+
+        if self.logger:
+            self.logger.info(f"Resuming interrupted crawl at page {checkpoint['next_page']}.")
+        return checkpoint['next_page']
+
+    def page_done(self, page_num):
+        try:
+            self.db.save_crawl_checkpoint(self.platform, self.query, page_num + 1)
+        except Exception as e:
+            if self.logger:
+                self.logger.error(f"Error saving crawl checkpoint: {str(e)}")
+
+    def finish(self):
+        try:
+            self.db.clear_crawl_checkpoint(self.platform, self.query)
+        except Exception as e:
+            if self.logger:
+                self.logger.error(f"Error clearing crawl checkpoint: {str(e)}")
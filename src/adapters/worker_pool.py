@@ -0,0 +1,218 @@
+"""
+Parallel apply worker pool for platform adapters
+"""
+
+import queue
+import threading
+from src.utils.logger import setup_logger
+
+
+_STOP = object()
+
+
+class ApplyWorkerPool:
+    """Pool of logged-in browser workers that apply to jobs from a shared queue
+
+    Each worker owns its own adapter (and therefore its own WebDriver and login),
+    so a crash in one browser never affects the others.
+
+    With a work_queue (ApplyWorkQueue), every submitted job is persisted
+    before it enters the in-memory queue and acknowledged once a worker has
+    tried it, so jobs still waiting when the process dies are picked up by
+    the next run.
+    """
+
+    def __init__(self, adapter, num_workers, max_applications=None, work_queue=None):
+        self.adapter = adapter
+        self.num_workers = max(1, int(num_workers))
+        self.max_applications = max_applications
+        self.work_queue = work_queue
+        self.logger = setup_logger(f'pool.{adapter.platform_name}')
+
+        self.jobs = queue.Queue()
+        self.job_ids = set()
+        self.threads = []
+        self.lock = threading.Lock()
+
+        self.submitted = 0
+        self.applied = 0
+        self.failed = 0
+        self.skipped = 0
+        self.in_flight = 0
+        self.workers_started = 0
+        self.worker_errors = {}
+
+    def start(self):
+        """Start the worker threads"""
+        self.logger.info(f"Starting {self.num_workers} apply workers...")
+        for worker_id in range(1, self.num_workers + 1):
+            thread = threading.Thread(
+                target=self._worker_loop,
+                args=(worker_id,),
+                name=f'{self.adapter.platform_name}-apply-{worker_id}',
+                daemon=True
+            )
+            thread.start()
+            self.threads.append(thread)
+
+    def submit(self, job):
+        """Queue a job for application; False if it was already submitted to this pool"""
+        with self.lock:
+            if job['job_id'] in self.job_ids:
+                return False
+            self.job_ids.add(job['job_id'])
+            self.submitted += 1
+        if self.work_queue is not None:
+            self.work_queue.append(job)
+        self.jobs.put(job)
+        return True
+
+    def resubmit_queued(self):
+        """Lease every job left in the work queue by an earlier run and queue it here"""
+        if self.work_queue is None:
+            return 0
+        count = 0
+        while True:
+            try:
+                job = self.work_queue.popleft()
+            except IndexError:
+                return count
+            if self.submit(job):
+                count += 1
+            else:
+                self.work_queue.release(job)
+
+    def budget_exhausted(self):
+        """Check whether the application budget has been used up"""
+        with self.lock:
+            return self.max_applications is not None and self.applied >= self.max_applications
+
+    def close(self, wait=True):
+        """Stop the workers and return the pool statistics
+
+        With wait=False, jobs still in the queue are discarded instead of applied.
+        """
+        if not wait:
+            self._drain()
+
+        for _ in self.threads:
+            self.jobs.put(_STOP)
+        for thread in self.threads:
+            thread.join()
+        self.threads = []
+
+        # Jobs left behind when every worker failed to start
+        self._drain()
+
+        stats = self.stats()
+        self.logger.info(
+            f"Apply pool finished: {stats['applied']} applied, {stats['failed']} failed, "
+            f"{stats['skipped']} skipped ({stats['workers_started']}/{self.num_workers} workers started)"
+        )
+        return stats
+
+    def stats(self):
+        """Return a snapshot of the pool counters"""
+        with self.lock:
+            return {
+                'submitted': self.submitted,
+                'applied': self.applied,
+                'failed': self.failed,
+                'skipped': self.skipped,
+                'workers_started': self.workers_started,
+                'worker_errors': dict(self.worker_errors)
+            }
+
+    def _drain(self):
+        """Discard queued jobs, counting them as skipped"""
+        while True:
+            try:
+                job = self.jobs.get_nowait()
+            except queue.Empty:
+                return
+            if job is not _STOP:
+                self._skip(job)
+
+    def _skip(self, job):
+        """Count a job as skipped; a work_queue lease goes back so the next run can apply"""
+        if self.work_queue is not None:
+            self.work_queue.release(job)
+        with self.lock:
+            self.skipped += 1
+
+    def _reserve(self):
+        """Reserve one application slot from the budget"""
+        with self.lock:
+            if self.max_applications is not None and self.applied + self.in_flight >= self.max_applications:
+                return False
+            self.in_flight += 1
+            return True
+
+    def _start_worker(self, worker_id):
+        """Create, start and log in a worker adapter"""
+        worker = self.adapter.spawn_worker(worker_id)
+        worker.init_driver()
+        if not worker.login():
+            worker.close_driver()
+            raise RuntimeError("login failed")
+        return worker
+
+    def _worker_loop(self, worker_id):
+        """Take jobs from the queue until told to stop"""
+        worker = None
+        try:
+            try:
+                worker = self._start_worker(worker_id)
+            except Exception as e:
+                self.logger.error(f"Worker {worker_id} could not start: {str(e)}")
+                with self.lock:
+                    self.worker_errors[worker_id] = str(e)
+                return
+
+            with self.lock:
+                self.workers_started += 1
+
+            while True:
+                job = self.jobs.get()
+                if job is _STOP:
+                    break
+
+                if not self._reserve():
+                    self._skip(job)
+                    continue
+
+                success = worker.apply_and_record(job)
+                if self.work_queue is not None:
+                    if success is None:
+                        # Skipped without trying (cooldown, budget): a later run can apply
+                        self.work_queue.release(job)
+                    else:
+                        self.work_queue.complete(job, success)
+
+                with self.lock:
+                    self.in_flight -= 1
+                    if success:
+                        self.applied += 1
+                    elif success is None:
+                        self.skipped += 1
+                    else:
+                        self.failed += 1
+
+                # Replace a crashed browser instead of failing every remaining job
+                if success is False and not worker.is_driver_alive():
+                    self.logger.warning(f"Worker {worker_id} browser died, restarting...")
+                    worker.close_driver()
+                    try:
+                        worker = self._start_worker(worker_id)
+                    except Exception as e:
+                        self.logger.error(f"Worker {worker_id} could not restart: {str(e)}")
+                        with self.lock:
+                            self.worker_errors[worker_id] = str(e)
+                        worker = None
+                        return
+        finally:
+            if worker:
+                try:
+                    worker.close_driver()
+                except Exception as e:
+                    self.logger.warning(f"Worker {worker_id} teardown error: {str(e)}")
@@ -2,6 +2,10 @@
 Database package initialization
 """
 
-from .models import Database, Job, Application, UserProfile, SearchHistory
+from .models import (
+    Database, Job, Application, UserProfile, SearchHistory, CrawlState, ApplyQueueItem, CrawlCheckpoint
+)
+from .records import JobRecord
 
-__all__ = ['Database', 'Job', 'Application', 'UserProfile', 'SearchHistory']
+__all__ = ['Database', 'Job', 'Application', 'UserProfile', 'SearchHistory', 'CrawlState',
+           'ApplyQueueItem', 'CrawlCheckpoint', 'JobRecord']
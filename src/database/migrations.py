@@ -0,0 +1,132 @@
+"""
+Versioned schema migrations for existing databases
+"""
+
+import time
+from datetime import datetime
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, select
+from sqlalchemy.exc import IntegrityError, OperationalError, ProgrammingError
+
+
+metadata = MetaData()
+
+schema_version = Table(
+    'schema_version', metadata,
+    Column('version', Integer, primary_key=True),
+    Column('description', String(255)),
+    Column('applied_date', DateTime, default=datetime.utcnow)
+)
+
+
+def create_index(name, table, *columns):
+    """Migration step creating an index unless it already exists (fresh databases get it from the models)"""
+    def step(connection):
+        connection.exec_driver_sql(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({', '.join(columns)})")
+    return step
+
+
+# (version, description, step). Steps are frozen DDL: append new ones, never edit applied ones.
+MIGRATIONS = [
+    (1, "Index applications by (platform, job_id)",
+     create_index('ix_applications_platform_job_id', 'applications', 'platform', 'job_id')),
+    (2, "Index applications by applied_date",
+     create_index('ix_applications_applied_date', 'applications', 'applied_date')),
+    (3, "Index jobs by (platform, job_id)",
+     create_index('ix_jobs_platform_job_id', 'jobs', 'platform', 'job_id')),
+    (4, "Index apply_queue by (platform, state)",
+     create_index('ix_apply_queue_platform_state', 'apply_queue', 'platform', 'state')),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+# Attempts (and base backoff) while another process holds the SQLite write lock
+LOCK_RETRIES = 5
+LOCK_RETRY_SECONDS = 0.5
+
+
+def is_locked(error):
+    return 'database is locked' in str(error).lower()
+
+
+def is_already_applied(error):
+    """Whether a DDL error only says the change is already in place"""
+    message = str(error).lower()
+    return 'already exists' in message or 'duplicate column' in message
+
+
+def retry_when_locked(func, logger=None):
+    """Call func, retrying with backoff while the database is locked by another process"""
+    for attempt in range(LOCK_RETRIES):
+        try:
+            return func()
+        except OperationalError as e:
+            if not is_locked(e) or attempt == LOCK_RETRIES - 1:
+                raise
+            if logger:
+                logger.info("Database is locked by another process; retrying schema migration")
+            time.sleep(LOCK_RETRY_SECONDS * (attempt + 1))
+
+
+def current_version(engine):
+    """Highest applied migration (0 for a database that has none)"""
+    try:
+        retry_when_locked(lambda: metadata.create_all(engine))
+    except OperationalError as e:
+        if not is_already_applied(e):
+            raise  # Otherwise created concurrently by another process
+    with engine.connect() as connection:
+        versions = connection.execute(select(schema_version.c.version)).scalars().all()
+    return max(versions, default=0)
+
+
+def apply_migration(engine, number, description, step):
+    """Run one migration and record its version; returns False if it was already recorded"""
+    with engine.connect() as connection:
+        if engine.dialect.name == 'sqlite':
+            # Take the write lock before checking the version, so a second process waits here
+            connection.exec_driver_sql("BEGIN IMMEDIATE")
+        recorded = connection.execute(
+            select(schema_version.c.version).where(schema_version.c.version == number)
+        ).first()
+        if recorded:
+            connection.rollback()
+            return False
+
+        try:
+            with connection.begin_nested():
+                step(connection)
+        except (OperationalError, ProgrammingError) as e:
+            if not is_already_applied(e):
+                raise
+            # The change is already in place (made by hand or by an older build): just record it
+
+        connection.execute(schema_version.insert().values(
+            version=number, description=description, applied_date=datetime.utcnow()
+        ))
+        connection.commit()
+        return True
+
+
+def migrate(engine, logger=None):
+    """Apply every migration newer than the database's schema_version; returns the versions applied
+
+    Each migration runs in its own transaction (BEGIN IMMEDIATE on SQLite)
+    together with its schema_version row. When several processes open the
+    same database at once, the others wait for the lock (retrying while it
+    is busy) and then find the version already recorded.
+    """
+    applied = []
+    version = current_version(engine)
+    for number, description, step in MIGRATIONS:
+        if number <= version:
+            continue
+        try:
+            done = retry_when_locked(lambda: apply_migration(engine, number, description, step), logger)
+        except IntegrityError:
+            done = False  # Recorded concurrently by another process
+        if not done:
+            continue
+        applied.append(number)
+        if logger:
+            logger.info(f"Applied schema migration {number}: {description}")
+    return applied
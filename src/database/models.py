@@ -2,11 +2,12 @@
 Database models for JobBider application
 """
 
-from sqlalchemy import create_engine, Column, Integer, String, DateTime, Boolean, Float, Text
+from sqlalchemy import create_engine, Column, Integer, String, DateTime, Boolean, Float, Text, UniqueConstraint, Index, case, func, or_, and_
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from datetime import datetime
+from datetime import datetime, timedelta
 import os
+from .migrations import migrate
 
 Base = declarative_base()
 
@@ -14,6 +15,7 @@ Base = declarative_base()
 class Job(Base):
     """Model for storing job listings"""
     __tablename__ = 'jobs'
+    __table_args__ = (Index('ix_jobs_platform_job_id', 'platform', 'job_id'),)
     
     id = Column(Integer, primary_key=True)
     platform = Column(String(50), nullable=False)  # dice, indeed, etc.
@@ -38,6 +40,10 @@ class Job(Base):
 class Application(Base):
     """Model for tracking job applications"""
     __tablename__ = 'applications'
+    __table_args__ = (
+        Index('ix_applications_platform_job_id', 'platform', 'job_id'),
+        Index('ix_applications_applied_date', 'applied_date'),
+    )
     
     id = Column(Integer, primary_key=True)
     job_id = Column(String(255), nullable=False)  # References Job.job_id
@@ -103,15 +109,74 @@ class SearchHistory(Base):
         return f"<SearchHistory(platform='{self.platform}', date='{self.search_date}', jobs_found={self.jobs_found})>"
 
 
+class CrawlState(Base):
+    """Model for per-query incremental crawl state"""
+    __tablename__ = 'crawl_state'
+    __table_args__ = (UniqueConstraint('platform', 'query', name='uq_crawl_state_platform_query'),)
+    
+    id = Column(Integer, primary_key=True)
+    platform = Column(String(50), nullable=False)
+    query = Column(String(500), nullable=False)  # Search URL path + query string
+    high_water_job_id = Column(String(255))  # Newest job seen at the top of page 1
+    last_new_page = Column(Integer)  # Deepest page that still had unseen jobs
+    updated_date = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    def __repr__(self):
+        return f"<CrawlState(platform='{self.platform}', query='{self.query}', high_water='{self.high_water_job_id}')>"
+
+
+class ApplyQueueItem(Base):
+    """Model for the durable queue of jobs waiting to be applied to"""
+    __tablename__ = 'apply_queue'
+    __table_args__ = (
+        UniqueConstraint('platform', 'job_id', name='uq_apply_queue_platform_job'),
+        Index('ix_apply_queue_platform_state', 'platform', 'state'),
+    )
+    
+    id = Column(Integer, primary_key=True)
+    platform = Column(String(50), nullable=False)
+    job_id = Column(String(255), nullable=False)
+    payload = Column(Text, nullable=False)  # JSON of the job record
+    state = Column(String(20), nullable=False, default='pending')  # pending, in_progress, done, failed
+    attempts = Column(Integer, nullable=False, default=0)  # Times the item was leased
+    lease_owner = Column(String(255))  # host:pid of the run holding the lease
+    lease_expires = Column(DateTime)
+    error_message = Column(Text, nullable=True)
+    enqueued_date = Column(DateTime, default=datetime.utcnow)
+    updated_date = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    def __repr__(self):
+        return f"<ApplyQueueItem(job_id='{self.job_id}', platform='{self.platform}', state='{self.state}')>"
+
+
+class CrawlCheckpoint(Base):
+    """Model for the pagination cursor of an unfinished crawl"""
+    __tablename__ = 'crawl_checkpoints'
+    __table_args__ = (UniqueConstraint('platform', 'query', name='uq_crawl_checkpoints_platform_query'),)
+    
+    id = Column(Integer, primary_key=True)
+    platform = Column(String(50), nullable=False)
+    query = Column(String(500), nullable=False)  # Search URL path + query string
+    next_page = Column(Integer, nullable=False)  # First page not fully processed yet
+    updated_date = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    def __repr__(self):
+        return f"<CrawlCheckpoint(platform='{self.platform}', query='{self.query}', next_page={self.next_page})>"
+
+
 class Database:
     """Database manager class"""
     
-    def __init__(self, db_url=None):
+    def __init__(self, db_url=None, create_schema=True):
         if db_url is None:
             db_url = os.getenv('DATABASE_URL', 'sqlite:///jobider.db')
         
         self.engine = create_engine(db_url)
-        Base.metadata.create_all(self.engine)
+        # create_schema=False: another process (e.g. the platform runner) already set it up
+        if create_schema:
+            Base.metadata.create_all(self.engine)
+            # Upgrade databases created by older versions (indexes on existing tables)
+            migrate(self.engine)
         self.Session = sessionmaker(bind=self.engine)
     
     def get_session(self):
@@ -136,11 +201,240 @@ class Database:
         finally:
             session.close()
     
+    def known_job_ids(self, job_ids, platform):
+        """Return the subset of job_ids already in the jobs table (one query)"""
+        job_ids = [job_id for job_id in job_ids if job_id]
+        if not job_ids:
+            return set()
+        
+        session = self.get_session()
+        try:
+            rows = session.query(Job.job_id).filter(
+                Job.platform == platform,
+                Job.job_id.in_(job_ids)
+            ).all()
+            return {row.job_id for row in rows}
+        finally:
+            session.close()
+    
+    def applied_job_ids(self, job_ids, platform):
+        """Return the subset of job_ids with an application record (one query)"""
+        job_ids = [job_id for job_id in job_ids if job_id]
+        if not job_ids:
+            return set()
+        
+        session = self.get_session()
+        try:
+            rows = session.query(Application.job_id).filter(
+                Application.platform == platform,
+                Application.job_id.in_(job_ids)
+            ).distinct().all()
+            return {row.job_id for row in rows}
+        finally:
+            session.close()
+    
+    def find_duplicates(self, job_ids, platform):
+        """Return (seen, applied): the job_ids already stored and already applied to"""
+        job_ids = list(dict.fromkeys(job_ids))
+        return self.known_job_ids(job_ids, platform), self.applied_job_ids(job_ids, platform)
+    
+    def get_crawl_state(self, platform, query):
+        """Get the incremental crawl state for a query (None if never crawled)"""
+        session = self.get_session()
+        try:
+            state = session.query(CrawlState).filter_by(platform=platform, query=query).first()
+            if state is None:
+                return None
+            return {
+                'high_water_job_id': state.high_water_job_id,
+                'last_new_page': state.last_new_page,
+                'updated_date': state.updated_date
+            }
+        finally:
+            session.close()
+    
+    def save_crawl_state(self, platform, query, high_water_job_id=None, last_new_page=None):
+        """Create or update the incremental crawl state for a query"""
+        session = self.get_session()
+        try:
+            state = session.query(CrawlState).filter_by(platform=platform, query=query).first()
+            if state is None:
+                state = CrawlState(platform=platform, query=query)
+                session.add(state)
+            if high_water_job_id is not None:
+                state.high_water_job_id = high_water_job_id
+            if last_new_page is not None:
+                state.last_new_page = last_new_page
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            raise e
+        finally:
+            session.close()
+    
+    def enqueue_application(self, platform, job_id, payload):
+        """Add a job to the apply queue; returns False if it was already queued"""
+        session = self.get_session()
+        try:
+            if session.query(ApplyQueueItem.id).filter_by(platform=platform, job_id=job_id).first():
+                return False
+            session.add(ApplyQueueItem(platform=platform, job_id=job_id, payload=payload, state='pending'))
+            session.commit()
+            return True
+        except Exception as e:
+            session.rollback()
+            raise e
+        finally:
+            session.close()
+    
+    def _leasable(self, query, platform, now):
+        return query.filter(
+            ApplyQueueItem.platform == platform,
+            or_(
+                ApplyQueueItem.state == 'pending',
+                and_(ApplyQueueItem.state == 'in_progress', ApplyQueueItem.lease_expires < now)
+            )
+        )
+    
+    def lease_application(self, platform, owner, lease_seconds, max_attempts=3):
+        """Claim the oldest pending (or lease-expired) queue item
+        
+        Returns (job_id, payload), or None when nothing is leasable. An item
+        whose lease already expired max_attempts times is marked failed.
+        """
+        session = self.get_session()
+        try:
+            while True:
+                now = datetime.utcnow()
+                item = self._leasable(session.query(ApplyQueueItem), platform, now).order_by(ApplyQueueItem.id).first()
+                if item is None:
+                    return None
+                
+                if item.attempts >= max_attempts:
+                    values = {'state': 'failed', 'lease_owner': None, 'lease_expires': None,
+                              'error_message': f"Lease expired {item.attempts} times"}
+                else:
+                    values = {'state': 'in_progress', 'attempts': item.attempts + 1, 'lease_owner': owner,
+                              'lease_expires': now + timedelta(seconds=lease_seconds)}
+                
+                # Conditional on the state we read, so two runs never claim the same item
+                claimed = session.query(ApplyQueueItem).filter(
+                    ApplyQueueItem.id == item.id,
+                    ApplyQueueItem.state == item.state,
+                    ApplyQueueItem.attempts == item.attempts
+                ).update(values, synchronize_session=False)
+                session.commit()
+                
+                if claimed and values['state'] == 'in_progress':
+                    return item.job_id, item.payload
+                session.expire_all()
+        except Exception as e:
+            session.rollback()
+            raise e
+        finally:
+            session.close()
+    
+    def finish_application(self, platform, job_id, success, error_message=None):
+        """Mark a leased queue item done (or failed)"""
+        self._set_queue_state(platform, job_id, 'done' if success else 'failed', error_message)
+    
+    def release_application(self, platform, job_id):
+        """Return a leased queue item to pending, giving back the attempt it was not tried on"""
+        session = self.get_session()
+        try:
+            session.query(ApplyQueueItem).filter_by(platform=platform, job_id=job_id).update({
+                'state': 'pending',
+                'attempts': case((ApplyQueueItem.attempts > 0, ApplyQueueItem.attempts - 1), else_=0),
+                'lease_owner': None,
+                'lease_expires': None
+            }, synchronize_session=False)
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            raise e
+        finally:
+            session.close()
+    
+    def _set_queue_state(self, platform, job_id, state, error_message=None):
+        session = self.get_session()
+        try:
+            session.query(ApplyQueueItem).filter_by(platform=platform, job_id=job_id).update({
+                'state': state,
+                'lease_owner': None,
+                'lease_expires': None,
+                'error_message': error_message
+            }, synchronize_session=False)
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            raise e
+        finally:
+            session.close()
+    
+    def count_queued_applications(self, platform):
+        """Count queue items that can be leased now"""
+        session = self.get_session()
+        try:
+            return self._leasable(session.query(func.count(ApplyQueueItem.id)), platform, datetime.utcnow()).scalar()
+        finally:
+            session.close()
+    
+    def get_apply_queue_counts(self, platform):
+        """Queue items per state"""
+        session = self.get_session()
+        try:
+            rows = session.query(ApplyQueueItem.state, func.count(ApplyQueueItem.id)).filter(
+                ApplyQueueItem.platform == platform
+            ).group_by(ApplyQueueItem.state).all()
+            return {state: count for state, count in rows}
+        finally:
+            session.close()
+    
+    def get_crawl_checkpoint(self, platform, query):
+        """Get the checkpoint of an unfinished crawl (None if there is none)"""
+        session = self.get_session()
+        try:
+            checkpoint = session.query(CrawlCheckpoint).filter_by(platform=platform, query=query).first()
+            if checkpoint is None:
+                return None
+            return {'next_page': checkpoint.next_page, 'updated_date': checkpoint.updated_date}
+        finally:
+            session.close()
+    
+    def save_crawl_checkpoint(self, platform, query, next_page):
+        """Create or update the checkpoint of a crawl in progress"""
+        session = self.get_session()
+        try:
+            checkpoint = session.query(CrawlCheckpoint).filter_by(platform=platform, query=query).first()
+            if checkpoint is None:
+                checkpoint = CrawlCheckpoint(platform=platform, query=query, next_page=next_page)
+                session.add(checkpoint)
+            checkpoint.next_page = next_page
+            checkpoint.updated_date = datetime.utcnow()
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            raise e
+        finally:
+            session.close()
+    
+    def clear_crawl_checkpoint(self, platform, query):
+        """Delete the checkpoint of a crawl that finished"""
+        session = self.get_session()
+        try:
+            session.query(CrawlCheckpoint).filter_by(platform=platform, query=query).delete(synchronize_session=False)
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            raise e
+        finally:
+            session.close()
+    
     def save_job(self, job_data):
-        """Save a job to the database"""
+        """Save a job (a JobRecord or a dict of Job columns) to the database"""
         session = self.get_session()
         try:
-            job = Job(**job_data)
+            job = job_data.to_orm() if hasattr(job_data, 'to_orm') else Job(**job_data)
             session.add(job)
             session.commit()
             return job
@@ -150,6 +444,23 @@ class Database:
         finally:
             session.close()
     
+    def save_jobs(self, records):
+        """Insert many JobRecords in one bulk statement; returns the number inserted"""
+        mappings = [record.to_mapping() for record in records]
+        if not mappings:
+            return 0
+        
+        session = self.get_session()
+        try:
+            session.bulk_insert_mappings(Job, mappings)
+            session.commit()
+            return len(mappings)
+        except Exception as e:
+            session.rollback()
+            raise e
+        finally:
+            session.close()
+    
     def save_application(self, app_data):
         """Save an application record"""
         session = self.get_session()
@@ -176,6 +487,25 @@ class Database:
         finally:
             session.close()
     
+    def companies_applied_since(self, since):
+        """Map each (lowercased) company with a successful application since a datetime to the latest one"""
+        session = self.get_session()
+        try:
+            rows = session.query(Job.company, func.max(Application.applied_date)).join(
+                Application, and_(Application.job_id == Job.job_id, Application.platform == Job.platform)
+            ).filter(
+                Application.applied_date >= since,
+                Application.success == True
+            ).group_by(Job.company).all()
+            companies = {}
+            for company, applied_date in rows:
+                if company:
+                    key = company.lower()
+                    companies[key] = max(applied_date, companies.get(key, applied_date))
+            return companies
+        finally:
+            session.close()
+    
     def get_statistics(self):
         """Get application statistics"""
         session = self.get_session()
@@ -184,11 +514,23 @@ class Database:
             total_applications = session.query(Application).count()
             successful_applications = session.query(Application).filter_by(success=True).count()
             
+            by_platform = {}
+            for platform, count in session.query(Job.platform, func.count(Job.id)).group_by(Job.platform):
+                by_platform.setdefault(platform, {'jobs': 0, 'applications': 0, 'successful': 0})['jobs'] = count
+            for platform, success, count in session.query(
+                Application.platform, Application.success, func.count(Application.id)
+            ).group_by(Application.platform, Application.success):
+                platform_stats = by_platform.setdefault(platform, {'jobs': 0, 'applications': 0, 'successful': 0})
+                platform_stats['applications'] += count
+                if success:
+                    platform_stats['successful'] += count
+            
             return {
                 'total_jobs_discovered': total_jobs,
                 'total_applications': total_applications,
                 'successful_applications': successful_applications,
-                'failed_applications': total_applications - successful_applications
+                'failed_applications': total_applications - successful_applications,
+                'by_platform': by_platform
             }
         finally:
             session.close()
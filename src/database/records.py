@@ -0,0 +1,83 @@
+"""
+Lightweight in-memory job record passed between search, save and apply
+"""
+
+from src.utils.helpers import extract_salary
+from .models import Job
+
+
+# Job columns a record carries (id and discovered_date are filled by the database)
+JOB_COLUMNS = (
+    'job_id', 'platform', 'title', 'company', 'location', 'job_type', 'experience_level',
+    'salary_min', 'salary_max', 'description', 'requirements', 'url', 'posted_date'
+)
+
+
+class JobRecord:
+    """A job listing as found on a results page
+
+    Holds plain values only (no WebElement or other driver handles), so a
+    record stays valid after the browser navigates away. The listing's
+    salary text is kept as salary and parsed into salary_min/salary_max.
+    Item access (job['title'], job.get('company')) is supported for code
+    written against the old job dicts. stored records whether the job is
+    already in the jobs table (None when not known), so saving it later
+    needs no lookup.
+    """
+
+    __slots__ = JOB_COLUMNS + ('salary', 'match_score', 'stored')
+
+    def __init__(self, job_id=None, title=None, company=None, url=None, location=None,
+                 description=None, salary=None, salary_min=None, salary_max=None, platform=None,
+                 requirements=None, job_type=None, experience_level=None, posted_date=None,
+                 match_score=None, stored=None):
+        self.job_id = job_id
+        self.title = title
+        self.company = company
+        self.url = url
+        self.location = location
+        self.description = description
+        self.requirements = requirements
+        self.platform = platform
+        self.job_type = job_type
+        self.experience_level = experience_level
+        self.posted_date = posted_date
+        self.match_score = match_score
+        self.stored = stored
+        self.salary = salary
+        if salary and salary_min is None and salary_max is None:
+            salary_min, salary_max = extract_salary(salary)
+        self.salary_min = salary_min
+        self.salary_max = salary_max
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a record from a job dict, ignoring keys that are not record fields"""
+        return cls(**{key: value for key, value in data.items() if key in cls.__slots__})
+
+    def to_mapping(self):
+        """Column values for the jobs table (e.g. for Session.bulk_insert_mappings)"""
+        return {column: getattr(self, column) for column in JOB_COLUMNS}
+
+    def to_orm(self):
+        """A new Job row for this record"""
+        return Job(**self.to_mapping())
+
+    def get(self, key, default=None):
+        return getattr(self, key) if key in self.__slots__ else default
+
+    def __getitem__(self, key):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key, value):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key):
+        return key in self.__slots__ and getattr(self, key) is not None
+
+    def __repr__(self):
+        return f"<JobRecord(job_id='{self.job_id}', title='{self.title}', company='{self.company}')>"
@@ -23,15 +23,17 @@ class JobMatcher:
         
         return True, score
     
-    def filter_jobs(self, jobs):
-        """Filter a list of jobs by criteria"""
-        matched_jobs = []
-        
+    def filter_stream(self, jobs):
+        """Yield each matching job (with its match_score) as it arrives from an iterable"""
         for job in jobs:
             matches, score = self.matches(job)
             if matches:
                 job['match_score'] = score
-                matched_jobs.append(job)
+                yield job
+    
+    def filter_jobs(self, jobs):
+        """Filter a list of jobs by criteria"""
+        matched_jobs = list(self.filter_stream(jobs))
         
         # Sort by match score (descending)
         matched_jobs.sort(key=lambda x: x.get('match_score', 0), reverse=True)
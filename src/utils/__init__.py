@@ -2,7 +2,7 @@
 Utilities package
 """
 
-from .helpers import load_config, load_env, calculate_match_score, extract_salary, match_keywords
+from .helpers import load_config, load_env, random_delay, calculate_match_score, extract_salary, match_keywords
 from .logger import setup_logger
 
 __all__ = ['load_config', 'load_env', 'random_delay', 'calculate_match_score', 
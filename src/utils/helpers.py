@@ -22,6 +22,11 @@ def load_env():
     load_dotenv()
 
 
+def random_delay(min_seconds=1, max_seconds=3):
+    """Sleep for a random duration between min_seconds and max_seconds"""
+    time.sleep(random.uniform(min_seconds, max_seconds))
+
+
 def sanitize_filename(filename):
     """Sanitize filename for safe file operations"""
     invalid_chars = '<>:"/\\|?*'
@@ -41,7 +46,7 @@ def extract_salary(salary_text):
     salary_text = salary_text.replace(',', '').replace('$', '')
     
     # Try to find salary range (e.g., "100000 - 150000" or "100K - 150K")
-    range_pattern = r'(\d+)(?:K|k)?\s*[-to]+\s*(\d+)(?:K|k)?'
+    range_pattern = r'(\d+(?:\.\d+)?)(?:K|k)?\s*[-to]+\s*(\d+(?:\.\d+)?)(?:K|k)?'
     match = re.search(range_pattern, salary_text)
     
     if match:
@@ -56,7 +61,7 @@ def extract_salary(salary_text):
         return min_sal, max_sal
     
     # Try to find single salary value
-    single_pattern = r'(\d+)(?:K|k)?'
+    single_pattern = r'(\d+(?:\.\d+)?)(?:K|k)?'
     match = re.search(single_pattern, salary_text)
     
     if match:
@@ -14,8 +14,9 @@ def setup_logger(name='jobider', log_level=None):
     if log_level is None:
         log_level = os.getenv('LOG_LEVEL', 'INFO')
     
-    # Create logs directory if it doesn't exist
-    log_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'logs')
+    # Create logs directory if it doesn't exist (LOG_DIR overrides the default)
+    log_dir = os.getenv('LOG_DIR') or os.path.join(
+        os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'logs')
     os.makedirs(log_dir, exist_ok=True)
     
     # Create logger
@@ -0,0 +1,234 @@
+"""
+Rate limiting for applications: token buckets, jittered spacing and a daily budget
+"""
+
+import random
+import threading
+import time
+from datetime import datetime, timedelta
+
+
+# How often in_cooldown re-reads recent applications (other processes apply too)
+COOLDOWN_RELOAD_SECONDS = 600
+
+# Company names filled in for cards without one; they don't name a company to cool down
+PLACEHOLDER_COMPANIES = {'unknown', 'n/a', 'not specified', 'confidential'}
+
+
+def cooldown_key(company):
+    """Lowercased company name, or None when it is empty or a placeholder"""
+    key = (company or '').strip().lower()
+    return key if key and key not in PLACEHOLDER_COMPANIES else None
+
+
+class TokenBucket:
+    """Classic token bucket: `rate` tokens per second, holding at most `capacity`"""
+
+    def __init__(self, rate, capacity=1, clock=time.monotonic):
+        self.rate = float(rate)
+        self.capacity = max(1.0, float(capacity))
+        self.clock = clock
+        self.tokens = self.capacity
+        self.updated = clock()
+
+    def _refill(self):
+        now = self.clock()
+        if self.rate > 0:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def time_until_token(self):
+        """Seconds until a token is available (0 if one is available now)"""
+        self._refill()
+        if self.tokens >= 1:
+            return 0.0
+        if self.rate <= 0:
+            return float('inf')
+        return (1 - self.tokens) / self.rate
+
+    def try_take(self):
+        """Take a token if one is available"""
+        if self.time_until_token() > 0:
+            return False
+        self.tokens -= 1
+        return True
+
+
+class RateLimiter:
+    """Per-platform limiter that keeps applications inside the safety settings
+
+    Applications are spaced by a token bucket refilling one token every
+    min_delay_seconds; with random_delay_enabled each grant also pushes the
+    next one back by a random 0..(max - min) seconds. The daily budget is
+    max_applications_per_day minus what the database already recorded today.
+    Companies applied to within cooldown_period_hours are reported by
+    in_cooldown(). ready()/wait_time() never block, so callers can keep
+    searching while the apply lane waits; acquire() blocks.
+    """
+
+    def __init__(self, safety_config=None, platform=None, db=None, clock=time.monotonic):
+        config = safety_config or {}
+        self.platform = platform
+        self.db = db
+        self.clock = clock
+
+        self.min_delay = float(config.get('min_delay_seconds', 0) or 0)
+        self.max_delay = max(self.min_delay, float(config.get('max_delay_seconds', self.min_delay) or 0))
+        self.jitter = config.get('random_delay_enabled', True)
+        self.daily_limit = config.get('max_applications_per_day')
+        self.cooldown_hours = config.get('cooldown_period_hours', 0) or 0
+
+        self.bucket = None
+        if self.min_delay > 0:
+            self.bucket = TokenBucket(1.0 / self.min_delay, capacity=config.get('burst', 1), clock=clock)
+        self.not_before = 0.0
+
+        self.lock = threading.Lock()
+        self.day = None
+        self.used_before_start = 0
+        self.granted_today = 0
+        self.recent_companies = None  # lowercased company -> last application (UTC)
+        self.companies_loaded = None
+        self.granted = 0
+        self.deferred = 0
+        self.waited_seconds = 0.0
+
+    def _roll_day(self):
+        """Reload today's application count from the database on a new (UTC) day"""
+        today = datetime.utcnow().date()
+        if self.day != today:
+            self.day = today
+            self.granted_today = 0
+            self.used_before_start = self.db.get_applications_today() if self.db else 0
+
+    def remaining_today(self):
+        """Applications left in today's budget (None = unlimited)"""
+        with self.lock:
+            return self._remaining_today()
+
+    def _remaining_today(self):
+        if self.daily_limit is None:
+            return None
+        self._roll_day()
+        return max(0, self.daily_limit - self.used_before_start - self.granted_today)
+
+    def budget_exhausted(self):
+        """Check whether today's budget is used up"""
+        return self.remaining_today() == 0
+
+    def _wait_time(self):
+        spacing = self.bucket.time_until_token() if self.bucket else 0.0
+        return max(spacing, self.not_before - self.clock(), 0.0)
+
+    def wait_time(self):
+        """Seconds until the next application may start (0 = now; inf = budget exhausted)"""
+        with self.lock:
+            if self._remaining_today() == 0:
+                return float('inf')
+            return self._wait_time()
+
+    def ready(self):
+        """Check, without blocking, whether an application may start now"""
+        return self.wait_time() == 0
+
+    def try_acquire(self):
+        """Take a slot if one is available now"""
+        with self.lock:
+            if self._remaining_today() == 0 or self._wait_time() > 0:
+                return False
+            self._grant()
+            return True
+
+    def acquire(self, stop_event=None):
+        """Block until a slot is available; returns False if the budget runs out or stop_event is set"""
+        start = self.clock()
+        while True:
+            with self.lock:
+                if self._remaining_today() == 0:
+                    return False
+                wait = self._wait_time()
+                if wait <= 0:
+                    self._grant()
+                    self.waited_seconds += self.clock() - start
+                    return True
+
+            if stop_event is not None:
+                if stop_event.wait(min(wait, 1.0)):
+                    return False
+            else:
+                time.sleep(min(wait, 1.0))
+
+    def _grant(self):
+        """Consume a token, count it against today's budget and schedule the jitter (lock held)"""
+        if self.bucket:
+            self.bucket.try_take()
+        if self.jitter and self.max_delay > self.min_delay:
+            self.not_before = self.clock() + self.min_delay + random.uniform(0, self.max_delay - self.min_delay)
+        self.granted_today += 1
+        self.granted += 1
+
+    def in_cooldown(self, company):
+        """Check whether we applied to this company within cooldown_period_hours
+
+        Each company's cooldown runs from its last application, so it lifts
+        on its own; the applications are re-read every
+        COOLDOWN_RELOAD_SECONDS, since a limiter lives as long as its process.
+        """
+        key = cooldown_key(company)
+        if not key or not self.cooldown_hours or not self.db:
+            return False
+        cooldown = timedelta(hours=self.cooldown_hours)
+        with self.lock:
+            now = datetime.utcnow()
+            if self.recent_companies is None or (now - self.companies_loaded).total_seconds() > COOLDOWN_RELOAD_SECONDS:
+                loaded = self.db.companies_applied_since(now - cooldown)
+                # Keep applications recorded here that the database may not show yet
+                for name, applied in (self.recent_companies or {}).items():
+                    if name not in loaded or applied > loaded[name]:
+                        loaded[name] = applied
+                self.recent_companies = loaded
+                self.companies_loaded = now
+            applied = self.recent_companies.get(key)
+            return applied is not None and now - applied < cooldown
+
+    def record_company(self, company):
+        """Start the cooldown for a company we just applied to"""
+        key = cooldown_key(company)
+        if not key:
+            return
+        with self.lock:
+            if self.recent_companies is not None:
+                self.recent_companies[key] = datetime.utcnow()
+
+    def summary(self):
+        """Counters for logging"""
+        return {
+            'granted': self.granted,
+            'deferred': self.deferred,
+            'waited_seconds': self.waited_seconds,
+            'remaining_today': self.remaining_today()
+        }
+
+
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(config, platform, db=None):
+    """Return the shared RateLimiter for a platform and database (one per process)
+
+    Keyed on the database URL rather than the Database object, so apply
+    workers and successive scheduler runs (each opening its own Database)
+    share it, and spacing and the daily budget hold across all of them.
+    Stand-in databases without an engine are keyed by identity.
+    """
+    engine = getattr(db, 'engine', None)
+    key = (platform, str(engine.url) if engine is not None else id(db))
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            limiter = _limiters[key] = RateLimiter((config or {}).get('safety'), platform, db)
+        elif db is not None:
+            # Query through the newest connection pool for this database
+            limiter.db = db
+        return limiter
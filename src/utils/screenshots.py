@@ -0,0 +1,161 @@
+"""
+Screenshot capture policy and background writer
+"""
+
+import io
+import os
+import queue
+import threading
+from datetime import datetime
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow is optional; without it PNGs are written as captured
+    Image = None
+
+
+MODES = ('off', 'on_failure', 'every_n', 'always')
+
+_STOP = object()
+
+
+class ScreenshotPolicy:
+    """Decide which screenshot requests are captured
+
+    off         - never
+    on_failure  - only screenshots flagged as failures
+    every_n     - failures, plus every Nth other screenshot
+    always      - every screenshot
+    """
+
+    def __init__(self, config=None):
+        config = config or {}
+        self.mode = config.get('mode', 'always')
+        if self.mode not in MODES:
+            raise ValueError(f"Invalid screenshots.mode '{self.mode}' (expected one of {', '.join(MODES)})")
+        self.every_n = max(1, int(config.get('every_n', 10)))
+        self.requests = 0
+
+    def should_capture(self, failure=False):
+        """Check whether the next screenshot request should be captured"""
+        self.requests += 1
+        if self.mode == 'off':
+            return False
+        if self.mode == 'always' or failure:
+            return True
+        if self.mode == 'every_n':
+            return (self.requests - 1) % self.every_n == 0
+        return False
+
+
+class ScreenshotWriter:
+    """Encode and write screenshots on a background thread
+
+    Capture hands over raw PNG bytes and returns immediately. The writer thread
+    optionally downscales or re-encodes them (requires Pillow), writes them under
+    unique names, and deletes the oldest files once the directory grows past
+    max_dir_mb. If the queue is full the screenshot is dropped instead of
+    blocking the caller.
+    """
+
+    def __init__(self, directory, logger, config=None):
+        config = config or {}
+        self.directory = directory
+        self.logger = logger
+        self.max_width = int(config.get('max_width', 0) or 0)
+        self.format = config.get('format', 'png').lower()
+        self.jpeg_quality = int(config.get('jpeg_quality', 70))
+        self.max_bytes = int(float(config.get('max_dir_mb', 200)) * 1024 * 1024)
+
+        self.jobs = queue.Queue(maxsize=int(config.get('queue_size', 32)))
+        self.sequence = 0
+        self.written = 0
+        self.dropped = 0
+        self.files = []
+        self.total_bytes = 0
+        self.thread = None
+
+        if (self.max_width or self.format != 'png') and Image is None:
+            self.logger.warning("Pillow not installed: screenshots will be saved as full-size PNG")
+
+    def start(self):
+        """Start the writer thread"""
+        os.makedirs(self.directory, exist_ok=True)
+        self._scan_existing()
+        self.thread = threading.Thread(target=self._write_loop, name='screenshot-writer', daemon=True)
+        self.thread.start()
+
+    def submit(self, name, png_bytes):
+        """Queue a captured PNG for writing; never blocks"""
+        self.sequence += 1
+        try:
+            self.jobs.put_nowait((self.sequence, name, png_bytes))
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self):
+        """Flush pending screenshots and stop the writer thread"""
+        if self.thread:
+            self.jobs.put(_STOP)
+            self.thread.join()
+            self.thread = None
+
+    def _scan_existing(self):
+        """Pick up files from earlier runs so rotation covers them too"""
+        entries = []
+        for filename in os.listdir(self.directory):
+            path = os.path.join(self.directory, filename)
+            if os.path.isfile(path):
+                entries.append((os.path.getmtime(path), path, os.path.getsize(path)))
+        entries.sort()
+        self.files = [(path, size) for _, path, size in entries]
+        self.total_bytes = sum(size for _, size in self.files)
+
+    def _encode(self, png_bytes):
+        """Downscale / re-encode; returns (bytes, extension)"""
+        if Image is None or (not self.max_width and self.format == 'png'):
+            return png_bytes, 'png'
+
+        image = Image.open(io.BytesIO(png_bytes))
+        if self.max_width and image.width > self.max_width:
+            height = int(image.height * self.max_width / image.width)
+            image = image.resize((self.max_width, height))
+
+        output = io.BytesIO()
+        if self.format in ('jpg', 'jpeg'):
+            image.convert('RGB').save(output, format='JPEG', quality=self.jpeg_quality, optimize=True)
+            return output.getvalue(), 'jpg'
+        image.save(output, format='PNG', optimize=True)
+        return output.getvalue(), 'png'
+
+    def _rotate(self):
+        """Delete the oldest screenshots while over the size limit"""
+        while self.files and self.total_bytes > self.max_bytes:
+            path, size = self.files.pop(0)
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            self.total_bytes -= size
+
+    def _write_loop(self):
+        while True:
+            item = self.jobs.get()
+            if item is _STOP:
+                return
+
+            sequence, name, png_bytes = item
+            try:
+                data, extension = self._encode(png_bytes)
+                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+                filepath = os.path.join(self.directory, f"{timestamp}_{sequence:05d}_{name}.{extension}")
+                with open(filepath, 'wb') as f:
+                    f.write(data)
+
+                self.written += 1
+                self.files.append((filepath, len(data)))
+                self.total_bytes += len(data)
+                self._rotate()
+                self.logger.debug(f"Screenshot saved: {filepath}")
+            except Exception as e:
+                self.logger.warning(f"Could not write screenshot {name}: {str(e)}")
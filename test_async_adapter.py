@@ -0,0 +1,191 @@
+"""
+Tests for the asyncio adapter interface and the sync-to-async bridge
+"""
+
+import asyncio
+import threading
+import time
+
+from src.adapters import AsyncPlatformAdapter, SyncAdapterBridge
+from src.adapters.base_adapter import BasePlatformAdapter
+from src.adapters.async_adapter import gather_limited
+from src.database import Database
+
+
+CONFIG = {
+    'search_criteria': {'keywords': ['Python', 'Go'], 'locations': ['Remote', 'Austin, TX']},
+    'platforms': {}
+}
+
+
+class FakeDatabase:
+    def __init__(self):
+        self.applications = []
+
+    def application_exists(self, job_id, platform):
+        return any(app['job_id'] == job_id for app in self.applications)
+
+    def job_exists(self, job_id, platform):
+        return False
+
+    def save_application(self, app_data):
+        self.applications.append(app_data)
+
+    def save_job(self, job):
+        pass
+
+
+class FakeSyncAdapter(BasePlatformAdapter):
+    """Synchronous adapter that records which thread each call ran on"""
+
+    def __init__(self, config, db):
+        super().__init__(config, db)
+        self.threads = set()
+
+    @property
+    def platform_name(self):
+        return "fake"
+
+    def init_driver(self):
+        self.threads.add(threading.get_ident())
+
+    def close_driver(self):
+        self.threads.add(threading.get_ident())
+
+    def login(self):
+        return True
+
+    def search_jobs(self, keywords, location):
+        self.threads.add(threading.get_ident())
+        return [{'job_id': f'{keywords}-{location}', 'url': 'about:blank'}]
+
+    def extract_job_details(self, job_element):
+        return None
+
+    def apply_to_job(self, job_url, job_data):
+        self.threads.add(threading.get_ident())
+        return True
+
+
+class SlowAsyncAdapter(AsyncPlatformAdapter):
+    """Async adapter whose searches each take 0.2s of simulated I/O"""
+
+    @property
+    def platform_name(self):
+        return "slow"
+
+    async def login(self):
+        return True
+
+    async def search_jobs(self, keywords, location):
+        await asyncio.sleep(0.2)
+        return [{'job_id': f'{keywords}-{location}', 'url': 'about:blank'}]
+
+    async def extract_job_details(self, job_element):
+        return None
+
+    async def apply_to_job(self, job_url, job_data):
+        return True
+
+
+def test_bridge_runs_sync_adapter_on_one_thread():
+    """The bridge drives a sync adapter from the event loop on a single worker thread"""
+    db = FakeDatabase()
+    adapter = FakeSyncAdapter(CONFIG, db)
+    bridge = SyncAdapterBridge(adapter)
+
+    async def scenario():
+        await bridge.login()
+        jobs = await bridge.search_jobs('Python', 'Remote')
+        applied = await bridge.apply_and_record(jobs[0])
+        await bridge.close()
+        return applied
+
+    assert asyncio.run(scenario()) is True
+    assert db.applications[0]['job_id'] == 'Python-Remote'
+    assert len(adapter.threads) == 1
+    assert threading.get_ident() not in adapter.threads
+
+
+def test_async_run_overlaps_searches():
+    """All keyword/location searches run concurrently on the event loop"""
+    db = FakeDatabase()
+    adapter = SlowAsyncAdapter(CONFIG, db)
+
+    start = time.monotonic()
+    result = asyncio.run(adapter.run())
+    elapsed = time.monotonic() - start
+
+    assert result == {'jobs_found': 4, 'applications_submitted': 4}
+    assert elapsed < 0.6
+
+
+def test_gather_limited_caps_concurrency():
+    """gather_limited never runs more than `limit` coroutines at once"""
+    state = {'running': 0, 'peak': 0}
+
+    async def task(i):
+        state['running'] += 1
+        state['peak'] = max(state['peak'], state['running'])
+        await asyncio.sleep(0.01)
+        state['running'] -= 1
+        return i
+
+    results = asyncio.run(gather_limited((task(i) for i in range(50)), 5))
+    assert results == list(range(50))
+    assert state['peak'] == 5
+
+
+class OverlappingAsyncAdapter(AsyncPlatformAdapter):
+    """Async adapter whose queries all return one shared job besides their own"""
+
+    @property
+    def platform_name(self):
+        return "overlap"
+
+    async def login(self):
+        return True
+
+    async def search_jobs(self, keywords, location):
+        return [
+            {'job_id': 'shared', 'title': 'Shared', 'company': 'Acme', 'url': 'about:blank'},
+            {'job_id': f'{keywords}-{location}', 'title': keywords, 'company': location, 'url': 'about:blank'}
+        ]
+
+    async def extract_job_details(self, job_element):
+        return None
+
+    async def apply_to_job(self, job_url, job_data):
+        return await self.acquire_apply_slot()
+
+
+def test_async_run_applies_the_safety_checks(tmp_path):
+    """Async runs save and de-duplicate jobs and respect the per-run and daily budgets"""
+    db = Database(f"sqlite:///{tmp_path / 'jobs.db'}")
+    config = dict(CONFIG, platforms={'overlap': {'max_applications_per_run': 2}})
+    adapter = OverlappingAsyncAdapter(config, db)
+
+    assert asyncio.run(adapter.run()) == {'jobs_found': 5, 'applications_submitted': 2}
+    assert db.job_exists('shared', 'overlap') and db.job_exists('Go-Remote', 'overlap')
+    assert adapter.rate_limiter.granted == 2
+
+    # One more allowed today: the daily budget stops the next run after a single application
+    config = dict(config, safety={'max_applications_per_day': 3})
+    adapter = OverlappingAsyncAdapter(config, Database(f"sqlite:///{tmp_path / 'other.db'}"))
+    adapter.db.save_application({'job_id': 'a', 'platform': 'overlap', 'success': True})
+    adapter.db.save_application({'job_id': 'b', 'platform': 'overlap', 'success': True})
+    assert asyncio.run(adapter.run())['applications_submitted'] == 1
+
+
+def test_bridge_close_is_idempotent():
+    calls = []
+    adapter = FakeSyncAdapter(CONFIG, FakeDatabase())
+    adapter.close_driver = lambda: calls.append('close')
+    bridge = SyncAdapterBridge(adapter)
+
+    async def scenario():
+        await bridge.close()
+        await bridge.close()
+
+    asyncio.run(scenario())
+    assert calls == ['close']
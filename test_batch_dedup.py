@@ -0,0 +1,86 @@
+"""
+Tests for batched per-page duplicate detection
+"""
+
+from collections import deque
+
+from src.adapters import DiceAdapter
+from src.database import Database
+
+
+def make_job(job_id):
+    return {'job_id': job_id, 'title': f"Job {job_id}", 'company': 'Acme', 'url': f"https://example.com/{job_id}"}
+
+
+def test_find_duplicates_returns_seen_and_applied(tmp_path):
+    db = Database(f"sqlite:///{tmp_path / 'jobs.db'}")
+    db.save_job(dict(make_job('a'), platform='dice'))
+    db.save_job(dict(make_job('b'), platform='dice'))
+    db.save_application({'job_id': 'b', 'platform': 'dice', 'success': True})
+
+    seen, applied = db.find_duplicates(['a', 'b', 'c', 'a'], 'dice')
+
+    assert seen == {'a', 'b'}
+    assert applied == {'b'}
+
+
+def test_dedup_page_filters_in_memory(tmp_path):
+    db = Database(f"sqlite:///{tmp_path / 'jobs.db'}")
+    db.save_job(dict(make_job('a'), platform='dice'))
+    db.save_application({'job_id': 'b', 'platform': 'dice', 'success': True})
+    adapter = DiceAdapter({'platforms': {'dice': {}}}, db)
+
+    page = [make_job('a'), make_job('b'), make_job('c'), make_job('c')]
+    seen = set()
+    pending, keep_going = adapter.screen_page(1, page, seen)
+
+    assert [job['job_id'] for job in pending] == ['a', 'c']
+    assert seen == {'a'}
+    assert keep_going
+
+
+def test_job_repeated_on_a_later_page_is_applied_once(tmp_path):
+    db = Database(f"sqlite:///{tmp_path / 'jobs.db'}")
+    adapter = DiceAdapter({'platforms': {'dice': {}}}, db)
+    adapter.driver = object()
+    attempts = []
+    adapter.apply_and_record = lambda job: attempts.append(job['job_id']) or True
+
+    # Jobs wait in the deferred lane (no application row yet) while later pages are screened
+    deferred = deque()
+    seen = set()
+    for page_num, page in enumerate([[make_job('a'), make_job('b')], [make_job('b'), make_job('c')]], 1):
+        pending, _ = adapter.screen_page(page_num, page, seen)
+        for job in pending:
+            adapter.process_job(job, deferred=deferred, seen=seen)
+    # Per-job checks (streaming) see the claim too
+    adapter.process_job(make_job('a'), deferred=deferred)
+
+    assert adapter.apply_deferred(deferred, wait=True) == 3
+    assert attempts == ['a', 'b', 'c']
+
+
+class LookupCountingDatabase(Database):
+    lookups = 0
+
+    def job_exists(self, job_id, platform):
+        self.lookups += 1
+        return super().job_exists(job_id, platform)
+
+
+def test_screened_jobs_are_saved_without_a_lookup(tmp_path):
+    db = LookupCountingDatabase(f"sqlite:///{tmp_path / 'jobs.db'}")
+    db.save_job(dict(make_job('a'), platform='dice'))
+    adapter = DiceAdapter({'platforms': {'dice': {}}}, db)
+    adapter.driver = object()
+    adapter.apply_to_job = lambda job_url, job_data: True
+
+    deferred = deque()
+    seen = set()
+    pending, _ = adapter.screen_page(1, [make_job('a'), make_job('b')], seen)
+    for job in pending:
+        adapter.process_job(job, deferred=deferred, seen=seen)
+
+    assert adapter.apply_deferred(deferred, wait=True) == 2
+    assert db.lookups == 0
+    assert db.known_job_ids(['a', 'b'], 'dice') == {'a', 'b'}
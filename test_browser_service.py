@@ -0,0 +1,107 @@
+"""
+Tests for the resident browser shared across scheduler runs
+"""
+
+import os
+import subprocess
+import sys
+
+from src.adapters.browser_service import BrowserService, descendant_pids
+
+
+class FakeSwitch:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def window(self, handle):
+        self.driver.current = handle
+
+
+class FakeDriver:
+    def __init__(self, handles=('main',)):
+        self.window_handles = list(handles)
+        self.current = self.window_handles[0]
+        self.switch_to = FakeSwitch(self)
+        self.alive = True
+        self.quit_called = False
+
+    def execute_script(self, script):
+        if not self.alive:
+            raise RuntimeError("chrome not reachable")
+        return 1
+
+    def close(self):
+        self.window_handles.remove(self.current)
+
+    def quit(self):
+        self.quit_called = True
+
+
+class Factory:
+    def __init__(self):
+        self.drivers = []
+
+    def __call__(self):
+        self.drivers.append(FakeDriver())
+        return self.drivers[-1]
+
+
+def test_browser_is_reused_and_lent_to_one_caller_at_a_time():
+    service = BrowserService({'max_uses': 0})
+    factory = Factory()
+
+    driver = service.borrow(factory)
+    assert service.borrow(factory) is None
+
+    driver.window_handles.append('apply-tab')
+    service.give_back(driver, logged_in_platform='dice')
+
+    assert service.borrow(factory) is driver
+    assert len(factory.drivers) == 1
+    assert driver.window_handles == ['main']
+    assert service.is_logged_in('dice')
+
+
+def test_browser_is_recycled_after_max_uses():
+    service = BrowserService({'max_uses': 2})
+    factory = Factory()
+
+    for _ in range(3):
+        service.give_back(service.borrow(factory))
+
+    assert len(factory.drivers) == 2
+    assert factory.drivers[0].quit_called
+    assert service.recycles == 1
+
+
+def test_dead_browser_is_replaced_and_forgets_logins():
+    service = BrowserService()
+    factory = Factory()
+
+    driver = service.borrow(factory)
+    service.give_back(driver, logged_in_platform='dice')
+    driver.alive = False
+
+    assert service.borrow(factory) is factory.drivers[1]
+    assert not service.is_logged_in('dice')
+
+
+def test_discarded_browser_is_quit():
+    service = BrowserService()
+    driver = service.borrow(Factory())
+
+    service.give_back(driver, discard=True)
+
+    assert driver.quit_called and service.driver is None
+
+
+def test_descendant_pids():
+    child = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(5)'])
+    try:
+        assert child.pid in descendant_pids(os.getpid())
+    finally:
+        child.kill()
+        child.wait()
+
+    # A process that no longer exists has no descendants
+    assert descendant_pids(child.pid) == []
@@ -0,0 +1,94 @@
+"""
+Tests for the browserless Dice search backend, run against a local stub server
+"""
+
+import os
+import threading
+from http.server import HTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+from src.adapters import DiceAdapter
+from src.adapters.dice_parser import parse_job_cards
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'dice')
+
+
+def load_fixture(name):
+    with open(os.path.join(FIXTURE_DIR, name), 'rb') as f:
+        return f.read()
+
+
+class StubDiceHandler(BaseHTTPRequestHandler):
+    """Serve the recorded result page; redirect any later page back to page 1"""
+
+    def do_GET(self):
+        query = parse_qs(urlparse(self.path).query)
+        if query.get('page', ['1'])[0] != '1':
+            self.send_response(302)
+            self.send_header('Location', '/jobs?q=python')
+            self.end_headers()
+            return
+
+        body = load_fixture('search_results_page_1.html')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub_server():
+    server = HTTPServer(('127.0.0.1', 0), StubDiceHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def make_adapter(base_url):
+    config = {
+        'search_criteria': {},
+        'platforms': {'dice': {'search_backend': 'http'}}
+    }
+    adapter = DiceAdapter(config, db=None)
+    adapter.SEARCH_URL = f"{base_url}/jobs"
+    return adapter
+
+
+def test_parse_job_cards_fields():
+    """Cards are parsed into the same dicts as extract_job_details"""
+    jobs = parse_job_cards(load_fixture('search_results_page_1.html'), 'https://www.dice.com/jobs')
+
+    assert [job['job_id'] for job in jobs] == ['a1b2c3d4-0001', 'a1b2c3d4-0002', 'a1b2c3d4-0003']
+
+    first = jobs[0]
+    assert first['title'] == 'Senior Python Developer'
+    assert first['url'] == 'https://www.dice.com/job-detail/a1b2c3d4-0001'
+    assert first['company'] == 'Acme Corp'
+    assert first['location'] == 'Remote'
+    assert first['salary'] == 'USD 140,000.00 - 170,000.00 per year'
+    assert first['description'] == 'Build and operate Django and FastAPI services on AWS.'
+
+    last = jobs[2]
+    assert last['company'] == 'Unknown'
+    assert last['location'] == 'Not specified'
+    assert last['salary'] is None
+    assert last['description'] == ''
+
+
+def test_http_backend_against_stub_server():
+    """The HTTP backend lists page 1 and stops when redirected off page 2"""
+    server = start_stub_server()
+    adapter = make_adapter(f"http://127.0.0.1:{server.server_port}")
+    try:
+        jobs = adapter.search_jobs_on_page(1)
+        assert len(jobs) == 3
+        assert jobs[1]['url'] == 'https://www.dice.com/job-detail/a1b2c3d4-0002'
+        assert adapter.driver is None
+
+        assert adapter.search_jobs_on_page(2) is None
+    finally:
+        adapter.close_driver()
+        server.shutdown()
+        server.server_close()
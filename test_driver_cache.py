@@ -0,0 +1,106 @@
+"""
+Tests for cached, offline-capable ChromeDriver resolution
+"""
+
+import os
+import stat
+import sys
+import types
+
+import pytest
+
+from src.adapters import driver_cache
+from src.adapters.driver_cache import ChromeDriverCache
+
+
+def make_driver(path):
+    path.write_text('#!/bin/sh\n')
+    path.chmod(path.stat().st_mode | stat.S_IXUSR)
+    return str(path)
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    monkeypatch.delenv('CHROMEDRIVER_PATH', raising=False)
+    monkeypatch.delenv('CHROMEDRIVER_OFFLINE', raising=False)
+    monkeypatch.setattr(driver_cache, 'detect_chrome_version', lambda: '120.0.6099.109')
+
+    def make(**config):
+        cache = ChromeDriverCache(config)
+        cache.cache_path = str(tmp_path / 'chromedriver.json')
+        return cache
+    return make
+
+
+def fake_webdriver_manager(monkeypatch, driver_path, calls):
+    class ChromeDriverManager:
+        def install(self):
+            calls.append(driver_path)
+            return driver_path
+
+    module = types.ModuleType('webdriver_manager.chrome')
+    module.ChromeDriverManager = ChromeDriverManager
+    monkeypatch.setitem(sys.modules, 'webdriver_manager.chrome', module)
+
+
+def test_resolved_path_is_cached_per_chrome_major(cache, tmp_path, monkeypatch):
+    calls = []
+    fake_webdriver_manager(monkeypatch, make_driver(tmp_path / 'chromedriver-120'), calls)
+
+    assert cache().resolve() == str(tmp_path / 'chromedriver-120')
+    assert cache().resolve() == str(tmp_path / 'chromedriver-120')
+    assert len(calls) == 1
+
+    # A Chrome upgrade invalidates the cached driver
+    monkeypatch.setattr(driver_cache, 'detect_chrome_version', lambda: '121.0.6167.85')
+    cache().resolve()
+    assert len(calls) == 2
+
+
+def test_offline_mode_never_downloads(cache, tmp_path, monkeypatch):
+    fake_webdriver_manager(monkeypatch, 'unused', [])
+    monkeypatch.setattr(driver_cache.shutil, 'which', lambda name: None)
+
+    with pytest.raises(RuntimeError, match="Offline mode"):
+        cache(offline=True).resolve()
+
+    on_path = make_driver(tmp_path / 'chromedriver')
+    monkeypatch.setattr(driver_cache.shutil, 'which', lambda name: on_path)
+    assert cache(offline=True).resolve() == on_path
+
+
+def test_cached_driver_that_disappeared_is_not_used(cache, tmp_path):
+    driver_path = make_driver(tmp_path / 'chromedriver')
+    cache()._save(driver_path, '120.0.6099.109')
+    os.remove(driver_path)
+
+    assert not cache().is_valid(cache()._load(), '120.0.6099.109')
+
+
+def test_explicit_path_must_be_executable(cache, tmp_path):
+    with pytest.raises(RuntimeError, match="not found or not executable"):
+        cache(path=str(tmp_path / 'missing')).resolve()
+
+    driver_path = make_driver(tmp_path / 'chromedriver')
+    assert cache(path=driver_path).resolve() == driver_path
+
+
+def test_process_memo_follows_chrome_updates(cache, tmp_path, monkeypatch):
+    monkeypatch.setattr(driver_cache, '_resolved', {})
+    drivers = {'120': make_driver(tmp_path / 'chromedriver-120'), '121': make_driver(tmp_path / 'chromedriver-121')}
+    calls = []
+
+    def resolve(self, chrome_version=None):
+        calls.append(chrome_version)
+        return drivers[chrome_version.split('.')[0]]
+
+    monkeypatch.setattr(ChromeDriverCache, 'resolve', resolve)
+
+    assert driver_cache.resolve_chromedriver() == drivers['120']
+    assert driver_cache.resolve_chromedriver() == drivers['120']
+    assert calls == ['120.0.6099.109']
+
+    # Chrome auto-updated while the process kept running
+    monkeypatch.setattr(driver_cache, 'detect_chrome_version', lambda: '121.0.6167.85')
+    assert driver_cache.resolve_chromedriver() == drivers['121']
+    assert calls == ['120.0.6099.109', '121.0.6167.85']
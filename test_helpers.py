@@ -0,0 +1,23 @@
+"""
+Tests for the helper functions
+"""
+
+from src.utils.helpers import extract_salary
+
+
+def test_extract_salary_ranges():
+    assert extract_salary("$100,000 - $150,000") == (100000.0, 150000.0)
+    assert extract_salary("100K to 150K") == (100000.0, 150000.0)
+    # Dice lists amounts with cents
+    assert extract_salary("USD 140,000.00 - 170,000.00 per year") == (140000.0, 170000.0)
+
+
+def test_extract_salary_single_value():
+    assert extract_salary("Up to $95k") == (95000.0, 95000.0)
+    assert extract_salary("USD 65.50 per hour") == (65.5, 65.5)
+
+
+def test_extract_salary_without_an_amount():
+    assert extract_salary(None) == (None, None)
+    assert extract_salary("") == (None, None)
+    assert extract_salary("Depends on experience") == (None, None)
@@ -0,0 +1,108 @@
+"""
+Tests for the conditional-GET job detail cache
+"""
+
+import json
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+from src.adapters.http_cache import HttpCache
+from src.adapters.dice_parser import parse_job_detail
+
+DETAIL_PAGE = """<html><head>
+<script type="application/ld+json">{}</script>
+</head><body><div data-testid="jobDescriptionHtml">Rendered text</div></body></html>""".format(json.dumps({
+    '@type': 'JobPosting',
+    'title': 'Python Developer',
+    'description': '<p>Build <b>APIs</b> in Python.</p>',
+    'skills': ['Python', 'Django']
+}))
+
+
+def start_server(etag='"v1"'):
+    """Serve DETAIL_PAGE with an ETag; count full responses and 304s"""
+    counts = {'200': 0, '304': 0}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.headers.get('If-None-Match') == etag:
+                counts['304'] += 1
+                self.send_response(304)
+                self.end_headers()
+                return
+            counts['200'] += 1
+            body = DETAIL_PAGE.encode('utf-8')
+            self.send_response(200)
+            self.send_header('ETag', etag)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    host, port = httpd.server_address[:2]
+    return httpd, f"http://{host}:{port}", counts
+
+
+def test_fresh_hit_then_revalidation(tmp_path):
+    httpd, base_url, counts = start_server()
+    try:
+        cache = HttpCache({'dir': str(tmp_path), 'ttl_hours': 1})
+        assert cache.get(f"{base_url}/job-detail/1") == DETAIL_PAGE
+        assert cache.get(f"{base_url}/job-detail/1") == DETAIL_PAGE
+        assert counts == {'200': 1, '304': 0}
+
+        expired = HttpCache({'dir': str(tmp_path), 'ttl_hours': 0})
+        assert expired.get(f"{base_url}/job-detail/1") == DETAIL_PAGE
+        assert counts == {'200': 1, '304': 1}
+
+        assert cache.stats()['hits'] == 1 and cache.stats()['misses'] == 1
+        assert expired.stats()['revalidated'] == 1
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def test_lru_eviction_keeps_cache_under_limit(tmp_path):
+    httpd, base_url, counts = start_server()
+    try:
+        limit_mb = len(DETAIL_PAGE) * 2.5 / (1024 * 1024)
+        cache = HttpCache({'dir': str(tmp_path), 'max_size_mb': limit_mb})
+        cache.get(f"{base_url}/job-detail/1")
+        cache.get(f"{base_url}/job-detail/2")
+        cache.get(f"{base_url}/job-detail/1")  # 1 is now more recent than 2
+        cache.get(f"{base_url}/job-detail/3")
+
+        urls = {entry['url'] for entry in cache.index.values()}
+        assert urls == {f"{base_url}/job-detail/1", f"{base_url}/job-detail/3"}
+        assert len(list(tmp_path.glob('*.html'))) == 2
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def test_entry_without_body_is_fetched_again(tmp_path):
+    httpd, base_url, counts = start_server()
+    try:
+        url = f"{base_url}/job-detail/1"
+        HttpCache({'dir': str(tmp_path)}).get(url)
+        for body_file in tmp_path.glob('*.html'):
+            body_file.unlink()
+
+        # Stale entry: a conditional GET would get a 304 with nothing to serve
+        cache = HttpCache({'dir': str(tmp_path), 'ttl_hours': 0})
+        assert cache.get(url) == DETAIL_PAGE
+        assert cache.get(url) == DETAIL_PAGE
+        assert counts == {'200': 2, '304': 1}
+        assert cache.stats()['errors'] == 0
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def test_parse_job_detail_prefers_json_ld():
+    details = parse_job_detail(DETAIL_PAGE)
+    assert details == {'description': 'Build APIs in Python.', 'requirements': 'Python, Django'}
@@ -0,0 +1,95 @@
+"""
+Tests for incremental crawling (known-page early termination and high-water mark)
+"""
+
+import logging
+from collections import deque
+
+from src.database import Database
+from src.adapters import DiceAdapter
+from src.adapters.incremental import IncrementalCrawl
+
+LOGGER = logging.getLogger('test_incremental_crawl')
+
+
+def make_db(tmp_path):
+    return Database(f"sqlite:///{tmp_path / 'jobs.db'}")
+
+
+def page(*job_ids):
+    return [{'job_id': job_id, 'title': f"Job {job_id}", 'company': 'Acme', 'url': f"https://example.com/{job_id}"}
+            for job_id in job_ids]
+
+
+def save(db, jobs):
+    for job in jobs:
+        db.save_job(dict(job, platform='dice'))
+
+
+def test_known_job_ids_is_one_batched_lookup(tmp_path):
+    db = make_db(tmp_path)
+    save(db, page('a', 'b'))
+
+    assert db.known_job_ids(['a', 'b', 'c', None], 'dice') == {'a', 'b'}
+    assert db.known_job_ids(['a'], 'indeed') == set()
+    assert db.known_job_ids([], 'dice') == set()
+
+
+def test_stops_after_consecutive_known_pages(tmp_path):
+    db = make_db(tmp_path)
+    save(db, page('c', 'd', 'e', 'f', 'g', 'h'))
+    config = {'known_ratio': 0.5, 'stop_after_known_pages': 2, 'use_high_water_mark': False}
+    crawl = IncrementalCrawl(db, 'dice', '/jobs?q=python', config, LOGGER)
+
+    assert crawl.observe_page(1, page('a', 'b')) is True       # all new
+    assert crawl.observe_page(2, page('c', 'x')) is True       # 1st mostly-known page
+    assert crawl.observe_page(3, page('d', 'e')) is False      # 2nd in a row -> stop
+    assert crawl.jobs_known == 3
+
+
+def test_high_water_mark_is_saved_and_stops_the_next_run(tmp_path):
+    db = make_db(tmp_path)
+    config = {'stop_after_known_pages': 5}
+
+    first = IncrementalCrawl(db, 'dice', '/jobs?q=python', config, LOGGER)
+    assert first.observe_page(1, page('j3', 'j2', 'j1'))
+    first.finish()
+    assert db.get_crawl_state('dice', '/jobs?q=python')['high_water_job_id'] == 'j3'
+
+    second = IncrementalCrawl(db, 'dice', '/jobs?q=python', config, LOGGER)
+    assert second.observe_page(1, page('j5', 'j4', 'j3')) is False
+    assert 'high-water mark' in second.stop_reason
+
+
+def test_interrupted_run_keeps_previous_mark(tmp_path):
+    db = make_db(tmp_path)
+    db.save_crawl_state('dice', '/jobs?q=python', high_water_job_id='old')
+
+    crawl = IncrementalCrawl(db, 'dice', '/jobs?q=python', {}, LOGGER)
+    crawl.observe_page(1, page('new'))
+    crawl.finish(completed=False)
+
+    assert db.get_crawl_state('dice', '/jobs?q=python')['high_water_job_id'] == 'old'
+
+
+class BudgetSpentAdapter(DiceAdapter):
+    """Never gets a rate-limiter slot before the daily budget runs out"""
+
+    def apply_to_job(self, job_url, job_data):
+        return self.acquire_apply_slot()
+
+
+def test_jobs_dropped_on_budget_are_not_known(tmp_path):
+    db = make_db(tmp_path)
+    config = {'platforms': {'dice': {}}, 'safety': {'max_applications_per_day': 0}}
+    adapter = BudgetSpentAdapter(config, db)
+    adapter.driver = object()
+    deferred = deque()
+
+    for job in page('a', 'b'):
+        adapter.process_job(job, deferred=deferred, seen=set())
+    assert adapter.apply_deferred(deferred, wait=True) == 0
+
+    assert adapter.dropped_jobs == 2
+    # The next crawl sees them as new and tries again
+    assert db.known_job_ids(['a', 'b'], 'dice') == set()
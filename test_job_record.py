@@ -0,0 +1,52 @@
+"""
+Tests for JobRecord and saving records to the jobs table
+"""
+
+import pytest
+
+from src.database import Database, Job, JobRecord
+
+
+def make_record(job_id='dice-1', **fields):
+    values = dict(title='Python Developer', company='Acme Corp', url=f'https://www.dice.com/job-detail/{job_id}',
+                  location='Remote', salary='USD 140,000.00 - 170,000.00 per year')
+    values.update(fields)
+    return JobRecord(job_id=job_id, platform='dice', **values)
+
+
+def test_record_parses_salary_and_has_no_instance_dict():
+    record = make_record()
+
+    assert (record.salary_min, record.salary_max) == (140000.0, 170000.0)
+    assert record['salary'] == 'USD 140,000.00 - 170,000.00 per year'
+    assert record.get('requirements', 'n/a') is None
+    assert not hasattr(record, '__dict__')
+    with pytest.raises(AttributeError):
+        record.card_element = object()
+
+
+def test_from_dict_drops_driver_handles_and_mapping_fits_job_table():
+    record = JobRecord.from_dict({'job_id': 'dice-2', 'title': 'Go Developer', '_card_element': object(),
+                                  'match_score': 80})
+
+    mapping = record.to_mapping()
+    assert set(mapping) <= set(Job.__table__.columns.keys())
+    assert 'match_score' not in mapping and 'salary' not in mapping
+    assert isinstance(record.to_orm(), Job)
+
+
+def test_save_job_and_bulk_save_jobs(tmp_path):
+    db = Database(f"sqlite:///{tmp_path / 'jobs.db'}")
+
+    record = make_record(match_score=75.0)
+    db.save_job(record)
+    assert db.save_jobs([make_record('dice-3'), make_record('dice-4', salary=None)]) == 2
+
+    session = db.get_session()
+    try:
+        rows = {job.job_id: job for job in session.query(Job).all()}
+    finally:
+        session.close()
+    assert set(rows) == {'dice-1', 'dice-3', 'dice-4'}
+    assert rows['dice-1'].salary_max == 170000.0
+    assert rows['dice-4'].salary_min is None
@@ -0,0 +1,110 @@
+"""
+Tests for the streaming search APIs: lazy card parsing, pipeline and run()
+"""
+
+import logging
+import os
+import threading
+
+from src.adapters import DiceAdapter
+from src.adapters.dice_parser import iter_job_cards, parse_job_cards
+from src.adapters.pipeline import SearchApplyPipeline
+from src.database import Database
+from src.matching import JobMatcher
+
+FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'dice', 'search_results_page_1.html')
+
+
+def load_page():
+    with open(FIXTURE, 'rb') as f:
+        return f.read()
+
+
+def test_cards_are_yielded_one_at_a_time():
+    page_html = load_page()
+    jobs = iter_job_cards(page_html, 'https://www.dice.com/jobs')
+
+    assert next(jobs)['job_id'] == 'a1b2c3d4-0001'
+    assert [job['job_id'] for job in jobs] == ['a1b2c3d4-0002', 'a1b2c3d4-0003']
+    assert len(parse_job_cards(page_html.decode('utf-8'), 'https://www.dice.com/jobs')) == 3
+
+
+def test_pipeline_queues_jobs_before_the_page_is_finished():
+    first_consumed = threading.Event()
+
+    def search_page(page_num):
+        if page_num > 1:
+            return None
+        return stream_page()
+
+    def stream_page():
+        yield {'job_id': '1'}
+        # The second card only appears once the apply stage has the first one
+        assert first_consumed.wait(timeout=5)
+        yield {'job_id': '2'}
+
+    pipeline = SearchApplyPipeline(search_page, max_pages=3, logger=logging.getLogger('test.pipeline'))
+    pipeline.start()
+
+    received = []
+    for job in pipeline:
+        received.append(job['job_id'])
+        first_consumed.set()
+    pipeline.stop()
+
+    assert received == ['1', '2']
+    assert (pipeline.pages_searched, pipeline.jobs_found) == (1, 2)
+
+
+
+def test_run_streams_only_without_page_screening(tmp_path):
+    db = Database(f"sqlite:///{tmp_path / 'jobs.db'}")
+
+    def adapter(**dice):
+        return DiceAdapter({'platforms': {'dice': dice}}, db)
+
+    assert not adapter().streams_jobs()
+    assert not adapter(batch_dedup=False, incremental={'enabled': True}).streams_jobs()
+    assert adapter(batch_dedup=False).streams_jobs()
+    # Live card elements go stale once the shared browser opens a job
+    assert not adapter(batch_dedup=False, card_extraction='elements').streams_jobs()
+    assert adapter(batch_dedup=False, card_extraction='elements').streams_jobs(shared_browser=False)
+    assert adapter(batch_dedup=False, card_extraction='elements', search_backend='http').streams_jobs()
+
+
+def test_matcher_filters_a_stream_lazily():
+    criteria = {'required_skills': ['Python'], 'locations': ['Remote']}
+    matcher = JobMatcher({'search_criteria': criteria})
+    read = []
+
+    def jobs():
+        for job_id, title in [('1', 'Python Developer'), ('2', 'Java Developer'), ('3', 'Python Engineer')]:
+            read.append(job_id)
+            yield {'job_id': job_id, 'title': title, 'location': 'Remote'}
+
+    matched = matcher.filter_stream(jobs())
+    assert read == []
+
+    first = next(matched)
+    assert first['job_id'] == '1' and first['match_score'] >= 60
+    # Nothing past the first match has been read yet
+    assert read == ['1']
+
+    assert [job['job_id'] for job in matched] == ['3']
+    assert read == ['1', '2', '3']
+
+
+def test_run_screens_jobs_with_the_matcher_when_enabled(tmp_path):
+    db = Database(f"sqlite:///{tmp_path / 'jobs.db'}")
+    criteria = {'required_skills': ['Python'], 'locations': ['Remote']}
+    jobs = [{'job_id': '1', 'title': 'Python Developer', 'location': 'Remote'},
+            {'job_id': '2', 'title': 'Java Developer', 'location': 'Remote'}]
+
+    adapter = DiceAdapter({'search_criteria': criteria, 'platforms': {'dice': {'match_filter': True}}}, db)
+    counts = {'found': 0}
+    assert [job['job_id'] for job in adapter.match_jobs(iter(jobs), counts)] == ['1']
+    # Rejected jobs still count as found, so pagination does not stop early
+    assert counts['found'] == 2
+
+    adapter = DiceAdapter({'platforms': {'dice': {}}}, db)
+    assert [job['job_id'] for job in adapter.match_jobs(iter(jobs))] == ['1', '2']
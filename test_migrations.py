@@ -0,0 +1,86 @@
+"""
+Tests for the versioned schema migrations
+"""
+
+import sqlite3
+import threading
+
+from sqlalchemy import create_engine, inspect
+
+from src.database import Database, migrations
+from src.database.migrations import LATEST_VERSION, current_version, migrate
+
+INDEXES = {
+    'applications': {'ix_applications_platform_job_id', 'ix_applications_applied_date'},
+    'jobs': {'ix_jobs_platform_job_id'},
+}
+
+
+def index_names(engine, table):
+    return {index['name'] for index in inspect(engine).get_indexes(table)}
+
+
+def test_new_database_is_at_latest_version_with_indexes(tmp_path):
+    db = Database(f"sqlite:///{tmp_path / 'jobs.db'}")
+
+    assert current_version(db.engine) == LATEST_VERSION
+    for table, names in INDEXES.items():
+        assert names <= index_names(db.engine, table)
+    assert migrate(db.engine) == []
+
+
+def test_old_database_file_is_upgraded_in_place(tmp_path):
+    url = f"sqlite:///{tmp_path / 'jobs.db'}"
+    old = Database(url)
+    old.save_application({'job_id': 'dice-1', 'platform': 'dice', 'success': True})
+
+    # Make it look like a file from before the migrations existed
+    with old.engine.begin() as connection:
+        for names in INDEXES.values():
+            for name in names:
+                connection.exec_driver_sql(f"DROP INDEX {name}")
+        connection.exec_driver_sql("DROP TABLE schema_version")
+    old.engine.dispose()
+
+    upgraded = Database(url)
+
+    assert current_version(upgraded.engine) == LATEST_VERSION
+    assert INDEXES['applications'] <= index_names(upgraded.engine, 'applications')
+    assert upgraded.application_exists('dice-1', 'dice')
+
+
+def test_change_already_in_place_is_recorded_as_applied(tmp_path):
+    db = Database(f"sqlite:///{tmp_path / 'jobs.db'}")
+    with db.engine.begin() as connection:
+        connection.exec_driver_sql("ALTER TABLE jobs ADD COLUMN notes TEXT")
+
+    def add_notes(connection):
+        connection.exec_driver_sql("ALTER TABLE jobs ADD COLUMN notes TEXT")
+
+    migrations.MIGRATIONS.append((LATEST_VERSION + 1, "Add jobs.notes", add_notes))
+    try:
+        assert migrate(db.engine) == [LATEST_VERSION + 1]
+    finally:
+        migrations.MIGRATIONS.pop()
+    assert current_version(db.engine) == LATEST_VERSION + 1
+
+
+def test_locked_database_is_retried(tmp_path, monkeypatch):
+    path = tmp_path / 'jobs.db'
+    Database(f"sqlite:///{path}")
+    with sqlite3.connect(path) as connection:
+        connection.execute("DELETE FROM schema_version")
+    monkeypatch.setattr(migrations, 'LOCK_RETRY_SECONDS', 0.05)
+
+    # Another process holds the write lock for a moment
+    holder = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+    holder.execute("BEGIN IMMEDIATE")
+    release = threading.Timer(0.2, holder.rollback)
+    release.start()
+
+    engine = create_engine(f"sqlite:///{path}", connect_args={'timeout': 0.05})
+    try:
+        assert migrate(engine) == [number for number, _, _ in migrations.MIGRATIONS]
+    finally:
+        release.join()
+        holder.close()
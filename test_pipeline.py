@@ -0,0 +1,78 @@
+"""
+Tests for the pipelined search/apply stages
+"""
+
+import logging
+
+from src.adapters.pipeline import SearchApplyPipeline
+
+LOGGER = logging.getLogger('test.pipeline')
+
+
+def pages(*results):
+    """search_page returning the given pages in order, then None"""
+    def search_page(page_num):
+        return results[page_num - 1] if page_num <= len(results) else None
+    return search_page
+
+
+def run(pipeline):
+    pipeline.start()
+    jobs = [job['job_id'] for job in pipeline]
+    pipeline.stop()
+    return jobs
+
+
+def test_pages_are_streamed_until_pagination_ends():
+    search_page = pages([{'job_id': '1'}, {'job_id': '2'}], [{'job_id': '3'}], [], [{'job_id': 'never'}])
+    pipeline = SearchApplyPipeline(search_page, max_pages=10, logger=LOGGER)
+
+    # The empty third page stops pagination
+    assert run(pipeline) == ['1', '2', '3']
+    assert (pipeline.pages_searched, pipeline.jobs_found) == (2, 3)
+
+
+def test_on_page_filters_and_stops_pagination():
+    calls = []
+
+    def on_page(page_num, jobs):
+        calls.append((page_num, len(jobs)))
+        return [job for job in jobs if job['job_id'] != 'known'], page_num < 2
+
+    search_page = pages([{'job_id': 'known'}, {'job_id': '1'}], [{'job_id': '2'}], [{'job_id': '3'}])
+    pipeline = SearchApplyPipeline(search_page, max_pages=10, logger=LOGGER, on_page=on_page)
+
+    assert run(pipeline) == ['1', '2']
+    assert calls == [(1, 2), (2, 1)]
+    # Found counts the whole page, not only the jobs queued
+    assert pipeline.jobs_found == 3
+
+
+def test_full_queue_holds_back_the_search_stage():
+    fetched = []
+
+    def search_page(page_num):
+        fetched.append(page_num)
+        return [{'job_id': f'{page_num}-{n}'} for n in range(2)]
+
+    pipeline = SearchApplyPipeline(search_page, max_pages=5, logger=LOGGER, queue_size=1)
+    pipeline.start()
+    jobs = iter(pipeline)
+    next(jobs)
+    pipeline.stop()
+
+    # One job taken, one queued: the search stage never got past page 2
+    assert max(fetched) <= 2
+
+
+def test_search_error_ends_iteration():
+    def search_page(page_num):
+        if page_num == 2:
+            raise RuntimeError("results page changed")
+        return [{'job_id': '1'}]
+
+    pipeline = SearchApplyPipeline(search_page, max_pages=5, logger=LOGGER)
+
+    assert run(pipeline) == ['1']
+    assert str(pipeline.error) == "results page changed"
+    assert pipeline.pages_searched == 1
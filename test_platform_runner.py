@@ -0,0 +1,100 @@
+"""
+Tests for running platforms in-process and in parallel worker processes
+"""
+
+import logging
+
+from sqlalchemy import inspect
+
+from src.adapters import runner
+from src.database import Database
+
+
+class FakeAdapter:
+    def __init__(self, config, db, browser_service=None):
+        self.logger = logging.getLogger('adapter.fake')
+
+    def run(self, search_only=False):
+        self.logger.warning("Login took three attempts")
+        return {'jobs_found': 7, 'applications_submitted': 0 if search_only else 2}
+
+
+class BrokenAdapter(FakeAdapter):
+    def run(self, search_only=False):
+        raise RuntimeError("search page changed")
+
+
+def test_run_platform_collects_result_and_warnings(monkeypatch):
+    monkeypatch.setitem(runner.ADAPTERS, 'fake', FakeAdapter)
+
+    record = runner.run_platform('fake', {}, db=None)
+
+    assert record['status'] == 'ok'
+    assert (record['jobs_found'], record['applications_submitted']) == (7, 2)
+    assert "WARNING: Login took three attempts" in record['messages']
+
+
+def test_failing_platform_does_not_affect_others(monkeypatch):
+    monkeypatch.setitem(runner.ADAPTERS, 'fake', FakeAdapter)
+    monkeypatch.setitem(runner.ADAPTERS, 'broken', BrokenAdapter)
+    config = {'execution': {'parallel_platforms': False, 'platform_timeout_minutes': 0}}
+
+    results = runner.run_platforms(['broken', 'fake'], config, db=None, search_only=True)
+
+    assert results['broken']['status'] == 'error'
+    assert results['broken']['error'] == "search page changed"
+    assert results['fake']['status'] == 'ok'
+
+
+def test_parallel_runs_each_platform_in_its_own_process(tmp_path):
+    db = Database(f"sqlite:///{tmp_path / 'jobs.db'}")
+    results = runner.run_platforms_parallel(['unknown-a', 'unknown-b'], {}, db, timeout_seconds=60)
+
+    assert list(results) == ['unknown-a', 'unknown-b']
+    assert all(record['status'] == 'error' for record in results.values())
+    assert results['unknown-a']['error'] == "Unsupported platform: unknown-a"
+
+
+def test_single_platform_runs_in_process_without_a_timeout(monkeypatch):
+    # A spawned worker would not see the monkeypatched adapter
+    monkeypatch.setitem(runner.ADAPTERS, 'fake', FakeAdapter)
+    config = {'execution': {'parallel_platforms': True, 'platform_timeout_minutes': 0}}
+
+    results = runner.run_platforms(['fake'], config, db=None)
+
+    assert results['fake']['status'] == 'ok'
+
+
+def test_timeout_runs_platforms_one_at_a_time_in_worker_processes(monkeypatch):
+    calls = []
+
+    def fake_parallel(platforms, config, db, search_only, timeout_seconds, logger):
+        calls.append((list(platforms), timeout_seconds))
+        return {platform_name: {'platform': platform_name} for platform_name in platforms}
+
+    monkeypatch.setattr(runner, 'run_platforms_parallel', fake_parallel)
+    config = {'execution': {'parallel_platforms': False, 'platform_timeout_minutes': 5}}
+
+    results = runner.run_platforms(['a', 'b'], config, db=None)
+
+    assert list(results) == ['a', 'b']
+    assert calls == [(['a'], 300), (['b'], 300)]
+
+
+def test_timeout_is_not_applied_with_a_resident_browser(monkeypatch, caplog):
+    monkeypatch.setitem(runner.ADAPTERS, 'fake', FakeAdapter)
+    config = {'execution': {'platform_timeout_minutes': 5}}
+    logger = logging.getLogger('test.runner')
+
+    with caplog.at_level(logging.WARNING, logger='test.runner'):
+        results = runner.run_platforms(['fake'], config, db=None, browser_service=object(), logger=logger)
+
+    assert results['fake']['status'] == 'ok'
+    assert "not applied" in caplog.text
+
+
+def test_worker_database_skips_schema_setup(tmp_path):
+    url = f"sqlite:///{tmp_path / 'jobs.db'}"
+
+    assert inspect(Database(url, create_schema=False).engine).get_table_names() == []
+    assert 'schema_version' in inspect(Database(url).engine).get_table_names()
@@ -0,0 +1,63 @@
+"""
+Tests for the concurrent keyword x location fan-out
+"""
+
+import threading
+import time
+
+from src.adapters.fanout import QueryFanOut
+
+RESULTS = {
+    ('Python', 'Remote'): ['a', 'b', 'c'],
+    ('Python', 'Austin, TX'): ['b', 'd'],
+    ('Django', 'Remote'): ['a', 'b'],
+}
+
+
+def make_search(delay=0.0, active=None):
+    lock = threading.Lock()
+
+    def search(keywords, location):
+        if active is not None:
+            with lock:
+                active['now'] += 1
+                active['peak'] = max(active['peak'], active['now'])
+        time.sleep(delay)
+        if active is not None:
+            with lock:
+                active['now'] -= 1
+        return [{'job_id': job_id, 'title': keywords} for job_id in RESULTS[(keywords, location)]]
+
+    return search
+
+
+def test_jobs_are_merged_by_job_id_with_overlap_stats():
+    fan_out = QueryFanOut(make_search(), list(RESULTS), max_concurrency=1)
+
+    assert [job['job_id'] for job in fan_out] == ['a', 'b', 'c', 'd']
+
+    stats = fan_out.stats()
+    assert (stats['raw_jobs'], stats['unique_jobs'], stats['duplicates']) == (7, 4, 3)
+    assert stats['overlap'][('Django @ Remote', 'Python @ Remote')] == 2
+    assert stats['per_query']['Python @ Austin, TX'] == {'found': 2, 'new': 1}
+
+
+def test_concurrency_is_bounded():
+    active = {'now': 0, 'peak': 0}
+    queries = list(RESULTS) * 3
+    fan_out = QueryFanOut(make_search(delay=0.05, active=active), queries, max_concurrency=2)
+
+    assert sorted(job['job_id'] for job in fan_out) == ['a', 'b', 'c', 'd']
+    assert active['peak'] == 2
+
+
+def test_failed_query_does_not_stop_the_others():
+    def search(keywords, location):
+        if location == 'Austin, TX':
+            raise RuntimeError("timeout")
+        return make_search()(keywords, location)
+
+    fan_out = QueryFanOut(search, list(RESULTS), max_concurrency=3)
+
+    assert sorted(job['job_id'] for job in fan_out) == ['a', 'b', 'c']
+    assert fan_out.stats()['failed_queries'] == ['Python @ Austin, TX']
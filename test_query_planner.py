@@ -0,0 +1,41 @@
+"""
+Tests for the search query planner
+"""
+
+from src.adapters.query_planner import QueryPlanner, format_plan
+
+CRITERIA = {
+    'keywords': ["Python Developer", "Software Engineer", "Django"],
+    'locations': ["Remote", "Remote, US", "New York, NY", "new york, ny"]
+}
+
+
+def test_plan_collapses_keywords_and_remote_locations():
+    queries = QueryPlanner().plan(CRITERIA, search_pages=3)
+
+    assert [(q.query_text, q.location, q.remote) for q in queries] == [
+        ('"Python Developer" OR "Software Engineer" OR Django', 'Remote', True),
+        ('"Python Developer" OR "Software Engineer" OR Django', 'New York, NY', False),
+    ]
+
+
+def test_without_or_support_each_keyword_is_its_own_query():
+    planner = QueryPlanner(supports_or=False, supports_remote_filter=False)
+    queries = planner.plan(CRITERIA)
+
+    assert len(queries) == 3 * 3  # "Remote" and "Remote, US" stay distinct without a filter
+
+
+def test_long_or_expressions_are_split():
+    planner = QueryPlanner(max_query_length=45)
+    groups = planner.keyword_groups(CRITERIA['keywords'])
+
+    assert groups == [["Python Developer", "Software Engineer"], ["Django"]]
+
+
+def test_page_estimate_uses_history_and_honors_search_pages():
+    history = {'Remote': 1, 'New York, NY': 9}
+    queries = QueryPlanner().plan(CRITERIA, search_pages=3, page_history=lambda q: history[q.location])
+
+    assert [(q.estimated_pages, q.max_pages) for q in queries] == [(2, 3), (3, 3)]
+    assert "2 queries (cross-product: 12)" in format_plan('dice', queries, CRITERIA, 3)
@@ -0,0 +1,160 @@
+"""
+Tests for the application rate limiter
+"""
+
+from datetime import datetime, timedelta
+
+from src.adapters import DiceAdapter
+from src.database import Database
+from src.utils import rate_limiter
+from src.utils.rate_limiter import TokenBucket, RateLimiter, get_rate_limiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeDB:
+    def __init__(self, applied_today=0, companies=None):
+        self.applied_today = applied_today
+        self.companies = dict(companies or {})
+
+    def get_applications_today(self):
+        return self.applied_today
+
+    def companies_applied_since(self, since):
+        return {company: applied for company, applied in self.companies.items() if applied >= since}
+
+
+def test_token_bucket_refills_at_rate():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=0.5, capacity=2, clock=clock)
+
+    assert bucket.try_take() and bucket.try_take()
+    assert not bucket.try_take()
+    assert bucket.time_until_token() == 2.0
+
+    clock.now += 2
+    assert bucket.try_take()
+
+
+def test_spacing_is_non_blocking_and_jittered():
+    clock = FakeClock()
+    safety = {'min_delay_seconds': 30, 'max_delay_seconds': 90, 'random_delay_enabled': True}
+    limiter = RateLimiter(safety, 'dice', FakeDB(), clock=clock)
+
+    assert limiter.try_acquire()
+    assert not limiter.ready()
+    assert 30 <= limiter.wait_time() <= 90
+
+    clock.now += 90
+    assert limiter.ready()
+
+
+def test_daily_budget_counts_applications_already_made():
+    clock = FakeClock()
+    limiter = RateLimiter({'max_applications_per_day': 3}, 'dice', FakeDB(applied_today=2), clock=clock)
+
+    assert limiter.remaining_today() == 1
+    assert limiter.acquire()
+    assert limiter.budget_exhausted()
+    assert limiter.wait_time() == float('inf')
+    assert not limiter.acquire()
+
+
+def test_company_cooldown():
+    now = datetime.utcnow()
+    db = FakeDB(companies={'acme': now - timedelta(hours=1), 'initech': now - timedelta(hours=30)})
+    limiter = RateLimiter({'cooldown_period_hours': 24}, 'dice', db)
+
+    assert limiter.in_cooldown('Acme')
+    assert not limiter.in_cooldown('Initech')
+    assert not limiter.in_cooldown('Globex')
+    limiter.record_company('Globex')
+    assert limiter.in_cooldown('globex')
+
+
+def test_company_less_jobs_have_no_cooldown():
+    limiter = RateLimiter({'cooldown_period_hours': 24}, 'dice', FakeDB(companies={'unknown': datetime.utcnow()}))
+    assert not limiter.in_cooldown('Acme')
+
+    limiter.record_company('Unknown')
+    limiter.record_company('')
+    assert not limiter.in_cooldown('Unknown')
+    assert not limiter.in_cooldown('unknown')
+    assert not limiter.in_cooldown(None)
+
+
+def test_cooldown_companies_join_on_platform(tmp_path):
+    db = Database(f"sqlite:///{tmp_path / 'jobs.db'}")
+    db.save_job({'job_id': 'shared-1', 'platform': 'dice', 'title': 'Dev', 'company': 'Acme', 'url': 'u1'})
+    # Same job_id on another platform: not an application to Acme
+    db.save_application({'job_id': 'shared-1', 'platform': 'indeed', 'success': True})
+    assert db.companies_applied_since(datetime.utcnow() - timedelta(hours=1)) == {}
+
+    db.save_application({'job_id': 'shared-1', 'platform': 'dice', 'success': True})
+    assert set(db.companies_applied_since(datetime.utcnow() - timedelta(hours=1))) == {'acme'}
+
+
+def test_cooldown_expires_and_is_reloaded(monkeypatch):
+    db = FakeDB()
+    limiter = RateLimiter({'cooldown_period_hours': 24}, 'dice', db)
+    assert not limiter.in_cooldown('Acme')
+
+    limiter.record_company('Acme')
+    assert limiter.in_cooldown('Acme')
+    # A day later the same long-lived limiter lifts the cooldown
+    limiter.recent_companies['acme'] -= timedelta(hours=25)
+    assert not limiter.in_cooldown('Acme')
+
+    # Applications made by other processes show up after the reload interval
+    db.companies['globex'] = datetime.utcnow()
+    assert not limiter.in_cooldown('Globex')
+    monkeypatch.setattr(rate_limiter, 'COOLDOWN_RELOAD_SECONDS', 0)
+    limiter.companies_loaded -= timedelta(seconds=1)
+    assert limiter.in_cooldown('Globex')
+    assert not limiter.in_cooldown('Acme')
+
+
+def test_limiter_is_shared_by_database_url(tmp_path):
+    url = f"sqlite:///{tmp_path / 'jobs.db'}"
+    first = get_rate_limiter({}, 'dice', Database(url))
+    second_db = Database(url)
+
+    assert get_rate_limiter({}, 'dice', second_db) is first
+    assert first.db is second_db
+    assert get_rate_limiter({}, 'dice', Database(f"sqlite:///{tmp_path / 'other.db'}")) is not first
+
+
+class FakeApplyAdapter(DiceAdapter):
+    def __init__(self, config, db, submits):
+        super().__init__(config, db)
+        self.submits = submits
+
+    def apply_to_job(self, job_url, job_data):
+        # Bail out (no Easy Apply button) unless the job is meant to be submitted
+        if not self.submits:
+            return False
+        return self.acquire_apply_slot()
+
+
+def test_slot_is_taken_only_when_submitting(tmp_path):
+    db = Database(f"sqlite:///{tmp_path / 'jobs.db'}")
+    config = {'platforms': {'dice': {}}, 'safety': {'max_applications_per_day': 1}}
+    job = {'job_id': 'j1', 'url': 'https://example.com/j1', 'company': 'Acme'}
+
+    skipped = FakeApplyAdapter(config, db, submits=False)
+    assert not skipped.apply_and_record(job)
+    assert skipped.rate_limiter.granted == 0
+
+    applied = FakeApplyAdapter(config, db, submits=True)
+    assert applied.apply_and_record(dict(job, job_id='j2'))
+    assert applied.rate_limiter.granted == 1
+
+    # Budget used up: no slot, and no failed application recorded
+    assert not applied.apply_and_record(dict(job, job_id='j3'))
+    assert not db.application_exists('j3', 'dice')
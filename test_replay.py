@@ -0,0 +1,119 @@
+"""
+Tests for recording pages and replaying them from the local fixture server
+"""
+
+import os
+import time
+
+from src.adapters import DiceAdapter
+from src.adapters import runner
+from src.adapters.replay import PageRecorder, ReplayServer, replay_adapter, run_replay
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'dice')
+SEARCH_URL = "https://www.dice.com/jobs?filters.workplaceTypes=Remote&q=python"
+
+
+def record_fixture(directory):
+    with open(os.path.join(FIXTURE_DIR, 'search_results_page_1.html'), 'r', encoding='utf-8') as f:
+        PageRecorder(directory).record(SEARCH_URL, f.read(), 'search_results')
+
+
+def test_recorder_keeps_states_of_the_same_url(tmp_path):
+    """A second label for a URL is stored alongside the first, not over it"""
+    recorder = PageRecorder(str(tmp_path))
+    recorder.record("https://www.dice.com/job-detail/1", "<html>detail</html>", 'job_detail')
+    recorder.record("https://www.dice.com/job-detail/1", "<html>form</html>", 'apply_form')
+
+    assert set(recorder.index) == {'/job-detail/1', '/job-detail/1#apply_form'}
+    assert recorder.index['/job-detail/1']['label'] == 'job_detail'
+
+
+def test_dice_search_replays_against_local_server(tmp_path, monkeypatch):
+    """DICE_BASE_URL points the adapter at the replay server; latency is applied"""
+    record_fixture(str(tmp_path))
+    server = ReplayServer(str(tmp_path), latency_ms=50)
+    base_url = server.start()
+    monkeypatch.setenv('DICE_BASE_URL', base_url)
+    monkeypatch.setenv('DICE_SEARCH_QUERY', 'python')
+
+    adapter = DiceAdapter({'platforms': {'dice': {'search_backend': 'http'}}}, db=None)
+    try:
+        start = time.monotonic()
+        jobs = adapter.search_jobs_on_page(1)
+        assert time.monotonic() - start >= 0.05
+
+        assert len(jobs) == 3
+        assert all(job['url'].startswith(base_url) for job in jobs)
+
+        # Page 2 was never recorded: 404 ends pagination
+        assert adapter.search_jobs_on_page(2) is None
+        assert server.misses == 1
+    finally:
+        adapter.close_driver()
+        server.stop()
+
+
+def test_replay_adapter_accepts_the_recorded_session(monkeypatch):
+    """Only the replay subclass treats a logged-in probe as the session"""
+    monkeypatch.delenv('DICE_EMAIL', raising=False)
+    monkeypatch.delenv('DICE_PASSWORD', raising=False)
+    config = {'platforms': {'dice': {}}}
+
+    adapter = replay_adapter(DiceAdapter)(config, db=None)
+    adapter.probe_logged_in = lambda: True
+    assert adapter.login() and adapter.is_logged_in
+
+    # Without a logged-in page in the recording it does not fall back to credentials
+    adapter = replay_adapter(DiceAdapter)(config, db=None)
+    adapter.probe_logged_in = lambda: False
+    assert not adapter.login()
+
+    # The live adapter's login never consults the probe outside a saved session
+    live = DiceAdapter(config, db=None)
+    live.probe_logged_in = lambda: True
+    assert not live.login()
+
+
+class RecordingRun:
+    runs = []
+    configs = []
+
+    def __init__(self, config, db, **kwargs):
+        self.config = config
+        self.db = db
+
+    def run(self, search_only=False):
+        self.configs.append(self.config)
+        self.runs.append((str(self.db.engine.url), search_only))
+        return {'jobs_found': 0, 'applications_submitted': 0}
+
+
+def test_replay_run_is_search_only_on_a_throwaway_database(tmp_path, monkeypatch):
+    monkeypatch.setitem(runner.ADAPTERS, 'fake', RecordingRun)
+    monkeypatch.delenv('FAKE_BASE_URL', raising=False)
+
+    run_replay(str(tmp_path), platform='fake')
+    run_replay(str(tmp_path), platform='fake', search_only=False, db_url=f"sqlite:///{tmp_path / 'replay.db'}")
+
+    (first_url, first_search_only), second = RecordingRun.runs
+    assert first_search_only
+    assert 'jobider.db' not in first_url and 'replay-' in first_url
+    assert second == (f"sqlite:///{tmp_path / 'replay.db'}", False)
+
+    # Nothing from the replay origin reaches the live selector cache or recordings
+    for config in RecordingRun.configs:
+        assert config['selector_cache']['enabled'] is False
+        assert config['replay']['record'] is False
+        assert config['session']['persist'] is False
+
+
+def test_replay_run_restores_the_base_url(tmp_path, monkeypatch):
+    monkeypatch.setitem(runner.ADAPTERS, 'fake', RecordingRun)
+
+    monkeypatch.delenv('FAKE_BASE_URL', raising=False)
+    run_replay(str(tmp_path), platform='fake')
+    assert 'FAKE_BASE_URL' not in os.environ
+
+    monkeypatch.setenv('FAKE_BASE_URL', 'http://staging.example.com')
+    run_replay(str(tmp_path), platform='fake')
+    assert os.environ['FAKE_BASE_URL'] == 'http://staging.example.com'
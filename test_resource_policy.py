@@ -0,0 +1,92 @@
+"""
+Tests for the per-phase network resource blocking policy
+"""
+
+import json
+
+from src.adapters.resource_policy import TRACKER_PATTERNS, ResourcePolicy
+
+
+def event(method, **params):
+    return {'message': json.dumps({'message': {'method': method, 'params': params}})}
+
+
+class FakeDriver:
+    def __init__(self, log=None):
+        self.commands = []
+        self.log = log or []
+
+    def execute_cdp_cmd(self, command, params):
+        self.commands.append((command, params))
+
+    def get_log(self, kind):
+        entries, self.log = self.log, []
+        return entries
+
+
+def test_prefs_only_cover_types_blocked_in_every_phase():
+    assert ResourcePolicy({'enabled': True}).chrome_prefs() == {}
+
+    policy = ResourcePolicy({'enabled': True, 'profiles': {
+        'search': {'block_types': ['image', 'font']},
+        'apply': {'block_types': ['image']}
+    }})
+    assert policy.chrome_prefs() == {'profile.managed_default_content_settings.images': 2}
+
+
+def test_phase_switch_sets_blocked_urls_once():
+    policy = ResourcePolicy({'enabled': True})
+    driver = FakeDriver()
+
+    policy.apply_phase(driver, 'search')
+    policy.apply_phase(driver, 'search')
+    policy.apply_phase(driver, 'apply')
+
+    blocked = [params['urls'] for command, params in driver.commands if command == 'Network.setBlockedURLs']
+    assert len(blocked) == 2
+    assert '*.css' in blocked[0] and '*.css' not in blocked[1]
+    assert set(TRACKER_PATTERNS) <= set(blocked[1])
+
+
+def test_disabled_policy_never_touches_the_driver():
+    driver = FakeDriver([event('Network.loadingFailed', requestId='1', type='Image', blockedReason='inspector')])
+    policy = ResourcePolicy()
+
+    policy.apply_phase(driver, 'search')
+    policy.collect(driver)
+
+    assert driver.commands == []
+    assert policy.summary()['requests_blocked'] == 0
+
+
+def test_blocked_bytes_are_estimated_from_loaded_sizes():
+    driver = FakeDriver([
+        event('Network.requestWillBeSent', requestId='1', type='Image'),
+        event('Network.loadingFinished', requestId='1', encodedDataLength=1000),
+        event('Network.requestWillBeSent', requestId='2', type='Image'),
+        event('Network.loadingFinished', requestId='2', encodedDataLength=3000),
+        event('Network.loadingFailed', requestId='3', type='Image', blockedReason='inspector'),
+        event('Network.loadingFailed', requestId='4', type='Font', blockedReason='inspector'),
+        event('Network.loadingFailed', requestId='5', type='Script', errorText='net::ERR_FAILED'),
+        {'message': 'not json'},
+    ])
+    policy = ResourcePolicy({'enabled': True})
+
+    policy.collect(driver)
+    summary = policy.summary()
+
+    assert (summary['requests_loaded'], summary['bytes_loaded']) == (2, 4000)
+    assert summary['blocked_by_type'] == {'Image': 1, 'Font': 1}
+    # Image: average of what loaded; Font: the fallback size
+    assert summary['bytes_avoided'] == 2000 + 30000
+
+
+def test_unreadable_performance_log_is_ignored():
+    class NoLogDriver(FakeDriver):
+        def get_log(self, kind):
+            raise RuntimeError("performance logging not enabled")
+
+    policy = ResourcePolicy({'enabled': True})
+    policy.collect(NoLogDriver())
+
+    assert policy.summary()['requests_loaded'] == 0
@@ -0,0 +1,56 @@
+"""
+Tests for the screenshot policy and the background screenshot writer
+"""
+
+import logging
+import os
+
+import pytest
+
+from src.utils.screenshots import ScreenshotPolicy, ScreenshotWriter
+
+LOGGER = logging.getLogger('test.screenshots')
+
+
+def captures(policy, requests):
+    return [policy.should_capture(failure=failure) for failure in requests]
+
+
+def test_policy_modes():
+    requests = [False, False, True, False, False]
+
+    assert captures(ScreenshotPolicy({'mode': 'off'}), requests) == [False] * 5
+    assert captures(ScreenshotPolicy({'mode': 'on_failure'}), requests) == [False, False, True, False, False]
+    assert captures(ScreenshotPolicy({'mode': 'every_n', 'every_n': 2}), requests) == [True, False, True, False, True]
+    assert captures(ScreenshotPolicy(), requests) == [True] * 5
+
+
+def test_invalid_mode_is_rejected():
+    with pytest.raises(ValueError):
+        ScreenshotPolicy({'mode': 'sometimes'})
+
+
+def test_writer_keeps_the_directory_under_its_size_limit(tmp_path):
+    # Room for two 10-byte screenshots
+    writer = ScreenshotWriter(str(tmp_path), LOGGER, {'max_dir_mb': 25 / (1024 * 1024)})
+    writer.start()
+    for name in ('first', 'second', 'third'):
+        writer.submit(name, b'0123456789')
+    writer.close()
+
+    names = sorted(filename.split('_', 3)[-1] for filename in os.listdir(tmp_path))
+    assert names == ['second.png', 'third.png']
+    assert writer.written == 3
+
+
+def test_full_queue_drops_instead_of_blocking(tmp_path):
+    writer = ScreenshotWriter(str(tmp_path), LOGGER, {'queue_size': 1})
+
+    # Not started: the first screenshot fills the queue
+    writer.submit('kept', b'png')
+    writer.submit('dropped', b'png')
+    assert writer.dropped == 1
+
+    writer.start()
+    writer.close()
+    assert [filename.split('_', 3)[-1] for filename in os.listdir(tmp_path)] == ['kept.png']
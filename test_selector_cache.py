@@ -0,0 +1,131 @@
+"""
+Tests for the learned selector order and the multi-locator wait
+"""
+
+from src.adapters.base_adapter import BasePlatformAdapter
+from src.adapters.selector_cache import SelectorCache, get_selector_cache
+from src.adapters.waits import WaitEngine
+
+LOCATORS = [('css selector', 'button.a'), ('xpath', "//button[.='b']"), ('css selector', 'button.c')]
+
+
+def test_unknown_step_keeps_code_order(tmp_path):
+    cache = SelectorCache('dice', {'dir': str(tmp_path)})
+    assert cache.order('submit', LOCATORS) == LOCATORS
+
+
+def test_last_winner_first_then_hit_rate(tmp_path):
+    cache = SelectorCache('dice', {'dir': str(tmp_path)})
+    for _ in range(3):
+        cache.record('submit', LOCATORS[0], hit=False)
+        cache.record('submit', LOCATORS[2], hit=True)
+    cache.record('submit', LOCATORS[1], hit=True)
+
+    assert cache.order('submit', LOCATORS) == [LOCATORS[1], LOCATORS[2], LOCATORS[0]]
+    assert cache.summary()['submit']['css selector=button.a'] == {'hits': 0, 'misses': 3, 'hit_rate': 0.0}
+
+
+def test_stats_persist_across_runs(tmp_path):
+    cache = SelectorCache('dice', {'dir': str(tmp_path)})
+    cache.record('next', LOCATORS[2], hit=True)
+    cache.save()
+
+    reloaded = SelectorCache('dice', {'dir': str(tmp_path)})
+    assert reloaded.order('next', LOCATORS)[0] == LOCATORS[2]
+
+
+class FakeElement:
+    def __init__(self, text):
+        self.text = text
+
+    def is_displayed(self):
+        return True
+
+    def is_enabled(self):
+        return True
+
+
+class FakeDriver:
+    """Only the locator in `present` ever matches, from the third poll on"""
+
+    def __init__(self, present):
+        self.present = present
+        self.polls = 0
+
+    def find_elements(self, by, value):
+        if (by, value) == LOCATORS[0]:
+            self.polls += 1
+        return [FakeElement(value)] if (by, value) == self.present and self.polls >= 3 else []
+
+
+class FakeAdapter:
+    def __init__(self, driver):
+        self.driver = driver
+
+
+def test_any_element_races_locators_in_one_wait():
+    engine = WaitEngine(FakeAdapter(FakeDriver(present=LOCATORS[2])), {'poll_interval': 0.01})
+
+    element, locator = engine.any_element(LOCATORS, clickable=True, ceiling=2)
+
+    assert locator == LOCATORS[2]
+    assert element.text == 'button.c'
+    assert engine.records[0]['elapsed'] < 1
+
+
+def test_any_element_times_out_once_for_all_locators():
+    engine = WaitEngine(FakeAdapter(FakeDriver(present=None)), {'poll_interval': 0.01})
+
+    assert engine.any_element(LOCATORS, ceiling=0.2) is None
+    assert len(engine.records) == 1
+    assert engine.records[0]['elapsed'] < 1
+
+
+GENERIC = [('css selector', "button[type='submit']")]
+
+
+class ElementsDriver:
+    """Locators in `present` match on every poll"""
+
+    def __init__(self, present):
+        self.present = present
+
+    def find_elements(self, by, value):
+        return [FakeElement(value)] if (by, value) in self.present else []
+
+
+class FallbackAdapter:
+    wait_for_any = BasePlatformAdapter.wait_for_any
+    find_with_fallbacks = BasePlatformAdapter.find_with_fallbacks
+
+    def __init__(self, driver, cache):
+        self.driver = driver
+        self.waits = WaitEngine(self, {'poll_interval': 0.01})
+        self.selector_cache = cache
+
+
+def test_last_resort_does_not_race_the_specific_locators(tmp_path):
+    cache = SelectorCache('dice', {'dir': str(tmp_path)})
+    adapter = FallbackAdapter(ElementsDriver([GENERIC[0], LOCATORS[1]]), cache)
+
+    element, locator = adapter.find_with_fallbacks('submit', LOCATORS, timeout=1, last_resort=GENERIC)
+
+    assert locator == LOCATORS[1]
+
+
+def test_last_resort_is_used_after_a_timeout_and_never_cached(tmp_path):
+    cache = SelectorCache('dice', {'dir': str(tmp_path)})
+    adapter = FallbackAdapter(ElementsDriver([GENERIC[0]]), cache)
+
+    element, locator = adapter.find_with_fallbacks('submit', LOCATORS, timeout=0.1, last_resort=GENERIC)
+
+    assert locator == GENERIC[0]
+    assert 'css selector=button[type=\'submit\']' not in cache.summary()['submit']
+
+
+def test_disabled_cache_is_not_shared(tmp_path):
+    shared = get_selector_cache('replay-test', {'dir': str(tmp_path)})
+
+    disabled = get_selector_cache('replay-test', {'enabled': False})
+    assert disabled is not shared and not disabled.enabled
+    assert get_selector_cache('replay-test', {'dir': str(tmp_path)}) is shared
@@ -0,0 +1,112 @@
+"""
+Tests for persisting and restoring the authenticated browser session
+"""
+
+import json
+import threading
+import time
+
+from src.adapters import DiceAdapter
+from src.adapters.session_store import SessionStore
+
+
+class FakeDriver:
+    def __init__(self, cookies=()):
+        self.cookies = list(cookies)
+        self.visited = []
+
+    def get(self, url):
+        self.visited.append(url)
+
+    def get_cookies(self):
+        return list(self.cookies)
+
+    def add_cookie(self, cookie):
+        self.cookies.append(cookie)
+
+
+def store_for(tmp_path, **config):
+    return SessionStore('dice', dict({'persist': True, 'dir': str(tmp_path)}, **config))
+
+
+def test_cookies_round_trip_without_expired_ones(tmp_path):
+    now = time.time()
+    store = store_for(tmp_path)
+    store.save_cookies(FakeDriver([
+        {'name': 'session', 'value': 'abc', 'expiry': now + 3600},
+        {'name': 'old', 'value': 'x', 'expiry': now - 60},
+        {'name': 'tab', 'value': 'y'},
+    ]))
+
+    assert [cookie['name'] for cookie in store_for(tmp_path).load_cookies()] == ['session', 'tab']
+
+
+def test_unusable_sessions_are_ignored(tmp_path):
+    store = store_for(tmp_path, max_age_hours=1)
+    with open(store.cookies_path, 'w') as f:
+        json.dump({'saved_at': time.time() - 7200, 'cookies': [{'name': 'session', 'value': 'abc'}]}, f)
+    assert store.load_cookies() is None
+
+    with open(store.cookies_path, 'w') as f:
+        f.write('{not json')
+    assert store.load_cookies() is None
+
+    store.clear()
+    assert store.load_cookies() is None
+
+
+def test_disabled_store_writes_nothing(tmp_path):
+    store = SessionStore('dice', {'dir': str(tmp_path)})
+    store.save_cookies(FakeDriver([{'name': 'session', 'value': 'abc'}]))
+
+    assert list(tmp_path.iterdir()) == []
+    assert store.chrome_arguments() == []
+
+
+def test_profile_mode_gives_each_worker_its_own_directory(tmp_path):
+    main = store_for(tmp_path, mode='profile').chrome_arguments()
+    worker = SessionStore('dice', {'persist': True, 'mode': 'profile', 'dir': str(tmp_path)}, worker_id=2).chrome_arguments()
+
+    assert main == [f"--user-data-dir={tmp_path / 'dice_profile'}"]
+    assert worker == [f"--user-data-dir={tmp_path / 'dice_profile_2'}"]
+
+
+def test_login_is_skipped_with_a_restored_session(tmp_path, monkeypatch):
+    monkeypatch.delenv('DICE_EMAIL', raising=False)
+    monkeypatch.delenv('DICE_PASSWORD', raising=False)
+    config = {'platforms': {'dice': {}}, 'session': {'persist': True, 'dir': str(tmp_path)}}
+    store_for(tmp_path).save_cookies(FakeDriver([{'name': 'session', 'value': 'abc', 'sameSite': 'Lax'}]))
+
+    adapter = DiceAdapter(config, db=None)
+    adapter.driver = FakeDriver()
+    adapter.probe_logged_in = lambda: True
+    assert adapter.login()
+    assert adapter.driver.cookies == [{'name': 'session', 'value': 'abc'}]
+
+    # An expired server-side session falls through to a credential login (none configured here)
+    adapter = DiceAdapter(config, db=None)
+    adapter.driver = FakeDriver()
+    adapter.probe_logged_in = lambda: False
+    assert not adapter.login()
+
+
+def test_concurrent_saves_do_not_share_a_temp_file(tmp_path):
+    store = store_for(tmp_path)
+    errors = []
+
+    def save(name):
+        try:
+            for _ in range(50):
+                store.save_cookies(FakeDriver([{'name': name, 'value': 'v'}]))
+        except OSError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=save, args=(f"worker-{index}",)) for index in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert len(store.load_cookies()) == 1
+    assert not list(tmp_path.glob('*.tmp'))
@@ -0,0 +1,98 @@
+"""
+Tests for the condition-based wait engine
+"""
+
+from selenium.webdriver.common.by import By
+
+from src.adapters.waits import WaitEngine
+
+
+class ScriptDriver:
+    """Answers execute_script with the next scripted value (the last one repeats)"""
+
+    def __init__(self, *values):
+        self.values = list(values)
+        self.calls = 0
+
+    def execute_script(self, script):
+        self.calls += 1
+        return self.values.pop(0) if len(self.values) > 1 else self.values[0]
+
+
+class FakeElement:
+    def __init__(self, text, displayed=True):
+        self.text = text
+        self.displayed = displayed
+
+    def is_displayed(self):
+        return self.displayed
+
+    def is_enabled(self):
+        return True
+
+
+class ElementsDriver:
+    def __init__(self, elements):
+        self.elements = elements
+
+    def find_elements(self, by, value):
+        return self.elements.get((by, value), [])
+
+
+class FakeAdapter:
+    def __init__(self, driver):
+        self.driver = driver
+
+
+def engine_for(driver, **config):
+    return WaitEngine(FakeAdapter(driver), dict({'poll_interval': 0.01}, **config))
+
+
+def test_dom_ready_returns_once_the_page_is_complete():
+    engine = engine_for(ScriptDriver('loading', 'interactive', 'complete'))
+
+    assert engine.dom_ready(replaces=3)
+    record = engine.records[0]
+    assert record['satisfied'] and record['elapsed'] < 1
+
+    summary = engine.summary()
+    assert summary['fixed_sleep_replaced'] == 3
+    assert summary['time_saved'] > 2
+
+
+def test_timeout_returns_none_and_counts_in_the_summary():
+    engine = engine_for(ScriptDriver('loading'), ceilings={'dom_ready': 0.1})
+
+    assert engine.dom_ready() is None
+    assert engine.records[0]['ceiling'] == 0.1
+    assert engine.summary()['by_condition']['dom_ready']['timeouts'] == 1
+
+
+def test_network_idle_waits_for_resource_count_to_settle():
+    driver = ScriptDriver(['complete', 3], ['complete', 5], ['complete', 5])
+    engine = engine_for(driver, network_quiet_ms=50)
+
+    assert engine.network_idle(ceiling=2)
+    # The count changed on the second poll, so the quiet period restarted there
+    assert driver.calls >= 3
+
+
+def test_any_element_skips_hidden_and_rejected_matches():
+    hidden = (By.CSS_SELECTOR, 'button.hidden')
+    plain = (By.CSS_SELECTOR, 'button.plain')
+    apply_button = (By.CSS_SELECTOR, 'button.apply')
+    engine = engine_for(ElementsDriver({
+        hidden: [FakeElement('Easy apply', displayed=False)],
+        plain: [FakeElement('Save')],
+        apply_button: [FakeElement('Easy apply')],
+    }))
+
+    element, locator = engine.any_element(
+        [hidden, plain, apply_button],
+        clickable=True,
+        accept=lambda element: 'apply' in element.text.lower(),
+        ceiling=1
+    )
+
+    assert locator == apply_button
+    assert element.text == 'Easy apply'
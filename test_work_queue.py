@@ -0,0 +1,218 @@
+"""
+Tests for the durable apply queue and crawl checkpoints
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.adapters import DiceAdapter
+from src.adapters.work_queue import ApplyWorkQueue, ResumableCrawl
+from src.adapters.worker_pool import ApplyWorkerPool
+from src.database import Database, ApplyQueueItem, JobRecord
+
+
+def make_db(tmp_path):
+    return Database(f"sqlite:///{tmp_path / 'jobs.db'}")
+
+
+def make_job(job_id):
+    return JobRecord(job_id=job_id, title='Python Developer', company='Acme Corp',
+                     url=f'https://www.dice.com/job-detail/{job_id}', salary='$100,000 - $150,000')
+
+
+def expire_leases(db):
+    session = db.get_session()
+    try:
+        session.query(ApplyQueueItem).update({'lease_expires': datetime.utcnow() - timedelta(seconds=1)})
+        session.commit()
+    finally:
+        session.close()
+
+
+def test_queue_survives_a_new_run_and_finishes_items(tmp_path):
+    db = make_db(tmp_path)
+    first_run = ApplyWorkQueue(db, 'dice')
+    first_run.append(make_job('dice-1'))
+    first_run.append(make_job('dice-2'))
+    first_run.append(make_job('dice-1'))
+
+    second_run = ApplyWorkQueue(db, 'dice')
+    assert len(second_run) == 2
+
+    job = second_run.popleft()
+    assert (job['job_id'], job.salary_max) == ('dice-1', 150000.0)
+    assert len(second_run) == 1
+
+    second_run.complete(job, success=True)
+    assert db.get_apply_queue_counts('dice') == {'done': 1, 'pending': 1}
+
+
+def test_expired_lease_is_retried_then_failed(tmp_path):
+    db = make_db(tmp_path)
+    queue = ApplyWorkQueue(db, 'dice', {'max_attempts': 2})
+    queue.append(make_job('dice-1'))
+
+    assert queue.popleft()['job_id'] == 'dice-1'
+    assert not queue
+
+    # The run holding the lease died
+    expire_leases(db)
+    assert queue.popleft()['job_id'] == 'dice-1'
+
+    expire_leases(db)
+    assert not db.lease_application('dice', 'other:1', 600, max_attempts=2)
+    assert db.get_apply_queue_counts('dice') == {'failed': 1}
+
+
+def test_already_applied_items_are_not_handed_out(tmp_path):
+    db = make_db(tmp_path)
+    queue = ApplyWorkQueue(db, 'dice')
+    queue.append(make_job('dice-1'))
+    db.save_application({'job_id': 'dice-1', 'platform': 'dice', 'success': True})
+
+    with pytest.raises(IndexError):
+        queue.popleft()
+    assert db.get_apply_queue_counts('dice') == {'done': 1}
+
+
+def test_checkpoint_resumes_until_the_crawl_finishes(tmp_path):
+    db = make_db(tmp_path)
+    crawl = ResumableCrawl(db, 'dice', '/jobs?q=python')
+    assert crawl.start_page() == 1
+
+    crawl.page_done(16)
+    assert ResumableCrawl(db, 'dice', '/jobs?q=python').start_page() == 17
+    assert ResumableCrawl(db, 'dice', '/jobs?q=go').start_page() == 1
+
+    crawl.finish()
+    assert ResumableCrawl(db, 'dice', '/jobs?q=python').start_page() == 1
+
+
+def test_stale_checkpoint_is_ignored(tmp_path):
+    db = make_db(tmp_path)
+    ResumableCrawl(db, 'dice', '/jobs?q=python').page_done(5)
+
+    assert ResumableCrawl(db, 'dice', '/jobs?q=python', {'checkpoint_max_age_hours': 0}).start_page() == 1
+
+
+class FakeWorker:
+    def __init__(self, applied):
+        self.applied = applied
+
+    def init_driver(self):
+        pass
+
+    def login(self):
+        return True
+
+    def apply_and_record(self, job):
+        self.applied.append(job['job_id'])
+        return True
+
+    def is_driver_alive(self):
+        return True
+
+    def close_driver(self):
+        pass
+
+
+class FakeAdapter:
+    platform_name = 'dice'
+
+    def __init__(self):
+        self.applied = []
+
+    def spawn_worker(self, worker_id):
+        return FakeWorker(self.applied)
+
+
+def test_pooled_jobs_survive_a_crash_after_the_checkpoint(tmp_path):
+    db = make_db(tmp_path)
+    crawl = ResumableCrawl(db, 'dice', '/jobs?q=python')
+
+    # Page 1's jobs are handed to the pool, the cursor moves on, then the
+    # process dies before any worker has taken them
+    pool = ApplyWorkerPool(FakeAdapter(), 2, work_queue=ApplyWorkQueue(db, 'dice'))
+    pool.submit(make_job('dice-1'))
+    pool.submit(make_job('dice-2'))
+    crawl.page_done(1)
+    del pool
+
+    assert ResumableCrawl(db, 'dice', '/jobs?q=python').start_page() == 2
+
+    adapter = FakeAdapter()
+    pool = ApplyWorkerPool(adapter, 2, work_queue=ApplyWorkQueue(db, 'dice'))
+    pool.start()
+    assert pool.resubmit_queued() == 2
+    assert pool.close()['applied'] == 2
+
+    assert sorted(adapter.applied) == ['dice-1', 'dice-2']
+    assert db.get_apply_queue_counts('dice') == {'done': 2}
+
+
+def test_skipped_jobs_stay_queued_for_a_later_run(tmp_path):
+    db = make_db(tmp_path)
+    adapter = DiceAdapter({'platforms': {'dice': {}}}, db)
+    adapter.driver = object()
+    # dice-1's company is in its cooldown: skipped without trying
+    adapter.apply_and_record = lambda job: None if job['job_id'] == 'dice-1' else True
+
+    queue = ApplyWorkQueue(db, 'dice', {'max_attempts': 1})
+    queue.append(make_job('dice-1'))
+    queue.append(make_job('dice-2'))
+    assert adapter.apply_deferred(queue, wait=True) == 1
+
+    counts = db.get_apply_queue_counts('dice')
+    assert counts == {'pending': 1, 'done': 1}
+    # The skip did not use up its only attempt
+    assert ApplyWorkQueue(db, 'dice', {'max_attempts': 1}).popleft()['job_id'] == 'dice-1'
+
+
+def test_pool_releases_skipped_jobs(tmp_path):
+    db = make_db(tmp_path)
+
+    class SkippingWorker(FakeWorker):
+        def apply_and_record(self, job):
+            return None
+
+    class SkippingAdapter(FakeAdapter):
+        def spawn_worker(self, worker_id):
+            return SkippingWorker(self.applied)
+
+    pool = ApplyWorkerPool(SkippingAdapter(), 1, work_queue=ApplyWorkQueue(db, 'dice'))
+    pool.start()
+    pool.submit(make_job('dice-1'))
+    stats = pool.close()
+
+    assert (stats['skipped'], stats['failed']) == (1, 0)
+    assert db.get_apply_queue_counts('dice') == {'pending': 1}
+
+
+def test_pool_releases_jobs_it_has_no_budget_for(tmp_path):
+    db = make_db(tmp_path)
+    work_queue = ApplyWorkQueue(db, 'dice')
+    work_queue.append(make_job('dice-1'))
+    work_queue.append(make_job('dice-2'))
+
+    adapter = FakeAdapter()
+    pool = ApplyWorkerPool(adapter, 1, max_applications=1, work_queue=work_queue)
+    assert pool.resubmit_queued() == 2
+    pool.start()
+    stats = pool.close()
+
+    assert (stats['applied'], stats['skipped']) == (1, 1)
+    # Back to pending right away, not leased until the lease expires
+    assert db.get_apply_queue_counts('dice') == {'done': 1, 'pending': 1}
+
+
+def test_discarded_pool_jobs_are_released(tmp_path):
+    db = make_db(tmp_path)
+    work_queue = ApplyWorkQueue(db, 'dice')
+    work_queue.append(make_job('dice-1'))
+
+    pool = ApplyWorkerPool(FakeAdapter(), 1, work_queue=work_queue)
+    assert pool.resubmit_queued() == 1
+    assert pool.close(wait=False)['skipped'] == 1
+
+    assert ApplyWorkQueue(db, 'dice').popleft()['job_id'] == 'dice-1'
@@ -0,0 +1,106 @@
+"""
+Tests for the parallel apply worker pool
+"""
+
+import threading
+
+from src.adapters.worker_pool import ApplyWorkerPool
+
+
+class FakeWorker:
+    """Worker adapter that records applications; apply_outcomes[job_id] = (success, browser_alive)"""
+
+    def __init__(self, adapter, worker_id):
+        self.adapter = adapter
+        self.worker_id = worker_id
+        self.alive = True
+
+    def init_driver(self):
+        pass
+
+    def login(self):
+        return self.adapter.login_ok
+
+    def apply_and_record(self, job):
+        success, self.alive = self.adapter.apply_outcomes.get(job['job_id'], (True, True))
+        with self.adapter.lock:
+            self.adapter.applied.append((self.worker_id, job['job_id']))
+        return success
+
+    def is_driver_alive(self):
+        return self.alive
+
+    def close_driver(self):
+        with self.adapter.lock:
+            self.adapter.closed += 1
+
+
+class FakeAdapter:
+    platform_name = 'fake'
+
+    def __init__(self, login_ok=True, apply_outcomes=None):
+        self.login_ok = login_ok
+        self.apply_outcomes = apply_outcomes or {}
+        self.lock = threading.Lock()
+        self.applied = []
+        self.spawned = []
+        self.closed = 0
+
+    def spawn_worker(self, worker_id):
+        self.spawned.append(worker_id)
+        return FakeWorker(self, worker_id)
+
+
+def test_pool_applies_queued_jobs_within_budget():
+    adapter = FakeAdapter()
+    pool = ApplyWorkerPool(adapter, 3, max_applications=4)
+    pool.start()
+    for n in range(6):
+        pool.submit({'job_id': f'job-{n}'})
+
+    stats = pool.close()
+
+    assert (stats['submitted'], stats['applied'], stats['skipped']) == (6, 4, 2)
+    assert stats['workers_started'] == 3
+    assert pool.budget_exhausted()
+    # Every worker browser is closed on shutdown
+    assert adapter.closed == 3
+
+
+def test_workers_that_cannot_log_in_skip_the_queue():
+    pool = ApplyWorkerPool(FakeAdapter(login_ok=False), 2)
+    pool.start()
+    pool.submit({'job_id': 'job-1'})
+
+    stats = pool.close()
+
+    assert stats['workers_started'] == 0
+    assert stats['worker_errors'] == {1: "login failed", 2: "login failed"}
+    assert (stats['applied'], stats['skipped']) == (0, 1)
+
+
+def test_crashed_browser_is_replaced():
+    adapter = FakeAdapter(apply_outcomes={'job-1': (False, False)})
+    pool = ApplyWorkerPool(adapter, 1)
+    pool.start()
+    pool.submit({'job_id': 'job-1'})
+    pool.submit({'job_id': 'job-2'})
+
+    stats = pool.close()
+
+    assert (stats['applied'], stats['failed']) == (1, 1)
+    assert adapter.spawned == [1, 1]
+    assert [job_id for _, job_id in adapter.applied] == ['job-1', 'job-2']
+
+
+def test_job_is_submitted_once():
+    adapter = FakeAdapter()
+    pool = ApplyWorkerPool(adapter, 2)
+    pool.start()
+
+    assert pool.submit({'job_id': 'job-1'})
+    assert not pool.submit({'job_id': 'job-1'})
+    stats = pool.close()
+
+    assert (stats['submitted'], stats['applied']) == (1, 1)
+    assert [job_id for _, job_id in adapter.applied] == ['job-1']